@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+import time
+import tracemalloc
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.determinism.canonical_json import (  # noqa: E402
+    dumps_canonical_with_sha256,
+    sha256_canonical,
+)
+
+TEXT_VARIANTS = {
+    "ascii": "Rotation of API_KEYS completed before deployment.",
+    "nfc": "Rotation des cl\u00e9s termin\u00e9e avant le d\u00e9ploiement.",
+    "decomposed": "Rotation des cle\u0301s termine\u0301e avant le de\u0301ploiement.",
+}
+
+
+def _legacy_normalize(value):
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, list):
+        return [_legacy_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            _legacy_normalize(key): _legacy_normalize(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, tuple):
+        return [_legacy_normalize(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("canonical JSON does not allow NaN or Infinity")
+    return value
+
+
+def _legacy_dumps_with_sha256(obj) -> tuple[bytes, str]:
+    data = json.dumps(
+        _legacy_normalize(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _payload(rows: int, text: str) -> dict:
+    return {
+        "version": "1.0",
+        "events": [
+            {
+                "event_id": f"event:{index:08d}",
+                "action": text,
+                "time": {"kind": "date", "value": "2026-03-01"},
+                "objects": [f"entity:{index % 97:04d}", f"entity:{index % 89:04d}"],
+                "score": index / 7,
+                "evidence": [
+                    {
+                        "source_id": f"doc:{index % 13}",
+                        "chunk_id": f"chunk:{index}",
+                        "offset_start": index,
+                        "offset_end": index + len(text),
+                    }
+                ],
+            }
+            for index in range(rows)
+        ],
+    }
+
+
+def _measure(func, payload, repeat: int) -> tuple[float, int, object]:
+    result = None
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(payload)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'text':<11}{'impl':<12}{'bytes':>12}{'best_s':>10}{'MB/s':>9}"
+        f"{'peak_MB':>10}"
+    )
+    for variant, text in TEXT_VARIANTS.items():
+        payload = _payload(args.rows, text)
+        legacy_s, legacy_peak, (legacy_bytes, legacy_sha) = _measure(
+            _legacy_dumps_with_sha256, payload, args.repeat
+        )
+        single_s, single_peak, (single_bytes, single_sha) = _measure(
+            dumps_canonical_with_sha256, payload, args.repeat
+        )
+        stream_s, stream_peak, stream_sha = _measure(
+            sha256_canonical, payload, args.repeat
+        )
+        if single_bytes != legacy_bytes or single_sha != legacy_sha:
+            print(f"MISMATCH: dumps_canonical differs for {variant}")
+            return 1
+        if stream_sha != legacy_sha:
+            print(f"MISMATCH: sha256_canonical differs for {variant}")
+            return 1
+
+        size = len(legacy_bytes)
+        for name, seconds, peak in (
+            ("legacy", legacy_s, legacy_peak),
+            ("dumps", single_s, single_peak),
+            ("stream", stream_s, stream_peak),
+        ):
+            print(
+                f"{variant:<11}{name:<12}{size:>12}{seconds:>10.4f}"
+                f"{size / seconds / 1e6:>9.1f}{peak / 1e6:>10.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
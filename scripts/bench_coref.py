@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.extraction import (  # noqa: E402
+    SpanIndex,
+    extract_entities,
+    resolve_references,
+    segment,
+)
+from domains.biblical_text.extractors import (  # noqa: E402
+    PRONOUNS,
+    BiblicalTextExtractors,
+    _entity_meta,
+    _entity_patterns,
+)
+
+DATASET = ROOT / "data" / "scripture" / "esv_sample"
+
+
+def _legacy_resolve_references(
+    segments, entities, pronoun_map, lookback_sentences=2, span_index=None
+):
+    # resolve_references before MentionWindow: every pronoun filters and sorts
+    # every candidate mention in the text.
+    span_index = span_index or SpanIndex(segments)
+    candidate_mentions = []
+    for ent in entities:
+        sent_id = span_index.sentence_at(ent["token_span"][0])
+        candidate_mentions.append(
+            {
+                "label": ent["label"],
+                "gender": ent.get("gender"),
+                "number": ent.get("number"),
+                "sentence_id": sent_id,
+                "token_start": ent["token_span"][0],
+                "role": "subject",
+            }
+        )
+
+    coref_links = []
+    unknown_state = {"M": 0, "F": 0, "N": 0, "P": 0}
+    pronoun_pattern = re.compile(
+        r"\b(he|she|they|him|her|them|his|their|it|its)\b", re.IGNORECASE
+    )
+    for seg in segments:
+        for match in pronoun_pattern.finditer(seg["text"]):
+            pronoun = match.group(1)
+            start = seg["token_start"] + match.start()
+            end = seg["token_start"] + match.end()
+            gender, number = pronoun_map.get(pronoun.lower(), ("N", "S"))
+            lookback = [
+                c
+                for c in candidate_mentions
+                if 0 <= seg["sentence_id"] - c["sentence_id"] <= lookback_sentences
+            ]
+            filtered = []
+            for c in lookback:
+                if gender in {"M", "F"} and c.get("gender") and c["gender"] != gender:
+                    continue
+                if number == "P" and c.get("number") and c["number"] != "P":
+                    continue
+                filtered.append(c)
+            if not filtered:
+                unknown_state[gender] += 1
+                unknown_id = f"unknown_{gender}_{unknown_state[gender]}"
+                coref_links.append(
+                    {
+                        "from": {
+                            "token_span": [start, end],
+                            "surface_pronoun": pronoun,
+                        },
+                        "to": unknown_id,
+                        "rule": "lookback_limit",
+                        "evidence": f"no match within lookback for {pronoun}",
+                    }
+                )
+                continue
+            filtered.sort(
+                key=lambda c: (seg["sentence_id"] - c["sentence_id"], -c["token_start"])
+            )
+            chosen = filtered[0]
+            rule = "recency"
+            coref_links.append(
+                {
+                    "from": {"token_span": [start, end], "surface_pronoun": pronoun},
+                    "to": chosen["label"],
+                    "rule": rule,
+                    "evidence": f"resolved {pronoun} to {chosen['label']} by {rule}",
+                }
+            )
+    for idx, link in enumerate(coref_links):
+        link["id"] = f"coref_{idx}"
+    return coref_links
+
+
+def build_text(scale: int) -> str:
+    manifest = json.loads((DATASET / "manifest.json").read_text(encoding="utf-8"))
+    passages = [
+        (DATASET / entry["file"]).read_text(encoding="utf-8")
+        for entry in manifest.values()
+    ]
+    extractor = BiblicalTextExtractors()
+    return extractor.normalize_input("\n\n".join(passages * scale))
+
+
+def build_entities(text: str, segments) -> list[dict]:
+    meta = _entity_meta()
+    entities = extract_entities(text, segments, _entity_patterns())
+    for entity in entities:
+        entity["gender"] = meta.get(entity["label"], {}).get("gender")
+        entity["number"] = meta.get(entity["label"], {}).get("number")
+    return entities
+
+
+def _best(func, repeat: int) -> tuple[float, object]:
+    result = None
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    text = build_text(args.scale)
+    segments, _, sentence_spans = segment(text)
+    span_index = SpanIndex(segments)
+    entities = build_entities(text, segments)
+
+    legacy_seconds, legacy_links = _best(
+        lambda: _legacy_resolve_references(
+            segments, entities, PRONOUNS, span_index=span_index
+        ),
+        args.repeat,
+    )
+    window_seconds, window_links = _best(
+        lambda: resolve_references(segments, entities, PRONOUNS, span_index=span_index),
+        args.repeat,
+    )
+    if window_links != legacy_links:
+        print("MISMATCH: resolve_references differs from legacy")
+        return 1
+    extract_seconds, _ = _best(
+        lambda: BiblicalTextExtractors().extract(text, {}), args.repeat
+    )
+
+    print(
+        f"scale={args.scale} bytes={len(text)} sentences={len(sentence_spans)} "
+        f"mentions={len(entities)} links={len(window_links)}"
+    )
+    print(f"{'impl':>10}{'best_s':>10}{'links/s':>12}")
+    for name, seconds in (("legacy", legacy_seconds), ("window", window_seconds)):
+        print(f"{name:>10}{seconds:>10.4f}{len(window_links) / seconds:>12.0f}")
+    print(f"biblical extract: {extract_seconds:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
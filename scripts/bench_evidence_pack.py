@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from proposal.evidence_pack import build_evidence_pack  # noqa: E402
+
+WORDS = ["ledger", "attestation", "merkle", "Café", "verify", "seal", "chunk", "root"]
+
+
+def write_corpus(folder: Path, files: int, file_bytes: int, seed: int = 22) -> None:
+    rng = random.Random(seed)
+    for index in range(files):
+        path = folder / f"part{index % 50:02d}" / f"doc{index:06d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        words = []
+        size = 0
+        while size < file_bytes:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        path.write_text(f"# Doc {index}\r\n" + " ".join(words), encoding="utf-8")
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--file-bytes", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "corpus"
+        write_corpus(folder, args.files, args.file_bytes)
+        cache_path = Path(tmp) / "pack_cache.sqlite3"
+
+        def build(**options):
+            return build_evidence_pack(str(folder), root_hint="bench", **options)[1]
+
+        rows = [("cold serial", *_timed(build))]
+        reference = rows[0][2]
+        rows.append(("cold parallel", *_timed(lambda: build(workers=args.workers))))
+        rows.append(
+            (
+                "cold cached",
+                *_timed(lambda: build(workers=args.workers, cache_path=cache_path)),
+            )
+        )
+        rows.append(("warm cache", *_timed(lambda: build(cache_path=cache_path))))
+        changed = folder / "part07" / "doc000007.md"
+        changed.write_text(changed.read_text(encoding="utf-8") + " edited", "utf-8")
+        rows.append(("one file edited", *_timed(lambda: build(cache_path=cache_path))))
+        edited_reference = build()
+
+        for name, _, pack_bytes in rows:
+            expected = reference if name != "one file edited" else edited_reference
+            if pack_bytes != expected:
+                print(f"MISMATCH: {name} pack bytes differ from a cold serial build")
+                return 1
+
+    print(f"files={args.files} bytes={len(reference)} workers={args.workers}")
+    print(f"{'build':>16}{'seconds':>10}")
+    for name, seconds, _ in rows:
+        print(f"{name:>16}{seconds:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
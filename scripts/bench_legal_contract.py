@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from domains.legal_contract.extractor import (  # noqa: E402
+    DEFINED_TERM_PATTERNS,
+    OBLIGATION_PATTERN,
+    PARTY_LINE_PATTERN,
+    ROLE_NAMES,
+    ROLE_PAIR_PATTERN,
+    SENTENCE_PATTERN,
+    TERMINATION_PATTERN,
+    ContractIndex,
+    LegalContractExtractors,
+    _clean_clause,
+    _clean_party_name,
+    _ordered_term_map,
+)
+
+SAMPLE = ROOT / "data" / "legal_contract_sample" / "sample_contract.txt"
+PAGE_BYTES = 3_000
+
+
+class _LegacyExtractors(LegalContractExtractors):
+    # The sub-extractors before ContractIndex: each one rescans the full text.
+
+    def extract(self, normalized_text: str, context: dict):
+        index = ContractIndex(normalized_text)
+        text = normalized_text
+        parties, aliases = _legacy_parties(text)
+        effective_date = self._extract_effective_date(index)
+        term = self._extract_term(index, effective_date)
+        obligations = _legacy_obligations(text, parties, aliases)
+        defined_terms = _legacy_defined_terms(text)
+        governing_law = self._extract_governing_law(index)
+        termination_conditions = _legacy_termination_conditions(text)
+        return {
+            "parties": parties,
+            "effective_date": effective_date,
+            "term": term,
+            "obligations": obligations,
+            "defined_terms": defined_terms,
+            "governing_law": governing_law,
+            "termination_conditions": termination_conditions,
+            "extraction_warnings": self._warnings_for(
+                parties=parties,
+                effective_date=effective_date,
+                term=term,
+                obligations=obligations,
+                defined_terms=defined_terms,
+                governing_law=governing_law,
+                termination_conditions=termination_conditions,
+            ),
+        }
+
+
+def _legacy_parties(text: str) -> tuple[list[dict], dict[str, str]]:
+    role_map: dict[str, str] = {}
+    for match in ROLE_PAIR_PATTERN.finditer(text):
+        role_map[_clean_clause(match.group("left"))] = match.group("left_role").lower()
+        role_map[_clean_clause(match.group("right"))] = match.group(
+            "right_role"
+        ).lower()
+
+    parties: list[dict] = []
+    aliases: dict[str, str] = {}
+    seen_names: set[str] = set()
+    for match in PARTY_LINE_PATTERN.finditer(text):
+        name = _clean_party_name(match.group("name"))
+        if name in seen_names:
+            continue
+        labels = re.findall(r'"([^"]+)"', match.group("labels"))
+        role = None
+        for label in labels:
+            aliases[label] = name
+            if label.lower() in ROLE_NAMES:
+                role = label.lower()
+        role = role or role_map.get(name)
+        if role:
+            parties.append({"name": name, "role": role})
+            seen_names.add(name)
+
+    parties.sort(key=lambda item: item["name"])
+    return parties, aliases
+
+
+def _legacy_obligations(
+    text: str, parties: list[dict], aliases: dict[str, str]
+) -> list[dict]:
+    known_subjects = [(party["name"], party["name"]) for party in parties]
+    for alias, canonical in aliases.items():
+        known_subjects.append((alias, canonical))
+    for party in parties:
+        known_subjects.append((party["role"].title(), party["name"]))
+
+    obligations: list[dict] = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = _clean_clause(match.group(0))
+        if not OBLIGATION_PATTERN.search(sentence):
+            continue
+        subject_hits = []
+        for subject, canonical in known_subjects:
+            subject_match = re.search(rf"\b{re.escape(subject)}\b", sentence)
+            if subject_match:
+                subject_hits.append((subject_match.start(), canonical))
+        party_name = None
+        if subject_hits:
+            party_name = sorted(subject_hits, key=lambda item: item[0])[0][1]
+        if not party_name:
+            continue
+        obligations.append(
+            {"party": party_name, "text": sentence, "offset": match.start()}
+        )
+    obligations.sort(key=lambda item: item["offset"])
+    return obligations
+
+
+def _legacy_defined_terms(text: str):
+    terms: dict[str, str] = {}
+    for pattern in DEFINED_TERM_PATTERNS:
+        for match in pattern.finditer(text):
+            term = _clean_clause(match.group("term"))
+            definition = _clean_clause(match.group("definition")).rstrip(",")
+            if term not in terms:
+                terms[term] = definition
+    return _ordered_term_map(terms)
+
+
+def _legacy_termination_conditions(text: str) -> list[str]:
+    clauses = []
+    for match in TERMINATION_PATTERN.finditer(text):
+        clause = _clean_clause(match.group("clause"))
+        if clause.lower().startswith("the term of this agreement"):
+            continue
+        if clause not in clauses:
+            clauses.append(clause)
+    return clauses
+
+
+def build_contract(pages: int) -> str:
+    # The sample's preamble followed by its numbered sections, renumbered and
+    # repeated until the text reaches about PAGE_BYTES per page.
+    blocks = SAMPLE.read_text(encoding="utf-8").strip().split("\n\n")
+    preamble, sections = blocks[0], blocks[1:]
+    parts = [preamble]
+    total = len(preamble)
+    number = 0
+    while total < pages * PAGE_BYTES:
+        body = re.sub(r"^\d+\. ", "", sections[number % len(sections)])
+        if number:
+            body = body.replace('"Software"', f'"Software {number}"')
+        block = f"{number + 1}. {body}"
+        parts.append(block)
+        total += len(block) + 2
+        number += 1
+    return "\n\n".join(parts)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 20, 200])
+    parser.add_argument("--legacy-max-pages", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    extractor = LegalContractExtractors()
+    for pages in args.pages:
+        text = extractor.normalize_input(build_contract(pages))
+        started = time.perf_counter()
+        result, timings = extractor.extract_timed(text, {})
+        seconds = time.perf_counter() - started
+        line = f"pages={pages} bytes={len(text)} indexed={seconds:.3f}s"
+        if pages <= args.legacy_max_pages:
+            started = time.perf_counter()
+            legacy = _LegacyExtractors().extract(text, {})
+            legacy_seconds = time.perf_counter() - started
+            if legacy != result:
+                print(f"MISMATCH: extraction differs from legacy at {pages} pages")
+                return 1
+            line += f" legacy={legacy_seconds:.3f}s"
+            line += f" speedup={legacy_seconds / seconds:.1f}x"
+        print(line)
+        for name, elapsed in timings.items():
+            print(f"  {name:<24}{elapsed:>10.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
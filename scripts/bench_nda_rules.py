@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from iota_verbum_api.domains.nda.rules import RULE_SETS  # noqa: E402
+from iota_verbum_api.utils import normalize_text  # noqa: E402
+
+FIXTURES = ROOT / "tests" / "fixtures"
+ENGLISH_NDA = (
+    "Mutual Non-Disclosure Agreement\n\n"
+    "This agreement is made between Alpha Consulting Ltd and Beta Industries "
+    "Inc. Confidential Information means any business, technical or legal "
+    "information disclosed by either party, including trade secrets and "
+    "customer lists.\n\n"
+    "The receiving party shall keep all confidential material secret and "
+    "agrees to use it only to evaluate the proposed project. The term of this "
+    "agreement is thirty-six months from the date of signature.\n\n"
+    "The obligations above are subject to the following exception: "
+    "information that is already public. On request the receiving party "
+    "shall return or destroy all documents.\n\n"
+    "This agreement is governed by the laws of England and Wales. The courts "
+    "of London have exclusive jurisdiction over any dispute."
+)
+FILLER = {
+    "en": "The parties met again to review the schedule of deliverables.",
+    "fr": "Les parties se sont reunies pour examiner le calendrier des livrables.",
+    "de": "Die Parteien trafen sich erneut, um den Zeitplan zu besprechen.",
+    "es": "Las partes se reunieron de nuevo para revisar el calendario.",
+}
+
+
+def _legacy_extract(rule_set, text: str) -> dict:
+    # LanguageRuleSet.extract before the one-pass sweep: every rule re-splits
+    # and re-lowercases the whole document.
+    normalized = normalize_text(text)
+    clauses = []
+    for rule in rule_set.rules:
+        sentence = None
+        for piece in re.split(r"(?<=[.!?])\s+|\n\n+", normalized):
+            candidate = piece.strip()
+            lowered = candidate.lower()
+            if all(re.search(pattern, lowered) for pattern in rule.patterns):
+                sentence = candidate
+                break
+        if not sentence:
+            continue
+        clauses.append(
+            {
+                "clause_type": rule.clause_type,
+                "clause_type_en": rule.clause_type_en,
+                "extracted_text": sentence,
+                "confidence": 0.99,
+                "extraction_method": "symbolic",
+                "rule_id": rule.rule_id,
+            }
+        )
+    return {
+        "domain": rule_set.domain,
+        "schema_version": "1.0",
+        "extraction": {
+            "clauses": clauses,
+            "language": rule_set.language,
+            "rule_set_version": rule_set.version,
+        },
+    }
+
+
+def sample_text(language: str) -> str:
+    if language == "en":
+        return ENGLISH_NDA
+    return (FIXTURES / f"nda_{language}.txt").read_text(encoding="utf-8")
+
+
+def build_document(language: str, filler_sentences: int) -> str:
+    # Filler first, so every clause sits past filler_sentences sentences.
+    filler = " ".join([FILLER[language]] * filler_sentences)
+    return f"{filler}\n\n{sample_text(language)}" if filler else sample_text(language)
+
+
+def _best(func, text: str, repeat: int, number: int) -> tuple[float, dict]:
+    result = None
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            result = func(text)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filler", type=int, nargs="+", default=[0, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'lang':>5}{'filler':>8}{'bytes':>9}{'impl':>9}{'doc_ms':>10}"
+        f"{'rules/s':>12}"
+    )
+    for language, rule_set in RULE_SETS.items():
+        for filler in args.filler:
+            text = build_document(language, filler)
+            rows = [
+                (
+                    "legacy",
+                    *_best(
+                        lambda value: _legacy_extract(rule_set, value),
+                        text,
+                        args.repeat,
+                        args.number,
+                    ),
+                ),
+                ("sweep", *_best(rule_set.extract, text, args.repeat, args.number)),
+            ]
+            if rows[0][2] != rows[1][2]:
+                print(f"MISMATCH: {language} extract differs from legacy")
+                return 1
+            for name, seconds, _ in rows:
+                print(
+                    f"{language:>5}{filler:>8}{len(text):>9}{name:>9}"
+                    f"{seconds * 1000:>10.3f}{len(rule_set.rules) / seconds:>12.0f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
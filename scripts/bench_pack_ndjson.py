@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from proposal.bundle_from_pack import load_pack, select_chunks  # noqa: E402
+from proposal.evidence_pack import build_evidence_pack  # noqa: E402
+from proposal.pack_index import PackIndex  # noqa: E402
+from proposal.pack_ndjson import NdjsonPack, dumps_ndjson_pack  # noqa: E402
+
+WORDS = ["ledger", "attestation", "merkle", "Café", "verify", "seal", "chunk", "root"]
+
+
+def write_corpus(folder: Path, files: int, file_bytes: int, seed: int = 22) -> None:
+    rng = random.Random(seed)
+    for index in range(files):
+        path = folder / f"part{index % 50:02d}" / f"doc{index:06d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        words = []
+        size = 0
+        while size < file_bytes:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        path.write_text(f"# Doc {index}\r\n" + " ".join(words), encoding="utf-8")
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--file-bytes", type=int, default=8000)
+    parser.add_argument("--max-chars", type=int, default=400)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "corpus"
+        write_corpus(folder, args.files, args.file_bytes)
+        pack_obj, pack_bytes = build_evidence_pack(
+            str(folder), root_hint="bench", max_chars=args.max_chars, overlap_chars=40
+        )
+        json_path = Path(tmp) / "evidence_pack.json"
+        ndjson_path = Path(tmp) / "evidence_pack.ndjson"
+        json_path.write_bytes(pack_bytes)
+        ndjson_path.write_bytes(dumps_ndjson_pack(pack_obj))
+        wanted = pack_obj["chunks"][len(pack_obj["chunks"]) // 2]
+        index = PackIndex.build(pack_obj)
+
+        def json_chunk():
+            pack = load_pack(str(json_path))
+            return [c for c in pack["chunks"] if c["chunk_id"] == wanted["chunk_id"]]
+
+        def ndjson_chunk():
+            with NdjsonPack(ndjson_path) as pack:
+                return pack.chunks_by_id(wanted["chunk_id"])
+
+        def select(path):
+            pack = load_pack(str(path))
+            return select_chunks(
+                pack, mode="keyword", query="ledger merkle", max_chunks=20, index=index
+            )
+
+        def streamed_sha256():
+            with NdjsonPack(ndjson_path) as pack:
+                return pack.compute_pack_sha256()
+
+        def streamed_json():
+            buffer = io.BytesIO()
+            with NdjsonPack(ndjson_path) as pack:
+                pack.write_json(buffer)
+            return buffer.getvalue()
+
+        rows = []
+        for name, left, right in (
+            ("chunk by id", json_chunk, ndjson_chunk),
+            ("indexed keyword", lambda: select(json_path), lambda: select(ndjson_path)),
+        ):
+            json_seconds, expected = _timed(left)
+            ndjson_seconds, actual = _timed(right)
+            if actual != expected:
+                print(f"MISMATCH: {name} differs between the JSON and NDJSON packs")
+                return 1
+            rows.append((name, json_seconds, ndjson_seconds))
+        seconds, streamed = _timed(streamed_sha256)
+        if streamed != pack_obj["pack_sha256"]:
+            print("MISMATCH: streamed pack_sha256 differs from the sealed pack")
+            return 1
+        rows.append(("pack_sha256", None, seconds))
+        seconds, converted = _timed(streamed_json)
+        if converted != pack_bytes:
+            print("MISMATCH: NDJSON -> JSON bytes differ from build_evidence_pack")
+            return 1
+        rows.append(("ndjson -> json", None, seconds))
+
+    print(f"chunks={len(pack_obj['chunks'])} bytes={len(pack_bytes)}")
+    print(f"{'operation':>16}{'json_s':>10}{'ndjson_s':>10}")
+    for name, json_seconds, ndjson_seconds in rows:
+        json_text = "-" if json_seconds is None else f"{json_seconds:.3f}"
+        print(f"{name:>16}{json_text:>10}{ndjson_seconds:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.determinism.hashing import sha256_text  # noqa: E402
+from core.determinism.schema_validate import validation_policy  # noqa: E402
+from proposal.bundle_from_pack import select_chunks  # noqa: E402
+from proposal.pack_index import PackIndex  # noqa: E402
+
+QUERIES = [
+    ("keyword", "ledger attestation"),
+    ("keyword", "verif"),
+    ("topk", "merkle ledger"),
+    ("topk", "seal-check"),
+    ("bm25", "merkle ledger attestation"),
+    ("bm25", "word17 word3"),
+]
+COMMON = [
+    "the",
+    "ledger",
+    "attestation",
+    "merkle",
+    "verification",
+    "seal-check",
+    "Café",
+    "and",
+]
+
+
+def build_pack(chunks: int, docs: int = 200, seed: int = 21) -> dict:
+    # Chunks of 40-80 words from a Zipf-ish vocabulary, spread across docs.
+    rng = random.Random(seed)
+    vocabulary = COMMON + [f"word{index}" for index in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    documents = [
+        {
+            "doc_id": f"doc:{sha256_text(str(index))}",
+            "relpath": f"docs/{index:04d}.md",
+            "sha256": sha256_text(str(index)),
+            "bytes": 0,
+        }
+        for index in range(docs)
+    ]
+    pack_chunks = []
+    for index in range(chunks):
+        text = " ".join(rng.choices(vocabulary, weights, k=rng.randint(40, 80)))
+        text_sha256 = sha256_text(f"{index}:{text}")
+        pack_chunks.append(
+            {
+                "doc_id": documents[index % docs]["doc_id"],
+                "chunk_id": f"chunk:{text_sha256}",
+                "index": index // docs,
+                "offset_start": 0,
+                "offset_end": len(text),
+                "text": text,
+                "text_sha256": text_sha256,
+            }
+        )
+    rng.shuffle(pack_chunks)
+    return {
+        "pack_version": "1.0",
+        "root_hint": "bench",
+        "documents": documents,
+        "chunks": pack_chunks,
+        "pack_sha256": sha256_text(str(seed)),
+    }
+
+
+def _best(func, repeat: int):
+    result = None
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--max-chunks", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pack = build_pack(args.chunks)
+    start = time.perf_counter()
+    index = PackIndex.build(pack)
+    build_seconds = time.perf_counter() - start
+    index_bytes = index.dumps()
+    print(
+        f"chunks={args.chunks} terms={len(index.postings)} "
+        f"index_build={build_seconds:.3f}s index_bytes={len(index_bytes)}"
+    )
+    print(f"{'mode':>8} {'query':<28}{'scan_ms':>10}{'index_ms':>10}{'hits':>6}")
+    # The per-call schema check is O(chunks) under either path; the boundary
+    # policy skips it, as Casefile Studio does for trusted in-process packs.
+    with validation_policy("boundary"):
+        for mode, query in QUERIES:
+
+            def select(pack_index=None, mode=mode, query=query):
+                return select_chunks(
+                    pack,
+                    mode=mode,
+                    query=query,
+                    max_chunks=args.max_chunks,
+                    index=pack_index,
+                )
+
+            scan_seconds, scanned = _best(select, 1)
+            index_seconds, indexed = _best(lambda: select(index), args.repeat)
+            if scanned != indexed:
+                print(f"MISMATCH: {mode} {query!r} differs between scan and index")
+                return 1
+            print(
+                f"{mode:>8} {query:<28}{scan_seconds * 1000:>10.1f}"
+                f"{index_seconds * 1000:>10.1f}{len(indexed):>6}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.extraction import segment  # noqa: E402
+
+SIZES = (
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+    50_000_000,
+)
+ABBREVIATIONS = {"mr", "dr", "inc", "no", "art"}
+SENTENCES = (
+    "In the beginning was the Word, and the Word was with God.",
+    "Jesus answered and said unto her: whosoever drinketh of this water "
+    "shall thirst again.",
+    "The Supplier shall deliver the Goods; the Customer shall pay the Fees "
+    "within thirty (30) days.",
+    "Mr. Smith of Acme Inc. signed the agreement, but Dr. Jones did not.",
+    "Either party may terminate this Agreement — upon written notice "
+    "– yet no such notice was given!",
+    "Is this the Christ?",
+    "See Art. 7 and No. 12 of the schedule.",
+)
+
+
+def _legacy_segment(text: str, abbreviations=None):
+    # The per-character implementation segment() replaced; quadratic because
+    # every sentence break searches the whole prefix.
+    abbreviations = abbreviations or set()
+    sentence_spans = []
+    start = 0
+    i = 0
+    length = len(text)
+    while i < length:
+        ch = text[i]
+        if ch == "\n":
+            end = i
+            if end > start:
+                sentence_spans.append((start, end))
+            i += 1
+            while i < length and text[i].isspace():
+                i += 1
+            start = i
+            continue
+        if ch in ".!?":
+            last_word_match = re.search(r"[A-Za-z']+$", text[:i])
+            last_word = last_word_match.group(0).lower() if last_word_match else ""
+            if last_word and last_word in abbreviations:
+                i += 1
+                continue
+            end = i + 1
+            sentence_spans.append((start, end))
+            i = end
+            while i < length and text[i].isspace():
+                i += 1
+            start = i
+            continue
+        i += 1
+    if start < length:
+        sentence_spans.append((start, length))
+
+    segments = []
+    boundaries = []
+    clause_splitters = [";", ":", "—", "–"]
+    clause_conj = [" and ", " but ", " yet "]
+    for s_idx, (s_start, s_end) in enumerate(sentence_spans):
+        sentence_text = text[s_start:s_end]
+        clause_starts = [0]
+        for splitter in clause_splitters:
+            for match in re.finditer(re.escape(splitter), sentence_text):
+                clause_starts.append(match.end())
+                boundaries.append(
+                    {"boundary": s_start + match.start(), "type": "punct"}
+                )
+        for conj in clause_conj:
+            for match in re.finditer(re.escape(conj), sentence_text):
+                clause_starts.append(match.start())
+        clause_starts = sorted(
+            set([c for c in clause_starts if 0 <= c < len(sentence_text)])
+        )
+        clause_starts.append(len(sentence_text))
+        for c_idx in range(len(clause_starts) - 1):
+            c_start = clause_starts[c_idx]
+            c_end = clause_starts[c_idx + 1]
+            clause_text = sentence_text[c_start:c_end].strip()
+            if not clause_text:
+                continue
+            token_start = s_start + c_start
+            token_end = s_start + c_end
+            segments.append(
+                {
+                    "sentence_id": s_idx,
+                    "clause_id": f"s{s_idx}.c{c_idx}",
+                    "text": clause_text,
+                    "token_start": token_start,
+                    "token_end": token_end,
+                }
+            )
+    return segments, boundaries, sentence_spans
+
+
+def build_text(size: int) -> str:
+    parts = []
+    total = 0
+    index = 0
+    while total < size:
+        sentence = SENTENCES[index % len(SENTENCES)]
+        separator = "\n\n" if index % 5 == 4 else " "
+        parts.append(sentence + separator)
+        total += len(sentence) + len(separator)
+        index += 1
+    return "".join(parts)[:size]
+
+
+def _measure(func, text: str, repeat: int) -> tuple[float, object]:
+    result = None
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text, ABBREVIATIONS)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-bytes", type=int, default=SIZES[-1])
+    parser.add_argument("--legacy-max-bytes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'bytes':>12}{'impl':>8}{'best_s':>10}{'MB/s':>9}"
+        f"{'sentences':>11}{'segments':>10}"
+    )
+    for size in SIZES:
+        if size > args.max_bytes:
+            break
+        text = build_text(size)
+        # One timed run is enough once a single pass takes seconds.
+        repeat = args.repeat if size <= 1_000_000 else 1
+        rows = [("linear", *_measure(segment, text, repeat))]
+        if size <= args.legacy_max_bytes:
+            rows.append(("legacy", *_measure(_legacy_segment, text, repeat)))
+            if rows[0][2] != rows[1][2]:
+                print(f"MISMATCH: segment differs from legacy at {size} bytes")
+                return 1
+        for name, seconds, (segments, _, sentence_spans) in rows:
+            print(
+                f"{size:>12}{name:>8}{seconds:>10.4f}"
+                f"{size / seconds / 1e6:>9.1f}"
+                f"{len(sentence_spans):>11}{len(segments):>10}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.determinism.canonical_json import dumps_canonical_with_sha256  # noqa: E402
+from core.determinism.hashing import sha256_text  # noqa: E402
+from core.determinism.schema_validate import validate  # noqa: E402
+from core.determinism.text_store import TextStore  # noqa: E402
+from proposal.bundle_from_pack import (  # noqa: E402
+    build_evidence_bundle_from_pack,
+    select_chunks,
+)
+from proposal.evidence_pack import build_evidence_pack  # noqa: E402
+
+WORDS = ["runbook", "rotate", "credential", "deploy", "policy", "Café", "owner"]
+LICENSE = "Licensed under the Apache License, Version 2.0. " * 12
+FOOTER = "\n\nPolicy footer: see the security handbook for escalation. " * 6
+BUNDLE_ARGS = {
+    "prompt": "bench",
+    "params": {},
+    "created_utc": "2026-03-01T12:00:00Z",
+    "core_version": "0.3.0",
+    "ruleset_id": "ruleset.core.v1",
+    "mode": "all",
+    "query": "",
+}
+
+
+def write_corpus(folder: Path, files: int, body_chars: int, seed: int = 24) -> None:
+    # Every file opens with the same license block; the body and a repeated
+    # runbook section vary.
+    rng = random.Random(seed)
+    runbooks = [" ".join(rng.choices(WORDS, k=200)) for _ in range(max(1, files // 20))]
+    for index in range(files):
+        body = " ".join(rng.choices(WORDS, k=body_chars // 7))
+        text = LICENSE + "\n" + rng.choice(runbooks) + "\n" + body + FOOTER
+        path = folder / f"doc{index:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+def _legacy_bundle(pack: dict, max_chunks: int) -> str:
+    # Previous behaviour: every artifact is hashed in the builder and again in
+    # build_evidence_bundle.
+    chunks = select_chunks(pack, mode="all", query="", max_chunks=max_chunks)
+    artifacts = sorted(
+        (
+            {
+                "source_id": c["doc_id"],
+                "chunk_id": c["chunk_id"],
+                "offset_start": c["offset_start"],
+                "offset_end": c["offset_end"],
+                "text": c["text"],
+                "text_sha256": c["text_sha256"],
+            }
+            for c in chunks
+        ),
+        key=lambda a: (a["source_id"], a["chunk_id"], a["offset_start"]),
+    )
+    for artifact in artifacts:
+        if sha256_text(artifact["text"]) != artifact["text_sha256"]:
+            raise ValueError("artifact text_sha256 does not match artifact text")
+    bundle = {
+        "bundle_version": "1.0",
+        "created_utc": BUNDLE_ARGS["created_utc"],
+        "inputs": {"prompt": BUNDLE_ARGS["prompt"], "params": {}},
+        "artifacts": artifacts,
+        "toolchain": {
+            "core_version": BUNDLE_ARGS["core_version"],
+            "parser_versions": {},
+            "schema_versions": {
+                "attestation_record": "1.0",
+                "evidence_bundle": "1.0",
+                "evidence_pack": "1.0",
+            },
+        },
+        "policy": {"ruleset_id": BUNDLE_ARGS["ruleset_id"]},
+    }
+    bundle = deepcopy(bundle)
+    for artifact in bundle["artifacts"]:
+        if sha256_text(artifact["text"]) != artifact["text_sha256"]:
+            raise ValueError("artifact text_sha256 mismatch")
+    validate(bundle, "schemas/evidence_bundle.schema.json")
+    return dumps_canonical_with_sha256(bundle)[1]
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--body-chars", type=int, default=1500)
+    parser.add_argument("--max-chars", type=int, default=200)
+    args = parser.parse_args(argv)
+    options = {"root_hint": "bench", "max_chars": args.max_chars, "overlap_chars": 0}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp) / "corpus"
+        write_corpus(folder, args.files, args.body_chars)
+        text_store = TextStore()
+        pack_seconds, (pack_obj, _) = _timed(
+            lambda: build_evidence_pack(str(folder), text_store=text_store, **options)
+        )
+        pack_report = text_store.report()
+
+    max_chunks = len(pack_obj["chunks"])
+    legacy_seconds, legacy_sha256 = _timed(lambda: _legacy_bundle(pack_obj, max_chunks))
+    fresh_store = TextStore()
+    fresh_seconds, (_, _, fresh_sha256) = _timed(
+        lambda: build_evidence_bundle_from_pack(
+            pack_obj, max_chunks=max_chunks, text_store=fresh_store, **BUNDLE_ARGS
+        )
+    )
+    shared_seconds, (_, _, shared_sha256) = _timed(
+        lambda: build_evidence_bundle_from_pack(
+            pack_obj, max_chunks=max_chunks, text_store=text_store, **BUNDLE_ARGS
+        )
+    )
+    if not legacy_sha256 == fresh_sha256 == shared_sha256:
+        print("MISMATCH: bundle bytes differ from the per-artifact hashing path")
+        return 1
+
+    print(f"pack build {pack_seconds:.3f}s {pack_report}")
+    print(f"{'bundle':>24}{'seconds':>10}")
+    print(f"{'hash every artifact':>24}{legacy_seconds:>10.3f}")
+    print(f"{'fresh text store':>24}{fresh_seconds:>10.3f}")
+    print(f"{'pack text store':>24}{shared_seconds:>10.3f}")
+    print(f"bundle text store {fresh_store.report()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.determinism.hashing import sha256_text  # noqa: E402
+from proposal.entity_automaton import EntityAutomaton  # noqa: E402
+from proposal.world_propose import (  # noqa: E402
+    _entity_id,
+    propose_entities_from_pack,
+    propose_events_from_pack,
+)
+
+FILLER = ["rotate", "the", "deploy", "leak", "environment only", "never in source"]
+
+
+def _legacy_extract_objects(action: str, entities: list[dict]) -> list[str]:
+    action_lower = action.lower()
+    object_ids = set()
+    for entity in entities:
+        for token in [entity["name"], *entity["aliases"]]:
+            if token.lower() in action_lower:
+                object_ids.add(entity["entity_id"])
+                break
+    return sorted(object_ids)
+
+
+def _legacy_extract_state(action: str, entities: list[dict]) -> dict | None:
+    lower = action.lower()
+    state = {}
+    for entity in entities:
+        if entity["type"] != "Secret":
+            continue
+        if entity["name"].lower() not in lower:
+            continue
+        if "environment only" in lower or "env-only" in lower:
+            state[entity["name"]] = "env-only"
+        if "never in source" in lower or "never in repo" in lower:
+            state[entity["name"]] = "never-in-repo"
+    if not state:
+        return None
+    return {key: state[key] for key in sorted(state)}
+
+
+def _legacy_label_tokens(objects: list[str], entities: list[dict]) -> list[str]:
+    return sorted(
+        {
+            token.lower()
+            for object_id in objects
+            for entity in entities
+            if entity["entity_id"] == object_id
+            for token in [entity["name"], *entity["aliases"]]
+        }
+    )
+
+
+def legacy_match(action: str, entities: list[dict]):
+    objects = _legacy_extract_objects(action, entities)
+    return (
+        objects,
+        _legacy_extract_state(action, entities),
+        _legacy_label_tokens(objects, entities),
+    )
+
+
+def build_pack(entities: int, lines: int, seed: int = 25) -> dict:
+    # Backticked secrets and ALL_CAPS concepts become entities; bullet lines
+    # mention a few of them among filler words.
+    rng = random.Random(seed)
+    secrets = [f"svc{index}_token" for index in range(entities // 2)]
+    concepts = [f"SYSTEM_{index}" for index in range(entities - len(secrets))]
+    declared = [f"`{name}` {concept}" for name, concept in zip(secrets, concepts)]
+    bullets = []
+    for _ in range(lines):
+        words = rng.choices(FILLER, k=6) + rng.sample(secrets + concepts, 2)
+        rng.shuffle(words)
+        bullets.append("- " + " ".join(words))
+    text = "\n".join(declared + bullets)
+    sha256 = sha256_text(text)
+    return {
+        "pack_version": "1.0",
+        "root_hint": "bench",
+        "documents": [
+            {
+                "doc_id": f"doc:{sha256}",
+                "relpath": "runbook.md",
+                "sha256": sha256,
+                "bytes": len(text.encode("utf-8")),
+            }
+        ],
+        "chunks": [
+            {
+                "doc_id": f"doc:{sha256}",
+                "chunk_id": f"chunk:{sha256}",
+                "index": 0,
+                "offset_start": 0,
+                "offset_end": len(text),
+                "text": text,
+                "text_sha256": sha256,
+            }
+        ],
+        "pack_sha256": sha256,
+    }
+
+
+def with_aliases(entities: list[dict]) -> list[dict]:
+    aliased = []
+    for entity in entities:
+        name = entity["name"]
+        aliases = sorted({name.upper(), name.replace("_", "-")} - {name})
+        aliased.append(
+            {
+                **entity,
+                "entity_id": _entity_id(entity["type"], name, aliases),
+                "aliases": aliases,
+            }
+        )
+    return aliased
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=3000)
+    parser.add_argument("--lines", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    pack = build_pack(args.entities, args.lines)
+    entities = propose_entities_from_pack(pack)
+    actions = [
+        line[2:] for line in pack["chunks"][0]["text"].split("\n") if line[:2] == "- "
+    ]
+    rows = []
+    for name, entity_list in (("names", entities), ("aliases", with_aliases(entities))):
+        start = time.perf_counter()
+        expected = [legacy_match(action, entity_list) for action in actions]
+        legacy_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        automaton = EntityAutomaton(entity_list)
+        actual = [automaton.match(action) for action in actions]
+        automaton_seconds = time.perf_counter() - start
+        if actual != expected:
+            print(
+                f"MISMATCH: entity automaton differs from the per-entity scan ({name})"
+            )
+            return 1
+        rows.append((name, legacy_seconds, automaton_seconds))
+
+    start = time.perf_counter()
+    events = propose_events_from_pack(pack, entities)
+    events_seconds = time.perf_counter() - start
+
+    print(f"entities={len(entities)} lines={len(actions)} events={len(events)}")
+    print(f"{'entities':>10}{'scan_s':>10}{'automaton_s':>13}")
+    for name, legacy_seconds, automaton_seconds in rows:
+        print(f"{name:>10}{legacy_seconds:>10.3f}{automaton_seconds:>13.3f}")
+    print(f"propose_events_from_pack {events_seconds:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
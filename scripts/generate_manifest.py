@@ -1,10 +1,24 @@
 import argparse
 import hashlib
 import subprocess
+import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from core.determinism.merkle_manifest import (  # noqa: E402
+    MERKLE_FILENAME,
+    build_merkle_document,
+    dumps_merkle_document,
+)
+
 MANIFEST_PATH = ROOT / "MANIFEST.sha256"
+MERKLE_PATH = ROOT / MERKLE_FILENAME
+# sha256 per git blob id, kept inside the git dir so it is never tracked.
+CACHE_NAME = "manifest-sha256.cache"
 
 INCLUDE_GLOBS = [
     "pyproject.toml",
@@ -30,21 +44,78 @@ INCLUDE_GLOBS = [
 ]
 
 
-def _git_ls_files() -> list[str]:
-    output = subprocess.check_output(["git", "ls-files", "-z"], cwd=ROOT)
-    return [path for path in output.decode("utf-8").split("\0") if path]
-
-
-def _read_index_bytes(path: str) -> bytes:
-    return subprocess.check_output(["git", "show", f":{path}"], cwd=ROOT)
-
-
-def _sha256(path: str) -> str:
-    return hashlib.sha256(_read_index_bytes(path)).hexdigest()
-
-
-def _iter_files() -> list[str]:
-    tracked = set(_git_ls_files())
+def _git(*args: str) -> bytes:
+    return subprocess.check_output(["git", *args], cwd=ROOT)
+
+
+def _index_blob_ids() -> dict[str, str]:
+    # One `git ls-files -s` call yields every tracked path with its index blob
+    # id; entries in a conflicted (non-zero) stage have no single blob.
+    blob_ids = {}
+    for entry in _git("ls-files", "-s", "-z").decode("utf-8").split("\0"):
+        if not entry:
+            continue
+        meta, path = entry.split("\t", 1)
+        _mode, object_id, stage = meta.split(" ")
+        if stage == "0":
+            blob_ids[path] = object_id
+    return blob_ids
+
+
+def _cache_path() -> Path:
+    git_path = _git("rev-parse", "--git-path", CACHE_NAME).decode("utf-8").strip()
+    return ROOT / git_path
+
+
+def _load_cache(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    cache = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        object_id, _, digest = line.partition(" ")
+        if digest:
+            cache[object_id] = digest
+    return cache
+
+
+def _save_cache(path: Path, cache: dict[str, str]) -> None:
+    lines = "".join(f"{object_id} {cache[object_id]}\n" for object_id in sorted(cache))
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        temp_path.write_text(lines, encoding="utf-8")
+        temp_path.replace(path)
+    except OSError:
+        # The cache is an optimization only; a read-only .git is fine.
+        pass
+
+
+def _hash_blobs(object_ids: list[str]) -> dict[str, str]:
+    # Streams every blob through a single `git cat-file --batch` process.
+    if not object_ids:
+        return {}
+    request = "".join(f"{object_id}\n" for object_id in object_ids).encode("ascii")
+    output = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=ROOT,
+        input=request,
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    digests = {}
+    offset = 0
+    for object_id in object_ids:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].decode("ascii").split(" ")
+        if len(header) != 3 or header[1] != "blob":
+            raise SystemExit(f"unexpected git cat-file output for {object_id}")
+        size = int(header[2])
+        start = header_end + 1
+        digests[object_id] = hashlib.sha256(output[start : start + size]).hexdigest()
+        offset = start + size + 1
+    return digests
+
+
+def _iter_files(tracked) -> list[str]:
     files = set()
     for pattern in INCLUDE_GLOBS:
         for path in ROOT.glob(pattern):
@@ -55,13 +126,48 @@ def _iter_files() -> list[str]:
     return sorted(files)
 
 
+def build_manifest_entries() -> list[tuple[str, str]]:
+    blob_ids = _index_blob_ids()
+    files = _iter_files(blob_ids)
+    cache_path = _cache_path()
+    cache = _load_cache(cache_path)
+    missing = sorted({blob_ids[path] for path in files} - set(cache))
+    if missing:
+        cache.update(_hash_blobs(missing))
+        _save_cache(cache_path, cache)
+    return [(cache[blob_ids[path]], path) for path in files]
+
+
 def build_manifest_text() -> str:
-    lines = []
-    for path in _iter_files():
-        lines.append(f"{_sha256(path)}  {path}")
+    lines = [f"{digest}  {path}" for digest, path in build_manifest_entries()]
     return "\n".join(lines) + "\n"
 
 
+def check_manifest(existing: str, expected: str) -> list[str]:
+    existing_entries = _parse_manifest(existing)
+    expected_entries = _parse_manifest(expected)
+    problems = []
+    for path in sorted(set(existing_entries) | set(expected_entries)):
+        if path not in existing_entries:
+            problems.append(f"missing:  {path}")
+        elif path not in expected_entries:
+            problems.append(f"stale:    {path}")
+        elif existing_entries[path] != expected_entries[path]:
+            problems.append(f"changed:  {path}")
+    if not problems and existing != expected:
+        problems.append("format:   MANIFEST.sha256 is not in canonical form")
+    return problems
+
+
+def _parse_manifest(text: str) -> dict[str, str]:
+    entries = {}
+    for line in text.splitlines():
+        digest, separator, path = line.partition("  ")
+        if separator:
+            entries[path] = digest
+    return entries
+
+
 def _first_difference(existing: str, expected: str) -> tuple[int, str, str, str]:
     existing_lines = existing.splitlines()
     expected_lines = expected.splitlines()
@@ -88,9 +194,29 @@ def main():
     parser.add_argument(
         "--verify", action="store_true", help="verify MANIFEST.sha256 matches"
     )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="list every path whose MANIFEST.sha256 entry differs from the index",
+    )
     args = parser.parse_args()
 
     manifest_text = build_manifest_text()
+    merkle_bytes = dumps_merkle_document(
+        build_merkle_document(manifest_text.encode("utf-8"))
+    )
+    merkle_current = MERKLE_PATH.exists() and MERKLE_PATH.read_bytes() == merkle_bytes
+
+    if args.check:
+        existing = (
+            MANIFEST_PATH.read_bytes().decode("utf-8") if MANIFEST_PATH.exists() else ""
+        )
+        problems = check_manifest(existing, manifest_text)
+        if not merkle_current:
+            problems.append(f"merkle:   {MERKLE_FILENAME} is out of date")
+        for problem in problems:
+            print(problem)
+        return 1 if problems else 0
 
     if args.verify:
         if not MANIFEST_PATH.exists():
@@ -109,10 +235,17 @@ def main():
                 f"expected: {expected_line}\n"
                 f"actual:   {actual_line}"
             )
-        return
+        if not merkle_current:
+            raise SystemExit(
+                f"{MERKLE_FILENAME} does not match generated content; "
+                "run without --verify to regenerate."
+            )
+        return 0
 
     MANIFEST_PATH.write_bytes(manifest_text.encode("utf-8"))
+    MERKLE_PATH.write_bytes(merkle_bytes)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
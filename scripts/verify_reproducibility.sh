@@ -19,11 +19,11 @@ pytest
 python scripts/determinism_check.py
 
 if ! python scripts/generate_manifest.py --verify; then
-  git diff -- MANIFEST.sha256 || true
+  git diff -- MANIFEST.sha256 MANIFEST.merkle.json || true
   exit 1
 fi
 python scripts/generate_manifest.py
 if ! python scripts/generate_manifest.py --verify; then
-  git diff -- MANIFEST.sha256 || true
+  git diff -- MANIFEST.sha256 MANIFEST.merkle.json || true
   exit 1
 fi
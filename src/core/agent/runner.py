@@ -65,7 +65,7 @@ def _plan_with_hash(plan: dict) -> dict:
         **plan,
         "plan_sha256": plan_sha256,
     }
-    validate(finalized, "schemas/agent_plan.schema.json")
+    validate(finalized, "schemas/agent_plan.schema.json", scope="internal")
     return finalized
 
 
@@ -303,7 +303,7 @@ def _record_step(
         "result": _result_json_safe(result),
         "receipts": _receipts_from_result(result),
     }
-    validate(step_record, "schemas/agent_step_record.schema.json")
+    validate(step_record, "schemas/agent_step_record.schema.json", scope="item")
     return _write_json_artifact(step_dir / "step_record.json", step_record)
 
 
@@ -314,7 +314,7 @@ def run_task(
     ledger_root: str = "data/ledger",
 ) -> dict:
     del ledger_root
-    validate(task_obj, "schemas/agent_task.schema.json")
+    validate(task_obj, "schemas/agent_task.schema.json", scope="internal")
     plan = _build_plan(task_obj)
     plan_text = _render_plan_text(plan)
     if not approve:
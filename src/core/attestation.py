@@ -2,12 +2,31 @@ import hashlib
 import json
 from pathlib import Path
 
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=True, indent=2)
+_STREAM_CHUNK_SIZE = 1 << 20
+
 
 def canonicalize_json(data) -> bytes:
     text = json.dumps(data, sort_keys=True, ensure_ascii=True, indent=2)
     return (text + "\n").encode("utf-8")
 
 
+def iter_canonical_json(data):
+    # Yields canonicalize_json(data) in chunks of about _STREAM_CHUNK_SIZE
+    # bytes; with indent set, json.dumps joins these same iterencode pieces.
+    pending = []
+    size = 0
+    for piece in _CANONICAL_ENCODER.iterencode(data):
+        pending.append(piece)
+        size += len(piece)
+        if size >= _STREAM_CHUNK_SIZE:
+            yield "".join(pending).encode("utf-8")
+            pending = []
+            size = 0
+    pending.append("\n")
+    yield "".join(pending).encode("utf-8")
+
+
 def compute_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
@@ -26,6 +45,22 @@ def write_json(path: Path, data) -> str:
     return compute_sha256(payload)
 
 
+def write_json_stream(path: Path, data) -> str:
+    digest = hashlib.sha256()
+    with path.open("wb") as handle:
+        for chunk in iter_canonical_json(data):
+            handle.write(chunk)
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_json_stream(data) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter_canonical_json(data):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
 def write_text(path: Path, text: str) -> None:
     path.write_text(text, encoding="utf-8", newline="\n")
 
@@ -79,7 +79,7 @@ def render_casefile_summary(casefile: dict) -> str:
 def inspect_casefile(path: str | Path) -> str:
     casefile_path = Path(path)
     casefile_obj = json.loads(casefile_path.read_text(encoding="utf-8"))
-    validate(casefile_obj, "schemas/casefile.schema.json")
+    validate(casefile_obj, "schemas/casefile.schema.json", scope="seal")
     return render_casefile_summary(casefile_obj)
 
 
@@ -1,22 +1,32 @@
 from core.determinism.attest import build_attestation
 from core.determinism.bundle import build_evidence_bundle
-from core.determinism.canonical_json import dumps_canonical
+from core.determinism.canonical_json import (
+    canonical_key,
+    dump_canonical,
+    dumps_canonical,
+    sha256_canonical,
+)
 from core.determinism.finalize import canonicalize_output, finalize
 from core.determinism.hashing import sha256_bytes, sha256_text
 from core.determinism.ledger import ledger_path, write_run
 from core.determinism.manifest_hash import compute_manifest_sha256
 from core.determinism.replay import verify_run
 from core.determinism.schema_validate import validate
+from core.determinism.text_store import TextStore
 
 __all__ = [
+    "TextStore",
     "build_attestation",
     "build_evidence_bundle",
     "compute_manifest_sha256",
+    "canonical_key",
     "canonicalize_output",
+    "dump_canonical",
     "dumps_canonical",
     "finalize",
     "ledger_path",
     "sha256_bytes",
+    "sha256_canonical",
     "sha256_text",
     "validate",
     "verify_run",
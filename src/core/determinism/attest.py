@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from copy import deepcopy
 
-from core.determinism.canonical_json import dumps_canonical
+from core.determinism.canonical_json import dumps_canonical_with_sha256
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
 
@@ -21,5 +21,4 @@ def build_attestation(
         raise ValueError("attestation output_sha256 mismatch")
 
     validate(attestation, schema_path)
-    attestation_bytes = dumps_canonical(attestation)
-    return attestation_bytes, sha256_bytes(attestation_bytes)
+    return dumps_canonical_with_sha256(attestation)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from core.determinism.hashing import sha256_bytes
+
+STORE_DIRNAME = "objects"
+RUNS_FILENAME = "runs.log"
+RUN_BLOB_FIELDS = (
+    ("bundle.json", "bundle_sha256"),
+    ("output.json", "output_sha256"),
+    ("attestation.json", "attestation_sha256"),
+)
+
+
+def store_root(ledger_root: str | Path) -> Path:
+    return Path(ledger_root) / STORE_DIRNAME
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    temp_path.replace(path)
+
+
+class BlobStore:
+    # Loose blobs live at objects/<sha[:2]>/<sha[2:]>. pack() moves them into an
+    # immutable objects/pack/pack-<sha>.pack whose sibling .idx lists
+    # "<sha256> <offset> <length>" per blob; the .idx is written last, so a
+    # pack without one is ignored. Runs are recorded as one appended line in
+    # runs.log: "<bundle_sha256> <output_sha256> <attestation_sha256>".
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.pack_dir = self.root / "pack"
+        self._pack_index: dict[str, tuple[Path, int, int]] = {}
+        self._pack_names: frozenset[str] = frozenset()
+        self._runs: tuple[int, dict[str, dict[str, str]]] = (0, {})
+
+    @classmethod
+    def for_ledger(cls, ledger_root: str | Path) -> BlobStore:
+        return cls(store_root(ledger_root))
+
+    def _loose_path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256[2:]
+
+    def _refresh_packs(self) -> None:
+        if not self.pack_dir.is_dir():
+            return
+        names = frozenset(path.name for path in self.pack_dir.glob("pack-*.idx"))
+        if names == self._pack_names:
+            return
+        index: dict[str, tuple[Path, int, int]] = {}
+        for name in sorted(names):
+            pack_path = self.pack_dir / (name[: -len(".idx")] + ".pack")
+            lines = (self.pack_dir / name).read_text(encoding="utf-8").splitlines()
+            for line in lines:
+                sha256, offset, length = line.split(" ")
+                index.setdefault(sha256, (pack_path, int(offset), int(length)))
+        self._pack_index = index
+        self._pack_names = names
+
+    def _packed(self, sha256: str) -> tuple[Path, int, int] | None:
+        entry = self._pack_index.get(sha256)
+        if entry is None:
+            self._refresh_packs()
+            entry = self._pack_index.get(sha256)
+        return entry
+
+    def has(self, sha256: str) -> bool:
+        return self._loose_path(sha256).is_file() or self._packed(sha256) is not None
+
+    def put(self, data: bytes, sha256: str | None = None) -> str:
+        digest = sha256_bytes(data)
+        if sha256 is not None and sha256 != digest:
+            raise ValueError("blob sha256 does not match data")
+        if not self.has(digest):
+            path = self._loose_path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, data)
+        return digest
+
+    def get(self, sha256: str) -> bytes:
+        try:
+            return self._loose_path(sha256).read_bytes()
+        except FileNotFoundError:
+            # Not stored loose, or pack() moved it between lookups.
+            pass
+        entry = self._packed(sha256)
+        if entry is None:
+            raise FileNotFoundError(f"blob not found: {sha256}")
+        pack_path, offset, length = entry
+        with pack_path.open("rb") as handle:
+            handle.seek(offset)
+            data = handle.read(length)
+        if len(data) != length:
+            raise ValueError(f"truncated pack entry: {sha256}")
+        return data
+
+    def loose_blobs(self) -> list[str]:
+        blobs = []
+        for prefix_dir in sorted(self.root.glob("[0-9a-f][0-9a-f]")):
+            for path in sorted(prefix_dir.iterdir()):
+                if not path.name.startswith("."):
+                    blobs.append(prefix_dir.name + path.name)
+        return blobs
+
+    def pack(self) -> Path | None:
+        loose = self.loose_blobs()
+        pending = [sha256 for sha256 in loose if self._packed(sha256) is None]
+        pack_path = self._write_pack(pending) if pending else None
+        for sha256 in loose:
+            path = self._loose_path(sha256)
+            path.unlink()
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+        return pack_path
+
+    def _write_pack(self, blobs: list[str]) -> Path:
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        index_lines = []
+        offset = 0
+        temp_pack = self.pack_dir / f".pack.{os.getpid()}.tmp"
+        with temp_pack.open("wb") as handle:
+            for sha256 in blobs:
+                data = self._loose_path(sha256).read_bytes()
+                handle.write(data)
+                index_lines.append(f"{sha256} {offset} {len(data)}\n")
+                offset += len(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        index_bytes = "".join(index_lines).encode("utf-8")
+        name = "pack-" + sha256_bytes(index_bytes)
+        pack_path = self.pack_dir / f"{name}.pack"
+        temp_pack.replace(pack_path)
+        _write_atomic(self.pack_dir / f"{name}.idx", index_bytes)
+        self._refresh_packs()
+        return pack_path
+
+    def runs(self) -> dict[str, dict[str, str]]:
+        # runs.log is append-only, so an unchanged size means unchanged records.
+        try:
+            size = (self.root / RUNS_FILENAME).stat().st_size
+        except FileNotFoundError:
+            return {}
+        if size == self._runs[0]:
+            return self._runs[1]
+        data = (self.root / RUNS_FILENAME).read_bytes()[:size]
+        # Ignore a trailing line that a concurrent writer has not finished.
+        data = data[: data.rfind(b"\n") + 1]
+        records: dict[str, dict[str, str]] = {}
+        for line in data.decode("utf-8").splitlines():
+            bundle_sha256, output_sha256, attestation_sha256 = line.split(" ")
+            records.setdefault(
+                bundle_sha256,
+                {
+                    "bundle_sha256": bundle_sha256,
+                    "output_sha256": output_sha256,
+                    "attestation_sha256": attestation_sha256,
+                },
+            )
+        self._runs = (len(data), records)
+        return records
+
+    def run(self, bundle_sha256: str) -> dict[str, str] | None:
+        return self.runs().get(bundle_sha256)
+
+    def add_run(
+        self, bundle_sha256: str, output_sha256: str, attestation_sha256: str
+    ) -> None:
+        record = {
+            "bundle_sha256": bundle_sha256,
+            "output_sha256": output_sha256,
+            "attestation_sha256": attestation_sha256,
+        }
+        existing = self.run(bundle_sha256)
+        if existing is not None:
+            for name, field in RUN_BLOB_FIELDS:
+                if existing[field] != record[field]:
+                    raise ValueError(f"existing ledger file mismatch: {name}")
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        line = f"{bundle_sha256} {output_sha256} {attestation_sha256}\n"
+        # A single O_APPEND write keeps concurrent writers from interleaving.
+        fd = os.open(
+            self.root / RUNS_FILENAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def read_run_file(self, bundle_sha256: str, name: str) -> bytes:
+        record = self.run(bundle_sha256)
+        if record is None:
+            raise FileNotFoundError(f"run not found in blob store: {bundle_sha256}")
+        field = dict(RUN_BLOB_FIELDS).get(name)
+        if field is None:
+            raise ValueError(f"unknown ledger file: {name}")
+        return self.get(record[field])
+
+    def stats(self) -> dict:
+        self._refresh_packs()
+        return {
+            "runs": len(self.runs()),
+            "loose_blobs": len(self.loose_blobs()),
+            "packed_blobs": len(self._pack_index),
+            "packs": len(self._pack_names),
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["pack", "stats"])
+    parser.add_argument("ledger_root")
+    args = parser.parse_args(argv)
+
+    store = BlobStore.for_ledger(args.ledger_root)
+    if args.command == "pack":
+        pack_path = store.pack()
+        print(f"packed: {pack_path.as_posix()}" if pack_path else "nothing to pack")
+    print(json.dumps(store.stats(), sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
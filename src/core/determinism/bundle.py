@@ -2,18 +2,22 @@ from __future__ import annotations
 
 from copy import deepcopy
 
-from core.determinism.canonical_json import dumps_canonical
-from core.determinism.hashing import sha256_bytes, sha256_text
+from core.determinism.canonical_json import dumps_canonical_with_sha256
 from core.determinism.schema_validate import validate
+from core.determinism.text_store import TextStore
 
 
 def build_evidence_bundle(
     bundle_obj: dict,
     schema_path: str = "schemas/evidence_bundle.schema.json",
+    *,
+    text_store: TextStore | None = None,
 ) -> tuple[bytes, str]:
+    if text_store is None:
+        text_store = TextStore()
     bundle = deepcopy(bundle_obj)
     for artifact in bundle.get("artifacts", []):
-        computed_sha = sha256_text(artifact["text"])
+        computed_sha = text_store.sha256(artifact["text"])
         recorded_sha = artifact.get("text_sha256")
         if recorded_sha is None:
             artifact["text_sha256"] = computed_sha
@@ -21,5 +25,4 @@ def build_evidence_bundle(
             raise ValueError("artifact text_sha256 mismatch")
 
     validate(bundle, schema_path)
-    bundle_bytes = dumps_canonical(bundle)
-    return bundle_bytes, sha256_bytes(bundle_bytes)
+    return dumps_canonical_with_sha256(bundle)
@@ -1,30 +1,224 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 import unicodedata
+from json.encoder import encode_basestring
+from operator import itemgetter
 
+# Pending str fragments are joined, encoded and handed to the sinks once this
+# many have accumulated, which bounds memory when streaming large outputs.
+_FLUSH_PARTS = 8192
+_FIRST = itemgetter(0)
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
 
-def _normalize(value):
-    if isinstance(value, str):
-        return unicodedata.normalize("NFC", value)
-    if isinstance(value, list):
-        return [_normalize(item) for item in value]
-    if isinstance(value, dict):
-        return {_normalize(key): _normalize(item) for key, item in value.items()}
-    if isinstance(value, tuple):
-        return [_normalize(item) for item in value]
-    if isinstance(value, float) and not math.isfinite(value):
-        raise ValueError("canonical JSON does not allow NaN or Infinity")
-    return value
-
-
-def dumps_canonical(obj) -> bytes:
-    normalized = _normalize(obj)
-    return json.dumps(
-        normalized,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-        allow_nan=False,
-    ).encode("utf-8")
+
+def _nfc(value: str) -> str:
+    if value.isascii() or unicodedata.is_normalized("NFC", value):
+        return value
+    return unicodedata.normalize("NFC", value)
+
+
+def _is_nfc_tree(obj) -> bool:
+    # True when json.dumps can encode obj as-is: every string, key included, is
+    # already NFC and every node has an exact built-in JSON type.
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    is_normalized = unicodedata.is_normalized
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is str:
+            if not value.isascii() and not is_normalized("NFC", value):
+                return False
+        elif value_type is dict:
+            for key in value:
+                if type(key) is str:
+                    if not key.isascii() and not is_normalized("NFC", key):
+                        return False
+                elif type(key) not in _SCALAR_TYPES:
+                    return False
+            extend(value.values())
+        elif value_type is list or value_type is tuple:
+            extend(value)
+        elif value_type not in _SCALAR_TYPES:
+            return False
+    return True
+
+
+def _non_finite() -> ValueError:
+    return ValueError("canonical JSON does not allow NaN or Infinity")
+
+
+def _encode_key(key) -> str:
+    # Mirrors json.dumps key coercion for non-string keys.
+    if isinstance(key, str):
+        return encode_basestring(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    if isinstance(key, float):
+        return '"' + float.__repr__(key) + '"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+def _normalized_key(key):
+    if isinstance(key, str):
+        return _nfc(key)
+    if isinstance(key, float) and not math.isfinite(key):
+        raise _non_finite()
+    return key
+
+
+def _sorted_items(value: dict) -> list[tuple]:
+    for key in value:
+        if isinstance(key, str):
+            if not (key.isascii() or unicodedata.is_normalized("NFC", key)):
+                break
+        elif isinstance(key, float) and not math.isfinite(key):
+            raise _non_finite()
+    else:
+        return sorted(value.items(), key=_FIRST)
+    # Later keys win when two keys collapse to the same NFC form.
+    normalized = {_normalized_key(key): item for key, item in value.items()}
+    return sorted(normalized.items(), key=_FIRST)
+
+
+class _CanonicalEncoder:
+    def __init__(self, sinks: tuple = ()) -> None:
+        self.parts: list[str] = []
+        self.sinks = sinks
+        self.byte_count = 0
+
+    def flush(self) -> None:
+        if not self.parts:
+            return
+        chunk = "".join(self.parts).encode("utf-8")
+        self.parts.clear()
+        self.byte_count += len(chunk)
+        for sink in self.sinks:
+            sink(chunk)
+
+    def encode(self, value) -> None:
+        parts = self.parts
+        if isinstance(value, str):
+            parts.append(encode_basestring(_nfc(value)))
+        elif value is None:
+            parts.append("null")
+        elif value is True:
+            parts.append("true")
+        elif value is False:
+            parts.append("false")
+        elif isinstance(value, int):
+            parts.append(int.__repr__(value))
+        elif isinstance(value, float):
+            if not math.isfinite(value):
+                raise _non_finite()
+            parts.append(float.__repr__(value))
+        elif isinstance(value, dict):
+            if not value:
+                parts.append("{}")
+                return
+            separator = "{"
+            for key, item in _sorted_items(value):
+                parts.append(separator)
+                parts.append(_encode_key(key))
+                parts.append(":")
+                self.encode(item)
+                separator = ","
+            parts.append("}")
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                parts.append("[]")
+                return
+            separator = "["
+            for item in value:
+                parts.append(separator)
+                self.encode(item)
+                separator = ","
+            parts.append("]")
+        else:
+            raise TypeError(
+                f"Object of type {type(value).__name__} is not JSON serializable"
+            )
+        if self.sinks and len(parts) >= _FLUSH_PARTS:
+            self.flush()
+
+
+def _stream(obj, sinks: tuple) -> int:
+    encoder = _CanonicalEncoder(sinks)
+    encoder.encode(obj)
+    encoder.flush()
+    return encoder.byte_count
+
+
+def dumps_canonical(obj, *, hasher=None) -> bytes:
+    if _is_nfc_tree(obj):
+        try:
+            text = json.dumps(
+                obj,
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+                allow_nan=False,
+            )
+        except ValueError as exc:
+            if str(exc).startswith("Out of range float values"):
+                raise _non_finite() from None
+            raise
+        data = text.encode("utf-8")
+        if hasher is not None:
+            hasher.update(data)
+        return data
+
+    chunks: list[bytes] = []
+    sinks = (chunks.append,) if hasher is None else (chunks.append, hasher.update)
+    _stream(obj, sinks)
+    return b"".join(chunks)
+
+
+def dumps_canonical_with_sha256(obj) -> tuple[bytes, str]:
+    hasher = hashlib.sha256()
+    data = dumps_canonical(obj, hasher=hasher)
+    return data, hasher.hexdigest()
+
+
+def dump_canonical(obj, fp=None, *, hasher=None) -> int:
+    sinks = []
+    if fp is not None:
+        sinks.append(fp.write)
+    if hasher is not None:
+        sinks.append(hasher.update)
+    return _stream(obj, tuple(sinks))
+
+
+def sha256_canonical(obj) -> str:
+    hasher = hashlib.sha256()
+    dump_canonical(obj, hasher=hasher)
+    return hasher.hexdigest()
+
+
+def canonical_key(obj) -> tuple[str, ...]:
+    # Fragments concatenate to dumps_canonical(obj) and each one ends where a
+    # JSON value ends, so no fragment is a proper prefix of another and tuple
+    # comparison orders exactly like the canonical string.
+    if isinstance(obj, dict) and obj:
+        items = _sorted_items(obj)
+        last = len(items) - 1
+        return ("{",) + tuple(
+            _encode_key(key)
+            + ":"
+            + dumps_canonical(item).decode("utf-8")
+            + ("}" if index == last else ",")
+            for index, (key, item) in enumerate(items)
+        )
+    return (dumps_canonical(obj).decode("utf-8"),)
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from core.determinism.hashing import sha256_bytes
+from core.determinism.ledger import (
+    add_write_hook,
+    read_run_file,
+    remove_write_hook,
+    run_file_size,
+)
+from core.determinism.replay import RUN_FILES, discover_runs
+
+CATALOG_ENV = "IOTA_LEDGER_CATALOG"
+DEFAULT_CATALOG_PATH = "data/ledger/catalog.sqlite3"
+
+COLUMNS = (
+    "ledger_dir",
+    "layout",
+    "bundle_sha256",
+    "output_sha256",
+    "attestation_sha256",
+    "attestation_version",
+    "core_version",
+    "ruleset_id",
+    "manifest_sha256",
+    "created_utc",
+    "bundle_size",
+    "output_size",
+    "attestation_size",
+)
+INDEXED_COLUMNS = (
+    "bundle_sha256",
+    "output_sha256",
+    "attestation_sha256",
+    "core_version",
+    "ruleset_id",
+    "manifest_sha256",
+    "created_utc",
+)
+EQUALITY_FILTERS = INDEXED_COLUMNS[:-1]
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS runs ("
+    "ledger_dir TEXT PRIMARY KEY, layout TEXT NOT NULL, "
+    "bundle_sha256 TEXT NOT NULL, output_sha256 TEXT NOT NULL, "
+    "attestation_sha256 TEXT NOT NULL, attestation_version TEXT NOT NULL, "
+    "core_version TEXT NOT NULL, ruleset_id TEXT NOT NULL, "
+    "manifest_sha256 TEXT NOT NULL, created_utc TEXT NOT NULL, "
+    "bundle_size INTEGER NOT NULL, output_size INTEGER NOT NULL, "
+    "attestation_size INTEGER NOT NULL)",
+    *(
+        f"CREATE INDEX IF NOT EXISTS runs_{column} ON runs ({column})"
+        for column in INDEXED_COLUMNS
+    ),
+)
+
+
+def default_catalog_path() -> str:
+    return os.getenv(CATALOG_ENV) or DEFAULT_CATALOG_PATH
+
+
+def _catalog_key(ledger_dir: str | Path) -> str:
+    return Path(ledger_dir).resolve().as_posix()
+
+
+def _row(record: dict) -> tuple:
+    # Fields an invalid attestation lacks are catalogued as ""; replay rejects
+    # such runs, the catalog only indexes them.
+    attestation = record["attestation"]
+    return (
+        _catalog_key(record["ledger_dir"]),
+        record["layout"],
+        record["bundle_sha256"],
+        record["output_sha256"],
+        record["attestation_sha256"],
+        attestation.get("attestation_version", ""),
+        attestation.get("core_version", ""),
+        attestation.get("ruleset_id", ""),
+        attestation.get("manifest_sha256", ""),
+        attestation.get("created_utc", ""),
+        record["bundle_size"],
+        record["output_size"],
+        record["attestation_size"],
+    )
+
+
+def scan_run(run_dir: Path) -> dict:
+    attestation_bytes = read_run_file(run_dir, "attestation.json")
+    attestation = json.loads(attestation_bytes.decode("utf-8"))
+    sizes = {name: run_file_size(run_dir, name) for name in RUN_FILES}
+    return {
+        "ledger_dir": run_dir.as_posix(),
+        "layout": "loose" if run_dir.is_dir() else "store",
+        # The catalog indexes what the attestation records; replay verifies it.
+        "bundle_sha256": attestation.get("bundle_sha256", run_dir.name),
+        "output_sha256": attestation.get("output_sha256", ""),
+        "attestation_sha256": sha256_bytes(attestation_bytes),
+        "attestation": attestation,
+        "bundle_size": sizes["bundle.json"],
+        "output_size": sizes["output.json"],
+        "attestation_size": sizes["attestation.json"],
+    }
+
+
+class LedgerCatalog:
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = Path(db_path or default_catalog_path())
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, record: dict) -> None:
+        self.add_many([record])
+
+    def add_many(self, records: list[dict]) -> int:
+        rows = [_row(record) for record in records]
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._connect() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO runs VALUES ({placeholders})", rows
+            )
+        return len(rows)
+
+    def known_ledger_dirs(self) -> set[str]:
+        with self._connect() as connection:
+            return {
+                row[0] for row in connection.execute("SELECT ledger_dir FROM runs")
+            }
+
+    def backfill(self, ledger_root: str, *, full: bool = False) -> dict:
+        known = set() if full else self.known_ledger_dirs()
+        records = []
+        skipped = 0
+        for run_dir in discover_runs(ledger_root):
+            if _catalog_key(run_dir) in known:
+                skipped += 1
+                continue
+            records.append(scan_run(run_dir))
+        added = self.add_many(records)
+        return {"added": added, "skipped": skipped}
+
+    def query(
+        self,
+        *,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        limit: int | None = None,
+        **filters: str | None,
+    ) -> list[dict]:
+        unknown = sorted(set(filters) - set(EQUALITY_FILTERS))
+        if unknown:
+            raise ValueError(f"unknown catalog filter: {unknown[0]}")
+        clauses = []
+        params: list = []
+        for column in EQUALITY_FILTERS:
+            value = filters.get(column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if created_from is not None:
+            clauses.append("created_utc >= ?")
+            params.append(created_from)
+        if created_to is not None:
+            clauses.append("created_utc < ?")
+            params.append(created_to)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_utc, bundle_sha256, ledger_dir"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as connection:
+            rows = connection.execute(sql, params).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+
+def install_write_hook(db_path: str | Path | None = None):
+    catalog = LedgerCatalog(db_path)
+    hook = catalog.add
+    add_write_hook(hook)
+    return hook
+
+
+def uninstall_write_hook(hook) -> None:
+    remove_write_hook(hook)
+
+
+def _utc_days_ago(days: float) -> str:
+    moment = datetime.now(timezone.utc) - timedelta(days=days)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=None)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser("backfill")
+    backfill_parser.add_argument("ledger_root")
+    backfill_parser.add_argument("--full", action="store_true")
+
+    query_parser = subparsers.add_parser("query")
+    for column in EQUALITY_FILTERS:
+        query_parser.add_argument("--" + column.replace("_", "-"), dest=column)
+    query_parser.add_argument("--since", help="created_utc lower bound (inclusive)")
+    query_parser.add_argument("--until", help="created_utc upper bound (exclusive)")
+    query_parser.add_argument("--last-days", type=float)
+    query_parser.add_argument("--limit", type=int)
+    query_parser.add_argument("--count", action="store_true")
+    args = parser.parse_args(argv)
+
+    catalog = LedgerCatalog(args.db)
+    if args.command == "backfill":
+        result = catalog.backfill(args.ledger_root, full=args.full)
+        print(json.dumps(result, sort_keys=True))
+        return 0
+
+    created_from = args.since
+    if args.last_days is not None:
+        created_from = max(created_from or "", _utc_days_ago(args.last_days))
+    rows = catalog.query(
+        created_from=created_from,
+        created_to=args.until,
+        limit=args.limit,
+        **{column: getattr(args, column) for column in EQUALITY_FILTERS},
+    )
+    if args.count:
+        print(len(rows))
+        return 0
+    for row in rows:
+        sys.stdout.write(json.dumps(row, sort_keys=True) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
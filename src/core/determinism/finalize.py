@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from core.determinism.attest import build_attestation
 from core.determinism.bundle import build_evidence_bundle
-from core.determinism.canonical_json import dumps_canonical
-from core.determinism.hashing import sha256_bytes
+from core.determinism.canonical_json import (
+    dumps_canonical,
+    dumps_canonical_with_sha256,
+)
 
 
 def canonicalize_output(output_obj: object) -> bytes:
@@ -44,8 +46,7 @@ def finalize(
         )
 
     bundle_bytes, bundle_sha256 = build_evidence_bundle(evidence_bundle_obj)
-    output_bytes = canonicalize_output(output_obj)
-    output_sha256 = sha256_bytes(output_bytes)
+    output_bytes, output_sha256 = dumps_canonical_with_sha256(output_obj)
 
     attestation_obj = {
         "attestation_version": attestation_version,
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
 import unicodedata
 
+# Files at least this large are hashed through a read-only memory map instead
+# of being read into a bytes object first.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
 
 def _normalize_text(text: str) -> str:
     normalized = unicodedata.normalize("NFC", text)
@@ -15,3 +21,12 @@ def sha256_bytes(data: bytes) -> str:
 
 def sha256_text(text: str) -> str:
     return sha256_bytes(_normalize_text(text).encode("utf-8"))
+
+
+def sha256_file(path: str | os.PathLike) -> str:
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return sha256_bytes(handle.read())
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return hashlib.sha256(view).hexdigest()
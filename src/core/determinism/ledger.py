@@ -1,14 +1,77 @@
 from __future__ import annotations
 
+import json
+import logging
+from functools import lru_cache
 from pathlib import Path
 
-from core.determinism.hashing import sha256_bytes
+from core.determinism.blobstore import BlobStore
+from core.determinism.hashing import sha256_bytes, sha256_file
+
+LEDGER_LAYOUTS = ("loose", "store")
+
+_LOGGER = logging.getLogger(__name__)
+
+# Called with one record per successful write_run, e.g. to update the catalog.
+_WRITE_HOOKS: list = []
+
+
+def add_write_hook(hook) -> None:
+    if hook not in _WRITE_HOOKS:
+        _WRITE_HOOKS.append(hook)
+
+
+def remove_write_hook(hook) -> None:
+    if hook in _WRITE_HOOKS:
+        _WRITE_HOOKS.remove(hook)
+
+
+def _run_hooks(record: dict) -> None:
+    # The run is already on disk, so a failing hook (e.g. the catalog) must not
+    # fail write_run; catalog backfill picks the run up later.
+    for hook in list(_WRITE_HOOKS):
+        try:
+            hook(record)
+        except Exception:
+            _LOGGER.exception("ledger write hook failed for %s", record["ledger_dir"])
+
+
+@lru_cache(maxsize=64)
+def _ledger_store(ledger_root: str) -> BlobStore:
+    # Shared so the pack index and runs.log are parsed once per process.
+    return BlobStore.for_ledger(ledger_root)
 
 
 def ledger_path(root_dir: str, bundle_sha256: str) -> Path:
     return Path(root_dir) / bundle_sha256
 
 
+def read_run_file(run_dir: str | Path, name: str) -> bytes:
+    # run_dir is the ledger_path() of the run; files missing on disk are read
+    # from the content-addressed store under the same ledger root.
+    run_dir = Path(run_dir)
+    try:
+        return (run_dir / name).read_bytes()
+    except FileNotFoundError:
+        if run_dir.is_dir():
+            raise
+    return _ledger_store(str(run_dir.parent)).read_run_file(run_dir.name, name)
+
+
+def run_file_sha256(run_dir: str | Path, name: str) -> str:
+    path = Path(run_dir) / name
+    if path.is_file():
+        return sha256_file(path)
+    return sha256_bytes(read_run_file(run_dir, name))
+
+
+def run_file_size(run_dir: str | Path, name: str) -> int:
+    path = Path(run_dir) / name
+    if path.is_file():
+        return path.stat().st_size
+    return len(read_run_file(run_dir, name))
+
+
 def _write_atomic(path: Path, data: bytes) -> None:
     temp_path = path.with_name(f".{path.name}.tmp")
     temp_path.write_bytes(data)
@@ -32,6 +95,7 @@ def write_run(
     output_sha256: str,
     attestation_bytes: bytes,
     attestation_sha256: str,
+    layout: str = "loose",
 ) -> Path:
     if sha256_bytes(bundle_bytes) != bundle_sha256:
         raise ValueError("bundle_sha256 does not match bundle_bytes")
@@ -40,11 +104,34 @@ def write_run(
     if sha256_bytes(attestation_bytes) != attestation_sha256:
         raise ValueError("attestation_sha256 does not match attestation_bytes")
 
-    run_dir = ledger_path(ledger_root, bundle_sha256)
-    run_dir.mkdir(parents=True, exist_ok=True)
+    if layout not in LEDGER_LAYOUTS:
+        raise ValueError(f"unknown ledger layout: {layout}")
 
-    _write_or_verify(run_dir / "bundle.json", bundle_bytes)
-    _write_or_verify(run_dir / "output.json", output_bytes)
-    _write_or_verify(run_dir / "attestation.json", attestation_bytes)
+    run_dir = ledger_path(ledger_root, bundle_sha256)
+    if layout == "store":
+        store = _ledger_store(str(Path(ledger_root)))
+        store.put(bundle_bytes, bundle_sha256)
+        store.put(output_bytes, output_sha256)
+        store.put(attestation_bytes, attestation_sha256)
+        store.add_run(bundle_sha256, output_sha256, attestation_sha256)
+    else:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        _write_or_verify(run_dir / "bundle.json", bundle_bytes)
+        _write_or_verify(run_dir / "output.json", output_bytes)
+        _write_or_verify(run_dir / "attestation.json", attestation_bytes)
 
+    if _WRITE_HOOKS:
+        _run_hooks(
+            {
+                "ledger_dir": run_dir.as_posix(),
+                "layout": layout,
+                "bundle_sha256": bundle_sha256,
+                "output_sha256": output_sha256,
+                "attestation_sha256": attestation_sha256,
+                "attestation": json.loads(attestation_bytes.decode("utf-8")),
+                "bundle_size": len(bundle_bytes),
+                "output_size": len(output_bytes),
+                "attestation_size": len(attestation_bytes),
+            }
+        )
     return run_dir
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from core.determinism.canonical_json import dumps_canonical
+from core.determinism.hashing import sha256_bytes
+
+MERKLE_VERSION = "merkle-manifest.v1"
+MERKLE_FILENAME = "MANIFEST.merkle.json"
+ROOT_TREE = "."
+
+# A directory node hashes the sorted "<kind> <sha256> <name>\n" lines of its
+# direct children, where kind is "blob" for files and "tree" for directories,
+# so a subtree root depends only on the manifest entries below it. The "files"
+# digest of a directory hashes only its "blob" lines, which lets a diff tell a
+# changed file in a directory apart from a change further down.
+
+
+def parse_manifest(text: str) -> dict[str, str]:
+    entries = {}
+    for line in text.splitlines():
+        digest, separator, path = line.partition("  ")
+        if not separator:
+            raise ValueError(f"malformed manifest line: {line!r}")
+        entries[path] = digest
+    return entries
+
+
+def _parent(path: str) -> str:
+    head, _, _ = path.rpartition("/")
+    return head or ROOT_TREE
+
+
+def _name(path: str) -> str:
+    return path.rpartition("/")[2]
+
+
+def build_trees(entries: dict[str, str]) -> tuple[dict[str, str], dict[str, str]]:
+    children: dict[str, list[tuple[str, str, str]]] = {ROOT_TREE: []}
+    for path, digest in entries.items():
+        directory = _parent(path)
+        children.setdefault(directory, []).append((_name(path), "blob", digest))
+        while directory != ROOT_TREE:
+            directory = _parent(directory)
+            children.setdefault(directory, [])
+
+    files = {
+        directory: hashlib.sha256(_node_lines(items)).hexdigest()
+        for directory, items in children.items()
+    }
+    trees: dict[str, str] = {}
+    # Deepest directories first, so every child root exists before its parent.
+    for directory in sorted(children, key=lambda item: -item.count("/")):
+        if directory == ROOT_TREE:
+            continue
+        trees[directory] = hashlib.sha256(_node_lines(children[directory])).hexdigest()
+        children[_parent(directory)].append(
+            (_name(directory), "tree", trees[directory])
+        )
+    trees[ROOT_TREE] = hashlib.sha256(_node_lines(children[ROOT_TREE])).hexdigest()
+    return dict(sorted(trees.items())), dict(sorted(files.items()))
+
+
+def _node_lines(items: list[tuple[str, str, str]]) -> bytes:
+    return "".join(
+        f"{kind} {digest} {name}\n" for name, kind, digest in sorted(items)
+    ).encode("utf-8")
+
+
+def build_merkle_document(manifest_bytes: bytes) -> dict:
+    trees, files = build_trees(parse_manifest(manifest_bytes.decode("utf-8")))
+    return {
+        "version": MERKLE_VERSION,
+        "manifest_sha256": sha256_bytes(manifest_bytes),
+        "root_sha256": trees[ROOT_TREE],
+        "trees": trees,
+        "files": files,
+    }
+
+
+def dumps_merkle_document(document: dict) -> bytes:
+    return dumps_canonical(document) + b"\n"
+
+
+def load_merkle_document(path: str | Path) -> dict:
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("version") != MERKLE_VERSION:
+        raise ValueError(f"unsupported merkle manifest version: {path}")
+    return document
+
+
+def current_merkle_document(manifest_path: str | Path = "MANIFEST.sha256") -> dict:
+    # Reuses the shipped MANIFEST.merkle.json next to the manifest when it
+    # describes the same manifest bytes, and rebuilds it otherwise.
+    manifest_path = Path(manifest_path)
+    manifest_bytes = manifest_path.read_bytes()
+    merkle_path = manifest_path.with_name(MERKLE_FILENAME)
+    if merkle_path.exists():
+        document = load_merkle_document(merkle_path)
+        if document["manifest_sha256"] == sha256_bytes(manifest_bytes):
+            return document
+    return build_merkle_document(manifest_bytes)
+
+
+def _child_trees(trees: dict[str, str], directory: str) -> list[str]:
+    prefix = "" if directory == ROOT_TREE else directory + "/"
+    return [
+        path
+        for path in trees
+        if path != ROOT_TREE
+        and path.startswith(prefix)
+        and "/" not in path[len(prefix) :]
+    ]
+
+
+def diverged_subtrees(
+    expected: dict, actual: dict, directory: str = ROOT_TREE
+) -> list[str]:
+    # Takes two merkle documents and descends only into subtrees whose roots
+    # differ. A directory is reported when its own files changed, or when it
+    # exists on one side only.
+    expected_trees = expected["trees"]
+    actual_trees = actual["trees"]
+    if expected_trees.get(directory) == actual_trees.get(directory):
+        return []
+    if directory not in expected_trees or directory not in actual_trees:
+        return [directory]
+    diverged = []
+    if expected["files"][directory] != actual["files"][directory]:
+        diverged.append(directory)
+    children = set(_child_trees(expected_trees, directory))
+    children.update(_child_trees(actual_trees, directory))
+    for child in sorted(children):
+        diverged.extend(diverged_subtrees(expected, actual, child))
+    return diverged
+
+
+def mismatched_subtrees(expected: dict, actual: dict, prefixes: list[str]) -> list[str]:
+    # Compares only the named subtree roots, e.g. ["schemas", "src/core"].
+    mismatched = []
+    for prefix in prefixes:
+        tree = prefix.strip("/") or ROOT_TREE
+        if tree not in expected["trees"]:
+            raise ValueError(f"unknown manifest subtree: {tree}")
+        if expected["trees"][tree] != actual["trees"].get(tree):
+            mismatched.append(tree)
+    return mismatched
@@ -2,27 +2,50 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from core.determinism.hashing import sha256_bytes
+from core.determinism.blobstore import RUNS_FILENAME, STORE_DIRNAME, BlobStore
+from core.determinism.hashing import sha256_bytes, sha256_file
+from core.determinism.ledger import read_run_file, run_file_sha256, run_file_size
+from core.determinism.merkle_manifest import (
+    current_merkle_document,
+    diverged_subtrees,
+    load_merkle_document,
+    mismatched_subtrees,
+)
 from core.determinism.schema_validate import validate
 
+RUN_FILES = ("bundle.json", "output.json", "attestation.json")
 
-def verify_run(dir_path: str, *, strict_manifest: bool = False) -> dict:
+EXIT_OK = 0
+EXIT_MISMATCH = 1
+EXIT_NO_RUNS = 2
+
+
+def verify_run(
+    dir_path: str,
+    *,
+    strict_manifest: bool = False,
+    manifest_sha256: str | None = None,
+    merkle_baseline: dict | None = None,
+    required_subtrees: list[str] | None = None,
+) -> dict:
     run_dir = Path(dir_path)
-    bundle_bytes = (run_dir / "bundle.json").read_bytes()
-    output_bytes = (run_dir / "output.json").read_bytes()
-    attestation_bytes = (run_dir / "attestation.json").read_bytes()
+    attestation_bytes = read_run_file(run_dir, "attestation.json")
 
-    bundle_sha256 = sha256_bytes(bundle_bytes)
-    output_sha256 = sha256_bytes(output_bytes)
+    bundle_sha256 = run_file_sha256(run_dir, "bundle.json")
+    output_sha256 = run_file_sha256(run_dir, "output.json")
     attestation_sha256 = sha256_bytes(attestation_bytes)
 
     if run_dir.name != bundle_sha256:
         raise ValueError("ledger directory name does not match bundle_sha256")
 
     attestation = json.loads(attestation_bytes.decode("utf-8"))
-    validate(attestation, "schemas/attestation_record.schema.json")
+    validate(attestation, "schemas/attestation_record.schema.json", scope="seal")
 
     if attestation["bundle_sha256"] != bundle_sha256:
         raise ValueError("attestation bundle_sha256 mismatch")
@@ -30,30 +53,230 @@ def verify_run(dir_path: str, *, strict_manifest: bool = False) -> dict:
         raise ValueError("attestation output_sha256 mismatch")
 
     warnings: list[str] = []
-    manifest_path = Path("MANIFEST.sha256")
-    manifest_sha256 = sha256_bytes(manifest_path.read_bytes())
+    diverged: list[str] = []
+    if manifest_sha256 is None:
+        manifest_sha256 = sha256_file("MANIFEST.sha256")
     if attestation["manifest_sha256"] != manifest_sha256:
-        if strict_manifest:
-            raise ValueError("attestation manifest_sha256 mismatch")
-        warnings.append("manifest_sha256 mismatch")
+        if merkle_baseline is None:
+            if strict_manifest:
+                raise ValueError("attestation manifest_sha256 mismatch")
+            warnings.append("manifest_sha256 mismatch")
+        else:
+            diverged = _check_manifest_subtrees(
+                attestation["manifest_sha256"],
+                merkle_baseline,
+                required_subtrees,
+                strict_manifest=strict_manifest,
+                warnings=warnings,
+            )
 
-    return {
+    result = {
         "ok": True,
         "bundle_sha256": bundle_sha256,
         "output_sha256": output_sha256,
         "attestation_sha256": attestation_sha256,
         "warnings": warnings,
     }
+    if merkle_baseline is not None:
+        result["manifest_diverged_subtrees"] = diverged
+    return result
+
+
+def _check_manifest_subtrees(
+    attested_manifest_sha256: str,
+    merkle_baseline: dict,
+    required_subtrees: list[str] | None,
+    *,
+    strict_manifest: bool,
+    warnings: list[str],
+) -> list[str]:
+    # merkle_baseline is the MANIFEST.merkle.json of the manifest the run was
+    # sealed with; it turns a flat mismatch into the list of changed subtrees.
+    if merkle_baseline["manifest_sha256"] != attested_manifest_sha256:
+        raise ValueError("merkle baseline does not describe the attested manifest")
+    current = current_merkle_document()
+    diverged = diverged_subtrees(merkle_baseline, current)
+    if required_subtrees:
+        mismatched = mismatched_subtrees(merkle_baseline, current, required_subtrees)
+        if mismatched and strict_manifest:
+            raise ValueError(
+                "attestation manifest subtree mismatch: " + ", ".join(mismatched)
+            )
+        if mismatched:
+            warnings.append("manifest subtree mismatch: " + ", ".join(mismatched))
+        return diverged
+    if strict_manifest:
+        raise ValueError(
+            "attestation manifest_sha256 mismatch in: " + ", ".join(diverged)
+        )
+    warnings.append("manifest_sha256 mismatch in: " + ", ".join(diverged))
+    return diverged
+
+
+def discover_runs(ledger_root: str) -> list[Path]:
+    root = Path(ledger_root)
+    run_dirs = {
+        path.parent
+        for path in root.rglob("attestation.json")
+        if all((path.parent / name).is_file() for name in RUN_FILES)
+    }
+    # A blob store is the objects/ directory of a ledger root that has a
+    # runs.log, so other objects/ directories (e.g. .git/objects) are skipped.
+    for runs_log in root.rglob(RUNS_FILENAME):
+        objects_dir = runs_log.parent
+        if objects_dir.name == STORE_DIRNAME and runs_log.is_file():
+            run_dirs.update(
+                objects_dir.parent / bundle_sha256
+                for bundle_sha256 in BlobStore(objects_dir).runs()
+            )
+    return sorted(run_dirs)
+
+
+def _run_bytes(run_dir: Path) -> int:
+    # Store-layout runs have no files under run_dir; their blobs are measured.
+    total = 0
+    for name in RUN_FILES:
+        try:
+            total += run_file_size(run_dir, name)
+        except (OSError, ValueError):
+            pass
+    return total
+
+
+def _verify_task(task: tuple[str, dict]) -> dict:
+    path, options = task
+    record = {"path": path, "bytes": _run_bytes(Path(path))}
+    try:
+        result = verify_run(path, **options)
+    except ValueError as exc:
+        return {**record, "status": "mismatch", "error": str(exc), "warnings": []}
+    except Exception as exc:
+        return {
+            **record,
+            "status": "error",
+            "error": f"{type(exc).__name__}: {exc}",
+            "warnings": [],
+        }
+    if "manifest_diverged_subtrees" in result:
+        record["manifest_diverged_subtrees"] = result["manifest_diverged_subtrees"]
+    return {
+        **record,
+        "status": "ok",
+        "bundle_sha256": result["bundle_sha256"],
+        "output_sha256": result["output_sha256"],
+        "attestation_sha256": result["attestation_sha256"],
+        "warnings": result["warnings"],
+    }
+
+
+def verify_all(
+    ledger_root: str,
+    *,
+    strict_manifest: bool = False,
+    workers: int | None = None,
+    manifest_path: str = "MANIFEST.sha256",
+    merkle_baseline: dict | None = None,
+    required_subtrees: list[str] | None = None,
+) -> dict:
+    started = time.perf_counter()
+    # Hashed once here and handed to every worker instead of once per run.
+    manifest_sha256 = sha256_file(manifest_path)
+    options = {
+        "strict_manifest": strict_manifest,
+        "manifest_sha256": manifest_sha256,
+        "merkle_baseline": merkle_baseline,
+        "required_subtrees": required_subtrees,
+    }
+    tasks = [(str(run_dir), options) for run_dir in discover_runs(ledger_root)]
+    max_workers = max(1, workers or os.cpu_count() or 1)
+    if max_workers == 1 or len(tasks) <= 1:
+        runs = [_verify_task(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            runs = list(pool.map(_verify_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    bytes_hashed = sum(run["bytes"] for run in runs)
+    return {
+        "ledger_root": str(ledger_root),
+        "manifest_sha256": manifest_sha256,
+        "strict_manifest": strict_manifest,
+        "workers": max_workers,
+        "totals": {
+            "runs": len(runs),
+            "ok": sum(1 for run in runs if run["status"] == "ok"),
+            "mismatch": sum(1 for run in runs if run["status"] == "mismatch"),
+            "error": sum(1 for run in runs if run["status"] == "error"),
+            "warnings": sum(1 for run in runs if run["warnings"]),
+        },
+        "bytes_hashed": bytes_hashed,
+        "elapsed_seconds": round(elapsed, 6),
+        "runs_per_second": round(len(runs) / elapsed, 3) if elapsed else 0.0,
+        "mb_per_second": round(bytes_hashed / elapsed / 1e6, 3) if elapsed else 0.0,
+        "runs": runs,
+    }
+
+
+def summary_exit_code(summary: dict) -> int:
+    totals = summary["totals"]
+    if totals["runs"] == 0:
+        return EXIT_NO_RUNS
+    if totals["mismatch"] or totals["error"]:
+        return EXIT_MISMATCH
+    return EXIT_OK
+
+
+def _main_all(args: argparse.Namespace, merkle_baseline: dict | None) -> int:
+    summary = verify_all(
+        args.all,
+        strict_manifest=args.strict_manifest,
+        workers=args.workers,
+        merkle_baseline=merkle_baseline,
+        required_subtrees=args.subtree,
+    )
+    text = json.dumps(summary, indent=2, sort_keys=True) + "\n"
+    if args.summary_out:
+        Path(args.summary_out).write_text(text, encoding="utf-8")
+    sys.stdout.write(text)
+    return summary_exit_code(summary)
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser()
-    parser.add_argument("path")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--all", metavar="LEDGER_ROOT")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--summary-out")
     parser.add_argument("--strict-manifest", action="store_true")
+    parser.add_argument(
+        "--merkle-baseline",
+        help="MANIFEST.merkle.json of the manifest the run(s) were sealed with",
+    )
+    parser.add_argument(
+        "--subtree",
+        action="append",
+        help="only require this manifest subtree to match (repeatable)",
+    )
     args = parser.parse_args(argv)
 
+    if (args.path is None) == (args.all is None):
+        parser.error("pass exactly one of <path> or --all <ledger_root>")
+    if args.subtree and not args.merkle_baseline:
+        parser.error("--subtree requires --merkle-baseline")
+    merkle_baseline = None
+    if args.merkle_baseline:
+        merkle_baseline = load_merkle_document(args.merkle_baseline)
+    if args.all is not None:
+        return _main_all(args, merkle_baseline)
+
     try:
-        result = verify_run(args.path, strict_manifest=args.strict_manifest)
+        result = verify_run(
+            args.path,
+            strict_manifest=args.strict_manifest,
+            merkle_baseline=merkle_baseline,
+            required_subtrees=args.subtree,
+        )
     except Exception as exc:
         print(f"Replay verification failed: {exc}")
         return 1
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 
 try:
@@ -21,6 +28,22 @@ _TYPE_MAP = {
 }
 
 
+VALIDATION_POLICIES = ("per_item", "boundary", "off-for-trusted-internal")
+VALIDATION_POLICY_ENV = "IOTA_VALIDATION_POLICY"
+
+# Every validate() call declares what it is checking. A policy skips the scopes
+# ranked below its threshold; "seal" checks always run.
+_SCOPE_RANK = {"item": 0, "internal": 1, "io": 2, "seal": 3}
+_POLICY_THRESHOLD = {
+    "per_item": _SCOPE_RANK["item"],
+    "boundary": _SCOPE_RANK["io"],
+    "off-for-trusted-internal": _SCOPE_RANK["seal"],
+}
+_POLICY_OVERRIDE: ContextVar[str | None] = ContextVar(
+    "validation_policy", default=None
+)
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
@@ -143,15 +166,147 @@ def _minimal_validate(
                 _minimal_validate(value, item_schema, root_schema, f"{path}[{index}]")
 
 
-def validate(instance, schema_path: str | Path) -> None:
+@dataclass
+class _CompiledSchema:
+    signature: tuple[int, int]
+    content_sha256: str
+    raw_schema: dict
+    validator: object | None
+
+
+class _ValidatorRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, _CompiledSchema] = {}
+        self._hits = 0
+        self._misses = 0
+        self._compiles = 0
+        self._invalidations = 0
+        self._compile_seconds = 0.0
+
+    def _compile(self, schema_file: Path, data: bytes, signature) -> _CompiledSchema:
+        start = time.perf_counter()
+        raw_schema = json.loads(data.decode("utf-8"))
+        validator = None
+        if jsonschema is not None:
+            validator = jsonschema.Draft202012Validator(raw_schema)
+        entry = _CompiledSchema(
+            signature=signature,
+            content_sha256=hashlib.sha256(data).hexdigest(),
+            raw_schema=raw_schema,
+            validator=validator,
+        )
+        self._compiles += 1
+        self._compile_seconds += time.perf_counter() - start
+        return entry
+
+    def get(self, schema_file: Path) -> _CompiledSchema:
+        stat = os.stat(schema_file)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(schema_file)
+            if entry is not None and entry.signature == signature:
+                self._hits += 1
+                return entry
+
+            data = schema_file.read_bytes()
+            if entry is not None:
+                if hashlib.sha256(data).hexdigest() == entry.content_sha256:
+                    # Touched but unchanged: keep the compiled validator.
+                    entry.signature = signature
+                    self._hits += 1
+                    return entry
+                self._invalidations += 1
+            self._misses += 1
+            entry = self._compile(schema_file, data, signature)
+            self._entries[schema_file] = entry
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._compiles = 0
+            self._invalidations = 0
+            self._compile_seconds = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "compiles": self._compiles,
+                "invalidations": self._invalidations,
+                "compile_seconds": round(self._compile_seconds, 6),
+                "backend": "jsonschema" if jsonschema is not None else "minimal",
+            }
+
+
+_REGISTRY = _ValidatorRegistry()
+
+
+def _resolve_schema_path(schema_path: str | Path) -> Path:
     schema_file = Path(schema_path)
     if not schema_file.is_absolute():
         schema_file = _repo_root() / schema_file
+    return schema_file.resolve()
+
 
-    raw_schema = json.loads(schema_file.read_text(encoding="utf-8"))
-    if jsonschema is not None:
-        validator = jsonschema.Draft202012Validator(raw_schema)
-        errors = sorted(validator.iter_errors(instance), key=lambda err: err.path)
+def preload_schemas(schema_dir: str | Path = "schemas") -> int:
+    schema_root = _resolve_schema_path(schema_dir)
+    count = 0
+    for schema_file in sorted(schema_root.glob("*.schema.json")):
+        _REGISTRY.get(schema_file.resolve())
+        count += 1
+    return count
+
+
+def validator_cache_stats() -> dict:
+    return _REGISTRY.stats()
+
+
+def clear_validator_cache() -> None:
+    _REGISTRY.clear()
+
+
+def _check_policy(policy: str) -> str:
+    if policy not in _POLICY_THRESHOLD:
+        raise ValueError(f"unknown validation policy: {policy}")
+    return policy
+
+
+def current_validation_policy() -> str:
+    policy = _POLICY_OVERRIDE.get()
+    if policy is None:
+        policy = os.environ.get(VALIDATION_POLICY_ENV, "").strip() or "per_item"
+    return _check_policy(policy)
+
+
+@contextmanager
+def validation_policy(policy: str | None):
+    if policy is None:
+        yield current_validation_policy()
+        return
+    token = _POLICY_OVERRIDE.set(_check_policy(policy))
+    try:
+        yield policy
+    finally:
+        _POLICY_OVERRIDE.reset(token)
+
+
+def validate(instance, schema_path: str | Path, *, scope: str = "seal") -> None:
+    if scope not in _SCOPE_RANK:
+        raise ValueError(f"unknown validation scope: {scope}")
+    if _SCOPE_RANK[scope] < _POLICY_THRESHOLD[current_validation_policy()]:
+        return
+
+    compiled = _REGISTRY.get(_resolve_schema_path(schema_path))
+    if compiled.validator is not None:
+        errors = sorted(
+            compiled.validator.iter_errors(instance), key=lambda err: err.path
+        )
         if errors:
             first = errors[0]
             path = "$"
@@ -160,4 +315,4 @@ def validate(instance, schema_path: str | Path) -> None:
             raise ValueError(f"{path}: {first.message}")
         return
 
-    _minimal_validate(instance, raw_schema, raw_schema)
+    _minimal_validate(instance, compiled.raw_schema, compiled.raw_schema)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from core.determinism.hashing import sha256_text
+
+
+class TextStore:
+    """Chunk and artifact texts keyed by text_sha256.
+
+    Each distinct text is hashed once and kept once: sha256() memoizes the
+    digest, and add() records an occurrence and returns the stored string so
+    repeated texts share one object.
+    """
+
+    def __init__(self) -> None:
+        self._digests: dict[str, str] = {}
+        self._texts: dict[str, str] = {}
+        self._sizes: dict[str, int] = {}
+        self.hashed = 0
+        self.occurrences = 0
+        self.occurrence_bytes = 0
+
+    def sha256(self, text: str) -> str:
+        digest = self._digests.get(text)
+        if digest is None:
+            digest = sha256_text(text)
+            self._digests[text] = digest
+            self.hashed += 1
+        return digest
+
+    def add(self, text: str, text_sha256: str | None = None) -> str:
+        """Records one occurrence of text and returns the string to keep.
+
+        Only digests computed by the store are kept: a given text_sha256 is
+        checked against sha256(text), which hashes each distinct text once.
+        """
+        digest = self.sha256(text)
+        if text_sha256 is not None and text_sha256 != digest:
+            raise ValueError("text_sha256 does not match text")
+        stored = self._texts.setdefault(digest, text)
+        size = self._sizes.get(digest)
+        if size is None:
+            size = self._sizes[digest] = len(text.encode("utf-8"))
+        self.occurrences += 1
+        self.occurrence_bytes += size
+        # Texts that differ only before normalization share a digest but not
+        # a string; only an identical text may be swapped for the stored one.
+        return stored if stored == text else text
+
+    def get(self, text_sha256: str) -> str:
+        return self._texts[text_sha256]
+
+    def __contains__(self, text_sha256: str) -> bool:
+        return text_sha256 in self._texts
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def report(self) -> dict:
+        unique_bytes = sum(self._sizes.values())
+        return {
+            "occurrences": self.occurrences,
+            "unique_texts": len(self._texts),
+            "hashed_texts": self.hashed,
+            "bytes": self.occurrence_bytes,
+            "unique_bytes": unique_bytes,
+            "dedup_ratio": (
+                round(self.occurrence_bytes / unique_bytes, 4) if unique_bytes else 1.0
+            ),
+        }
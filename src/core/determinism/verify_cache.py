@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from core.determinism.hashing import sha256_file
+from core.determinism.replay import RUN_FILES, verify_run
+
+CACHE_FILENAME = ".verify_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verified_runs (
+    ledger_dir TEXT NOT NULL,
+    strict_manifest INTEGER NOT NULL,
+    manifest_sha256 TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    result_json TEXT NOT NULL,
+    verified_at REAL NOT NULL,
+    PRIMARY KEY (ledger_dir, strict_manifest)
+)
+"""
+
+_STATS_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+_MANIFEST_DIGESTS: dict[str, tuple[tuple[int, int, int], str]] = {}
+
+
+def _bump(counter: str) -> None:
+    with _STATS_LOCK:
+        _STATS[counter] += 1
+
+
+def verification_cache_stats() -> dict:
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
+def _manifest_sha256(manifest_path: str) -> str:
+    # Re-hashed only when the manifest file itself changes on disk.
+    stat = Path(manifest_path).stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _MANIFEST_DIGESTS.get(manifest_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    digest = sha256_file(manifest_path)
+    _MANIFEST_DIGESTS[manifest_path] = (signature, digest)
+    return digest
+
+
+def ledger_fingerprint(run_dir: Path) -> str:
+    # ctime is included because it cannot be set back from user space, so a
+    # rewrite that restores the old mtime still invalidates the entry.
+    parts = []
+    for name in RUN_FILES:
+        stat = (run_dir / name).stat()
+        parts.append(
+            f"{name}:{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ctime_ns}"
+            f":{stat.st_dev}:{stat.st_ino}"
+        )
+    return ";".join(parts)
+
+
+class VerificationCache:
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # WAL lets several API workers read while one of them records a result.
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(_SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def get(
+        self,
+        ledger_dir: str,
+        *,
+        strict_manifest: bool,
+        manifest_sha256: str,
+        fingerprint: str,
+        ttl_seconds: float,
+    ) -> dict | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT manifest_sha256, fingerprint, result_json, verified_at "
+                "FROM verified_runs WHERE ledger_dir = ? AND strict_manifest = ?",
+                (ledger_dir, int(strict_manifest)),
+            ).fetchone()
+        if row is None:
+            return None
+        if row[0] != manifest_sha256 or row[1] != fingerprint:
+            return None
+        if time.time() - row[3] >= ttl_seconds:
+            return None
+        return json.loads(row[2])
+
+    def put(
+        self,
+        ledger_dir: str,
+        *,
+        strict_manifest: bool,
+        manifest_sha256: str,
+        fingerprint: str,
+        result: dict,
+    ) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO verified_runs VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    ledger_dir,
+                    int(strict_manifest),
+                    manifest_sha256,
+                    fingerprint,
+                    json.dumps(result, sort_keys=True),
+                    time.time(),
+                ),
+            )
+
+    def discard(self, ledger_dir: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM verified_runs WHERE ledger_dir = ?", (ledger_dir,)
+            )
+
+
+def default_cache_path(run_dir: Path) -> Path:
+    return run_dir.parent / CACHE_FILENAME
+
+
+def verify_run_cached(
+    dir_path: str,
+    *,
+    strict_manifest: bool = False,
+    force_rehash: bool = False,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    cache_path: str | Path | None = None,
+    manifest_path: str = "MANIFEST.sha256",
+    verifier=verify_run,
+) -> dict:
+    run_dir = Path(dir_path)
+    try:
+        ledger_key = str(run_dir.resolve())
+        fingerprint = ledger_fingerprint(run_dir)
+        manifest_sha256 = _manifest_sha256(manifest_path)
+    except OSError:
+        # Missing files are reported by the verifier itself; nothing to cache.
+        return verifier(dir_path, strict_manifest=strict_manifest)
+
+    cache = VerificationCache(cache_path or default_cache_path(run_dir))
+    if not force_rehash and ttl_seconds > 0:
+        try:
+            cached = cache.get(
+                ledger_key,
+                strict_manifest=strict_manifest,
+                manifest_sha256=manifest_sha256,
+                fingerprint=fingerprint,
+                ttl_seconds=ttl_seconds,
+            )
+        except sqlite3.Error:
+            _bump("errors")
+            cached = None
+        if cached is not None:
+            _bump("hits")
+            return cached
+    _bump("misses")
+
+    try:
+        result = verifier(dir_path, strict_manifest=strict_manifest)
+    except Exception:
+        try:
+            cache.discard(ledger_key)
+        except sqlite3.Error:
+            _bump("errors")
+        raise
+
+    try:
+        cache.put(
+            ledger_key,
+            strict_manifest=strict_manifest,
+            manifest_sha256=manifest_sha256,
+            fingerprint=fingerprint,
+            result=result,
+        )
+        _bump("stores")
+    except sqlite3.Error:
+        _bump("errors")
+    return result
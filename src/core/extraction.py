@@ -1,5 +1,7 @@
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -32,68 +34,83 @@ def tokenize(text: str):
     return tokens
 
 
-def segment(text: str, abbreviations=None):
-    abbreviations = abbreviations or set()
+_SENTENCE_BREAK = re.compile(r"[\n.!?]")
+_SPACE_RUN = re.compile(r"\s*")
+_WORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'")
+# Splitters consume their character; conjunctions are zero-width lookaheads so
+# overlapping ones (" and yet ") are all seen in the same pass.
+_CLAUSE_MARKS = re.compile(r"[;:\u2014\u2013]|(?= (and|but|yet) )")
+_SPLITTER_RANK = {";": 0, ":": 1, "\u2014": 2, "\u2013": 3}
+
+
+def _last_word(text: str, end: int) -> str:
+    # Same word as re.search(r"[A-Za-z']+$", text[:end]), whose "$" also
+    # matches before a single trailing newline.
+    if end and text[end - 1] == "\n":
+        end -= 1
+    begin = end
+    while begin and text[begin - 1] in _WORD_CHARS:
+        begin -= 1
+    return text[begin:end].lower()
+
+
+def _sentence_spans(text: str, abbreviations):
     sentence_spans = []
     start = 0
-    i = 0
-    length = len(text)
-    while i < length:
-        ch = text[i]
-        if ch == "\n":
-            end = i
-            if end > start:
-                sentence_spans.append((start, end))
-            i += 1
-            while i < length and text[i].isspace():
-                i += 1
-            start = i
-            continue
-        if ch in ".!?":
-            last_word_match = re.search(r"[A-Za-z']+$", text[:i])
-            last_word = last_word_match.group(0).lower() if last_word_match else ""
+    match = _SENTENCE_BREAK.search(text)
+    while match is not None:
+        i = match.start()
+        if text[i] == "\n":
+            if i > start:
+                sentence_spans.append((start, i))
+        else:
+            last_word = _last_word(text, i)
             if last_word and last_word in abbreviations:
-                i += 1
+                match = _SENTENCE_BREAK.search(text, i + 1)
                 continue
-            end = i + 1
-            sentence_spans.append((start, end))
-            i = end
-            while i < length and text[i].isspace():
-                i += 1
-            start = i
-            continue
-        i += 1
-    if start < length:
-        sentence_spans.append((start, length))
+            sentence_spans.append((start, i + 1))
+        start = _SPACE_RUN.match(text, i + 1).end()
+        match = _SENTENCE_BREAK.search(text, start)
+    if start < len(text):
+        sentence_spans.append((start, len(text)))
+    return sentence_spans
+
+
+def segment(text: str, abbreviations=None):
+    abbreviations = abbreviations or set()
+    sentence_spans = _sentence_spans(text, abbreviations)
 
     segments = []
     boundaries = []
-    clause_splitters = [";", ":", "—", "–"]
-    clause_conj = [" and ", " but ", " yet "]
     for s_idx, (s_start, s_end) in enumerate(sentence_spans):
-        sentence_text = text[s_start:s_end]
-        clause_starts = [0]
-        for splitter in clause_splitters:
-            for match in re.finditer(re.escape(splitter), sentence_text):
-                clause_starts.append(match.end())
-                boundaries.append(
-                    {"boundary": s_start + match.start(), "type": "punct"}
-                )
-        for conj in clause_conj:
-            for match in re.finditer(re.escape(conj), sentence_text):
-                clause_starts.append(match.start())
-        clause_starts = sorted(
-            set([c for c in clause_starts if 0 <= c < len(sentence_text)])
+        sentence_length = s_end - s_start
+        clause_starts = {0}
+        splits = []
+        # finditer() keeps each conjunction's own matches non-overlapping.
+        conj_ends = {}
+        for match in _CLAUSE_MARKS.finditer(text, s_start, s_end):
+            conj = match.group(1)
+            if conj is None:
+                clause_starts.add(match.end() - s_start)
+                splits.append((_SPLITTER_RANK[match.group(0)], match.start()))
+            elif match.start() >= conj_ends.get(conj, s_start):
+                clause_starts.add(match.start() - s_start)
+                conj_ends[conj] = match.start() + len(conj) + 2
+        # Boundaries are grouped by splitter, in _SPLITTER_RANK order.
+        splits.sort()
+        boundaries.extend(
+            {"boundary": position, "type": "punct"} for _, position in splits
         )
-        clause_starts.append(len(sentence_text))
+        clause_starts = sorted(c for c in clause_starts if c < sentence_length)
+        clause_starts.append(sentence_length)
         for c_idx in range(len(clause_starts) - 1):
             c_start = clause_starts[c_idx]
             c_end = clause_starts[c_idx + 1]
-            clause_text = sentence_text[c_start:c_end].strip()
-            if not clause_text:
-                continue
             token_start = s_start + c_start
             token_end = s_start + c_end
+            clause_text = text[token_start:token_end].strip()
+            if not clause_text:
+                continue
             segments.append(
                 {
                     "sentence_id": s_idx,
@@ -106,34 +123,207 @@ def segment(text: str, abbreviations=None):
     return segments, boundaries, sentence_spans
 
 
+class SpanIndex:
+    # Segments from segment() are ordered by token_start and never overlap, so
+    # the segment holding a position is the last one starting at or before it.
+    def __init__(self, segments):
+        self.segments = sorted(segments, key=lambda seg: seg["token_start"])
+        self._starts = [seg["token_start"] for seg in self.segments]
+        self._clauses = {}
+        for seg in segments:
+            self._clauses.setdefault(seg["clause_id"], seg)
+
+    def segment_at(self, position):
+        idx = bisect_right(self._starts, position) - 1
+        if idx >= 0 and position < self.segments[idx]["token_end"]:
+            return self.segments[idx]
+        return None
+
+    def sentence_at(self, position, default=0):
+        seg = self.segment_at(position)
+        return seg["sentence_id"] if seg else default
+
+    def clause_id_at(self, position):
+        seg = self.segment_at(position)
+        return seg["clause_id"] if seg else None
+
+    def clause(self, clause_id):
+        return self._clauses.get(clause_id)
+
+
+class MatchIndex:
+    # Sorted (start, end, label) match tuples with bisect lookups by start.
+    def __init__(self, matches):
+        self.matches = sorted(matches)
+        self._starts = [match[0] for match in self.matches]
+
+    def last_in(self, lower, upper):
+        # Largest match starting in [lower, upper).
+        idx = bisect_left(self._starts, upper)
+        if idx > 0 and lower <= self._starts[idx - 1] < upper:
+            return self.matches[idx - 1]
+        return None
+
+    def first_in(self, lower, upper):
+        # Smallest match starting in [lower, upper).
+        idx = bisect_left(self._starts, lower)
+        if idx < len(self._starts) and self._starts[idx] < upper:
+            return self.matches[idx]
+        return None
+
+
+def index_coref_links(coref_links):
+    by_span = {}
+    for link in coref_links:
+        by_span.setdefault(tuple(link["from"]["token_span"]), link["to"])
+    return by_span
+
+
+class EntityMatcher:
+    # Merges every (label, pattern) pair into one alternation, so a single scan
+    # finds each position where some pattern matches. Patterns are then matched
+    # at that position, keeping re.finditer's rule that a pattern's matches
+    # never overlap each other. Patterns with groups or differing flags, and
+    # empty matches, fall back to one finditer per pattern.
+    def __init__(self, patterns):
+        self.patterns = tuple(
+            (label, re.compile(pattern)) for label, pattern in patterns
+        )
+        self._combined = _combine_patterns(self.patterns)
+
+    def finditer(self, text):
+        # (label, match) pairs ordered by start, then by pattern order.
+        if self._combined is None:
+            return self._finditer_each(text)
+        found = []
+        ends = [0] * len(self.patterns)
+        candidate = self._combined.search(text)
+        while candidate is not None:
+            start = candidate.start()
+            for idx, (label, pattern) in enumerate(self.patterns):
+                if start < ends[idx]:
+                    continue
+                match = pattern.match(text, start)
+                if match is None:
+                    continue
+                if match.end() == start:
+                    return self._finditer_each(text)
+                ends[idx] = match.end()
+                found.append((label, match))
+            candidate = self._combined.search(text, start + 1)
+        return found
+
+    def spans(self, text):
+        return [
+            (match.start(), match.end(), label) for label, match in self.finditer(text)
+        ]
+
+    def _finditer_each(self, text):
+        found = [
+            (match.start(), idx, label, match)
+            for idx, (label, pattern) in enumerate(self.patterns)
+            for match in pattern.finditer(text)
+        ]
+        found.sort(key=lambda item: item[:2])
+        return [(label, match) for _, _, label, match in found]
+
+
+def _combine_patterns(patterns):
+    if not patterns:
+        return None
+    flags = patterns[0][1].flags
+    for _, pattern in patterns:
+        if pattern.groups or pattern.flags != flags:
+            return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{pattern.pattern})" for _, pattern in patterns), flags
+        )
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(patterns):
+    return EntityMatcher(patterns)
+
+
+def entity_matcher(patterns):
+    # Reuses the compiled matcher for a pattern list seen before.
+    if isinstance(patterns, EntityMatcher):
+        return patterns
+    try:
+        return _cached_matcher(tuple(tuple(pair) for pair in patterns))
+    except TypeError:
+        return EntityMatcher(patterns)
+
+
 def extract_entities(text: str, segments, patterns):
     entities = []
-    for label, pattern in patterns:
-        for match in re.finditer(pattern, text):
-            entities.append(
-                {
-                    "label": label,
-                    "token_span": [match.start(), match.end()],
-                    "surface": match.group(0),
-                }
-            )
+    for label, match in entity_matcher(patterns).finditer(text):
+        entities.append(
+            {
+                "label": label,
+                "token_span": [match.start(), match.end()],
+                "surface": match.group(0),
+            }
+        )
     entities.sort(key=lambda e: (e["token_span"][0], e["label"]))
     return entities
 
 
-def resolve_references(segments, entities, pronoun_map, lookback_sentences=2):
-    candidate_mentions = []
+class MentionWindow:
+    # Candidate mentions bucketed by sentence_id, then by (gender, number).
+    # Each bucket keeps only its latest mention (the first one added on a
+    # token_start tie), which is the one recency would pick from it, so a
+    # pronoun looks at lookback_sentences + 1 sentences of a few buckets each
+    # instead of every mention in the text.
+    def __init__(self, lookback_sentences=2):
+        self.lookback_sentences = lookback_sentences
+        self._sentences = {}
+        self._order = 0
+
+    def add(self, sentence_id, token_start, label, gender=None, number=None):
+        buckets = self._sentences.setdefault(sentence_id, {})
+        key = (gender, number)
+        best = buckets.get(key)
+        if best is None or token_start > best[0]:
+            # Ranked by token_start, then by insertion order on ties.
+            buckets[key] = (token_start, -self._order, label)
+        self._order += 1
+
+    def resolve(self, sentence_id, gender, number):
+        # The label of the mention in the nearest earlier-or-same sentence that
+        # agrees with (gender, number), latest token_start first; None if none.
+        for distance in range(self.lookback_sentences + 1):
+            buckets = self._sentences.get(sentence_id - distance)
+            if not buckets:
+                continue
+            chosen = None
+            for (c_gender, c_number), mention in buckets.items():
+                if gender in {"M", "F"} and c_gender and c_gender != gender:
+                    continue
+                if number == "P" and c_number and c_number != "P":
+                    continue
+                if chosen is None or mention[:2] > chosen[:2]:
+                    chosen = mention
+            if chosen is not None:
+                return chosen[2]
+        return None
+
+
+def resolve_references(
+    segments, entities, pronoun_map, lookback_sentences=2, span_index=None
+):
+    span_index = span_index or SpanIndex(segments)
+    window = MentionWindow(lookback_sentences)
     for ent in entities:
-        sent_id = _sentence_for_span(segments, ent["token_span"][0])
-        candidate_mentions.append(
-            {
-                "label": ent["label"],
-                "gender": ent.get("gender"),
-                "number": ent.get("number"),
-                "sentence_id": sent_id,
-                "token_start": ent["token_span"][0],
-                "role": "subject",
-            }
+        window.add(
+            span_index.sentence_at(ent["token_span"][0]),
+            ent["token_span"][0],
+            ent["label"],
+            ent.get("gender"),
+            ent.get("number"),
         )
 
     coref_links = []
@@ -147,19 +337,8 @@ def resolve_references(segments, entities, pronoun_map, lookback_sentences=2):
             start = seg["token_start"] + match.start()
             end = seg["token_start"] + match.end()
             gender, number = pronoun_map.get(pronoun.lower(), ("N", "S"))
-            lookback = [
-                c
-                for c in candidate_mentions
-                if 0 <= seg["sentence_id"] - c["sentence_id"] <= lookback_sentences
-            ]
-            filtered = []
-            for c in lookback:
-                if gender in {"M", "F"} and c.get("gender") and c["gender"] != gender:
-                    continue
-                if number == "P" and c.get("number") and c["number"] != "P":
-                    continue
-                filtered.append(c)
-            if not filtered:
+            label = window.resolve(seg["sentence_id"], gender, number)
+            if label is None:
                 unknown_state[gender] += 1
                 unknown_id = f"unknown_{gender}_{unknown_state[gender]}"
                 coref_links.append(
@@ -174,17 +353,13 @@ def resolve_references(segments, entities, pronoun_map, lookback_sentences=2):
                     }
                 )
                 continue
-            filtered.sort(
-                key=lambda c: (seg["sentence_id"] - c["sentence_id"], -c["token_start"])
-            )
-            chosen = filtered[0]
             rule = "recency"
             coref_links.append(
                 {
                     "from": {"token_span": [start, end], "surface_pronoun": pronoun},
-                    "to": chosen["label"],
+                    "to": label,
                     "rule": rule,
-                    "evidence": f"resolved {pronoun} to {chosen['label']} by {rule}",
+                    "evidence": f"resolved {pronoun} to {label} by {rule}",
                 }
             )
     for idx, link in enumerate(coref_links):
@@ -192,25 +367,23 @@ def resolve_references(segments, entities, pronoun_map, lookback_sentences=2):
     return coref_links
 
 
-def _sentence_for_span(segments, token_start):
-    for seg in segments:
-        if seg["token_start"] <= token_start < seg["token_end"]:
-            return seg["sentence_id"]
-    return 0
-
-
 def extract_relationships(
-    text: str, segments, verbs, entity_patterns, pronoun_map, coref_links=None
+    text: str,
+    segments,
+    verbs,
+    entity_patterns,
+    pronoun_map,
+    coref_links=None,
+    span_index=None,
+    entity_matches=None,
 ):
-    coref_links = coref_links or []
+    span_index = span_index or SpanIndex(segments)
+    coref_by_span = index_coref_links(coref_links or [])
     frames = []
     unknown_actor_state = 0
 
-    entity_matches = []
-    for label, pattern in entity_patterns:
-        for match in re.finditer(pattern, text):
-            entity_matches.append((match.start(), match.end(), label))
-    entity_matches.sort()
+    if entity_matches is None:
+        entity_matches = entity_matcher(entity_patterns).spans(text)
 
     pronoun_pattern = re.compile(
         r"\b(he|she|they|him|her|them|his|their|it|its)\b", re.IGNORECASE
@@ -218,39 +391,30 @@ def extract_relationships(
     pronoun_matches = [
         (m.start(), m.end(), m.group(1)) for m in pronoun_pattern.finditer(text)
     ]
+    matches = MatchIndex(entity_matches + pronoun_matches)
 
     for verb in verbs:
-        clause = next(
-            (s for s in segments if s["clause_id"] == verb["clause_id"]), None
-        )
+        clause = span_index.clause(verb["clause_id"])
         if not clause:
             continue
         clause_start = clause["token_start"]
         clause_end = clause["token_end"]
         verb_start = verb["token_span"][0]
 
-        local_entities = [
-            m for m in entity_matches if clause_start <= m[0] < clause_end
-        ]
-        local_pronouns = [
-            m for m in pronoun_matches if clause_start <= m[0] < clause_end
-        ]
-        matches = local_entities + local_pronouns
-        before = [m for m in matches if m[0] < verb_start]
-        after = [m for m in matches if m[0] > verb_start]
-
         actor = None
+        before = matches.last_in(clause_start, min(verb_start, clause_end))
         if before:
-            start, end, label = sorted(before)[-1]
-            actor = _resolve_pronoun_label([start, end], coref_links) or label
+            start, end, label = before
+            actor = coref_by_span.get((start, end)) or label
         else:
             unknown_actor_state += 1
             actor = f"unknown_actor_{unknown_actor_state}"
 
         obj = None
+        after = matches.first_in(max(verb_start + 1, clause_start), clause_end)
         if after:
-            start, end, label = sorted(after)[0]
-            obj = _resolve_pronoun_label([start, end], coref_links) or label
+            start, end, label = after
+            obj = coref_by_span.get((start, end)) or label
 
         suffix = text[verb_start:clause_end]
         io_match = re.search(r"\b(to|for)\s+([^,.;!?]+)", suffix)
@@ -306,10 +470,3 @@ def extract_relationships(
     for idx, frame in enumerate(frames):
         frame["id"] = f"frame_{idx}"
     return frames
-
-
-def _resolve_pronoun_label(token_span, coref_links):
-    for link in coref_links:
-        if link["from"]["token_span"] == token_span:
-            return link["to"]
-    return None
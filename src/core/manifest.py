@@ -17,8 +17,25 @@ def load_manifest(path: Path) -> tuple[dict, str]:
     return records, manifest_sha256
 
 
+_MANIFEST_CACHE: dict[str, tuple[tuple[int, int, int], tuple[dict, str]]] = {}
+
+
+def load_manifest_cached(path: Path) -> tuple[dict, str]:
+    # Re-parsed only when the file changes on disk, so resolving many refs
+    # against one manifest reads it once. Callers must not mutate the records.
+    stat = Path(path).stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = str(Path(path).resolve())
+    cached = _MANIFEST_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    loaded = load_manifest(Path(path))
+    _MANIFEST_CACHE[key] = (signature, loaded)
+    return loaded
+
+
 def resolve_input(ref: str, manifest_path: Path) -> dict:
-    records, manifest_sha256 = load_manifest(manifest_path)
+    records, manifest_sha256 = load_manifest_cached(manifest_path)
     if ref not in records:
         raise ValueError(f"ref not found in manifest: {ref}")
     entry = records[ref]
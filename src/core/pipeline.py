@@ -1,17 +1,39 @@
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 
 from core import attestation, templates
 from core.governance import GOVERNANCE_METADATA, build_neurosymbolic_boundary
 
 
+@lru_cache(maxsize=1)
+def generator_sha256() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
 class DeterministicPipeline:
+    # process() is the only generator: modes such as core.pipeline_stream swap
+    # how the input is normalized and how JSON is encoded and hashed through
+    # the methods below, and must leave the sealed bytes unchanged.
+
     def __init__(self, domain_name, extractor, template_dir, manifest_path=None):
         self.domain = domain_name
         self.extractor = extractor
         self.template_dir = Path(template_dir)
         self.manifest_path = Path(manifest_path) if manifest_path else None
 
+    def normalize(self, input_data):
+        return self.extractor.normalize_input(input_data)
+
+    def hash_json(self, data) -> str:
+        return attestation.compute_sha256(attestation.canonicalize_json(data))
+
+    def write_json(self, path: Path, data) -> str:
+        return attestation.write_json(path, data)
+
+    def log_lines(self) -> list[str]:
+        return []
+
     def process(
         self,
         input_ref,
@@ -21,16 +43,26 @@ class DeterministicPipeline:
         output_dir: Path,
         input_meta: dict | None = None,
         provenance_meta: dict | None = None,
+        timed: bool = False,
     ):
-        normalized = self.extractor.normalize_input(input_data)
-        extracted = self.extractor.extract(normalized, context)
+        input_sha256 = attestation.sha256_bytes(input_bytes)
+        normalized = self.normalize(input_data)
+        if timed:
+            # Wall-clock timings are not deterministic, so they only reach the
+            # provenance extras, never the extraction or the output.
+            extracted, timings = self.extractor.extract_timed(normalized, context)
+            provenance_meta = {**(provenance_meta or {}), "extraction_timings": timings}
+        else:
+            extracted = self.extractor.extract(normalized, context)
         evidence_map = self.extractor.build_evidence_map(extracted, normalized)
         fallback = self.extractor.template_fallback(input_ref, context, normalized)
-        template = templates.load_template(input_ref, self.template_dir, chain=fallback)
+        template = templates.template_registry().lookup(
+            input_ref, self.template_dir, chain=fallback
+        )
         render_context = self.extractor.build_context(
             input_ref, input_data, normalized, extracted, evidence_map, context
         )
-        rendered = templates.resolve_placeholders(template, render_context)
+        rendered = template.render(render_context)
 
         output_data = self.extractor.render_output(
             input_ref,
@@ -42,23 +74,19 @@ class DeterministicPipeline:
             context,
         )
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_json_path = output_dir / "output.json"
-        output_sha256 = attestation.write_json(output_json_path, output_data)
-
-        extraction_sha256 = attestation.compute_sha256(
-            attestation.canonicalize_json(
-                {"extracted": extracted, "evidence_map": evidence_map}
-            )
+        extraction_sha256 = self.hash_json(
+            {"extracted": extracted, "evidence_map": evidence_map}
         )
-        input_sha256 = attestation.sha256_bytes(input_bytes)
-        template_sha256 = template.get("_template_sha256", "")
-        generator_sha256 = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+        # Only what output_data still references survives the output write.
+        del extracted, evidence_map, render_context, rendered
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_sha256 = self.write_json(output_dir / "output.json", output_data)
 
         extra = {
             "domain": self.domain,
             "input_ref": input_ref,
-            "template_path": template.get("_template_path"),
+            "template_path": template.path,
             "context": context,
             "input_meta": input_meta or {},
         }
@@ -73,22 +101,20 @@ class DeterministicPipeline:
         provenance = attestation.build_provenance_chain(
             input_sha256=input_sha256,
             extraction_sha256=extraction_sha256,
-            template_sha256=template_sha256,
+            template_sha256=template.sha256,
             output_sha256=output_sha256,
-            generator_sha256=generator_sha256,
+            generator_sha256=generator_sha256(),
             extra=extra,
         )
 
         attestation.write_json(output_dir / "provenance.json", provenance)
         attestation.write_text(output_dir / "attestation.sha256", output_sha256 + "\n")
-        attestation.write_text(
-            output_dir / "log.txt",
-            (
-                f"deterministic_ai domain={self.domain}\n"
-                "files_written=output.json, provenance.json, "
-                "attestation.sha256, log.txt\n"
-            ),
-        )
+        log_lines = [
+            f"deterministic_ai domain={self.domain}",
+            "files_written=output.json, provenance.json, attestation.sha256, log.txt",
+            *self.log_lines(),
+        ]
+        attestation.write_text(output_dir / "log.txt", "\n".join(log_lines) + "\n")
 
         return {
             "output_data": output_data,
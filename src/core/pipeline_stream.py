@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import io
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+from core import attestation
+from core.pipeline import DeterministicPipeline
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def iter_paragraphs(handle: TextIO) -> Iterator[str]:
+    # Runs of lines between whitespace-only lines; the handle must translate
+    # "\r\n" and "\r" to "\n" (newline=None).
+    lines: list[str] = []
+    for line in handle:
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def normalize_by_paragraph(extractor, input_data: str | None) -> str:
+    handle = io.StringIO(input_data, newline=None)
+    paragraphs = (extractor.normalize_input(item) for item in iter_paragraphs(handle))
+    return "\n\n".join(item for item in paragraphs if item)
+
+
+def peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StreamingPipeline(DeterministicPipeline):
+    # Runs DeterministicPipeline.process with bounded-memory strategies, so the
+    # sealed bytes and generator_sha256 are those of the in-memory path. JSON
+    # is encoded and hashed in bounded chunks instead of one string per
+    # document. Extractors whose normalize_input works per blank-line
+    # paragraph set normalizes_paragraphs to be fed one paragraph at a time.
+
+    def normalize(self, input_data):
+        if getattr(self.extractor, "normalizes_paragraphs", False):
+            return normalize_by_paragraph(self.extractor, input_data)
+        return self.extractor.normalize_input(input_data)
+
+    def hash_json(self, data) -> str:
+        return attestation.sha256_json_stream(data)
+
+    def write_json(self, path: Path, data) -> str:
+        return attestation.write_json_stream(path, data)
+
+    def log_lines(self) -> list[str]:
+        peak = peak_rss_bytes()
+        return [
+            "mode=streaming",
+            f"peak_rss_bytes={peak if peak is not None else 'unknown'}",
+        ]
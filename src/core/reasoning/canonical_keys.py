@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from json.encoder import encode_basestring
+
+from core.determinism.canonical_json import canonical_key
+
+# Typed fast paths for the record shapes the reasoning modules sort most often.
+# Each returns the same fragment tuple canonical_key() would build, or None when
+# the record does not have exactly the expected shape, in which case sort_key()
+# falls back to the generic encoder. Only ASCII strings take a fast path, so no
+# NFC normalization is ever needed here.
+
+_EVIDENCE_REF_FIELDS = frozenset(
+    {"source_id", "chunk_id", "offset_start", "offset_end", "text_sha256"}
+)
+_CAUSAL_EDGE_FIELDS = frozenset(
+    {"from_event_id", "to_event_id", "type", "reason_code", "confidence", "evidence"}
+)
+_VIOLATION_FIELDS = frozenset({"type", "events", "entities", "reason", "evidence"})
+_EVIDENCE_WRAPPER_FIELDS = frozenset({"evidence"})
+_UNKNOWN_REF_FIELDS = frozenset({"event_id"})
+
+
+def _is_ascii_str(value) -> bool:
+    return type(value) is str and value.isascii()
+
+
+@lru_cache(maxsize=65536)
+def _evidence_ref_fragments(
+    source_id: str,
+    chunk_id: str,
+    offset_start: int,
+    offset_end: int,
+    text_sha256: str,
+) -> tuple[str, ...]:
+    return (
+        "{",
+        '"chunk_id":' + encode_basestring(chunk_id) + ",",
+        '"offset_end":' + int.__repr__(offset_end) + ",",
+        '"offset_start":' + int.__repr__(offset_start) + ",",
+        '"source_id":' + encode_basestring(source_id) + ",",
+        '"text_sha256":' + encode_basestring(text_sha256) + "}",
+    )
+
+
+def evidence_ref_key(ref: dict) -> tuple[str, ...] | None:
+    if type(ref) is not dict or ref.keys() != _EVIDENCE_REF_FIELDS:
+        return None
+    source_id = ref["source_id"]
+    chunk_id = ref["chunk_id"]
+    offset_start = ref["offset_start"]
+    offset_end = ref["offset_end"]
+    text_sha256 = ref["text_sha256"]
+    if not (
+        _is_ascii_str(source_id)
+        and _is_ascii_str(chunk_id)
+        and _is_ascii_str(text_sha256)
+        and type(offset_start) is int
+        and type(offset_end) is int
+    ):
+        return None
+    return _evidence_ref_fragments(
+        source_id, chunk_id, offset_start, offset_end, text_sha256
+    )
+
+
+def _evidence_list_text(evidence) -> str | None:
+    if type(evidence) is not list:
+        return None
+    parts = []
+    for ref in evidence:
+        fragments = evidence_ref_key(ref)
+        if fragments is None:
+            return None
+        parts.append("".join(fragments))
+    return "[" + ",".join(parts) + "]"
+
+
+def _ascii_list_text(values) -> str | None:
+    if type(values) is not list:
+        return None
+    parts = []
+    for value in values:
+        if not _is_ascii_str(value):
+            return None
+        parts.append(encode_basestring(value))
+    return "[" + ",".join(parts) + "]"
+
+
+def causal_edge_key(edge: dict) -> tuple[str, ...] | None:
+    if type(edge) is not dict or edge.keys() != _CAUSAL_EDGE_FIELDS:
+        return None
+    text_fields = (
+        edge["confidence"],
+        edge["from_event_id"],
+        edge["reason_code"],
+        edge["to_event_id"],
+        edge["type"],
+    )
+    if not all(_is_ascii_str(value) for value in text_fields):
+        return None
+    evidence_text = _evidence_list_text(edge["evidence"])
+    if evidence_text is None:
+        return None
+    return (
+        "{",
+        '"confidence":' + encode_basestring(edge["confidence"]) + ",",
+        '"evidence":' + evidence_text + ",",
+        '"from_event_id":' + encode_basestring(edge["from_event_id"]) + ",",
+        '"reason_code":' + encode_basestring(edge["reason_code"]) + ",",
+        '"to_event_id":' + encode_basestring(edge["to_event_id"]) + ",",
+        '"type":' + encode_basestring(edge["type"]) + "}",
+    )
+
+
+def violation_key(violation: dict) -> tuple[str, ...] | None:
+    if type(violation) is not dict or violation.keys() != _VIOLATION_FIELDS:
+        return None
+    if not (_is_ascii_str(violation["reason"]) and _is_ascii_str(violation["type"])):
+        return None
+    entities_text = _ascii_list_text(violation["entities"])
+    events_text = _ascii_list_text(violation["events"])
+    evidence_text = _evidence_list_text(violation["evidence"])
+    if entities_text is None or events_text is None or evidence_text is None:
+        return None
+    return (
+        "{",
+        '"entities":' + entities_text + ",",
+        '"events":' + events_text + ",",
+        '"evidence":' + evidence_text + ",",
+        '"reason":' + encode_basestring(violation["reason"]) + ",",
+        '"type":' + encode_basestring(violation["type"]) + "}",
+    )
+
+
+def evidence_wrapper_key(wrapper: dict) -> tuple[str, ...] | None:
+    # The {"evidence": [...]} wrapper used to order edges and violations.
+    if type(wrapper) is not dict or wrapper.keys() != _EVIDENCE_WRAPPER_FIELDS:
+        return None
+    evidence_text = _evidence_list_text(wrapper["evidence"])
+    if evidence_text is None:
+        return None
+    return ("{", '"evidence":' + evidence_text + "}")
+
+
+def unknown_ref_key(ref: dict) -> tuple[str, ...] | None:
+    if type(ref) is not dict or ref.keys() != _UNKNOWN_REF_FIELDS:
+        return None
+    event_id = ref["event_id"]
+    if not _is_ascii_str(event_id):
+        return None
+    return ("{", '"event_id":' + encode_basestring(event_id) + "}")
+
+
+# Candidate fast paths by field count, so sort_key() only tries plausible ones.
+_FAST_PATHS = {
+    1: (evidence_wrapper_key, unknown_ref_key),
+    5: (evidence_ref_key, violation_key),
+    6: (causal_edge_key,),
+}
+
+
+def sort_key(obj) -> tuple[str, ...]:
+    if type(obj) is dict:
+        for fast_path in _FAST_PATHS.get(len(obj), ()):
+            key = fast_path(obj)
+            if key is not None:
+                return key
+    return canonical_key(obj)
@@ -215,5 +215,5 @@ def build_casefile(
             artifact["sha256"] = casefile_sha
             break
     casefile["artifacts"] = sorted(casefile["artifacts"], key=_artifacts_sort_key)
-    validate(casefile, "schemas/casefile.schema.json")
+    validate(casefile, "schemas/casefile.schema.json", scope="io")
     return casefile
@@ -7,6 +7,7 @@ from itertools import combinations
 
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 
 _BACKTICK_RE = re.compile(r"`([^`]+)`")
 _UPPER_TOKEN_RE = re.compile(r"\b[A-Z][A-Z0-9_]{2,}\b")
@@ -45,10 +46,6 @@ _SECRET_NEVER_TERMS = ("never in source", "never in repo")
 _SECRET_ENV_TERMS = ("environment only", "env-only")
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _normalize_text(text: str) -> str:
     normalized = unicodedata.normalize("NFC", text)
     return normalized.replace("\r\n", "\n").replace("\r", "\n")
@@ -178,7 +175,7 @@ def _before_edge(
         "confidence": _CONFIDENCE_BY_REASON[reason_code],
         "evidence": _sort_evidence_refs(evidence),
     }
-    validate(edge, "schemas/causal_edge.schema.json")
+    validate(edge, "schemas/causal_edge.schema.json", scope="item")
     return edge
 
 
@@ -198,7 +195,7 @@ def _edge_from_rule(
         "confidence": _CONFIDENCE_BY_REASON[reason_code],
         "evidence": _sort_evidence_refs(evidence),
     }
-    validate(edge, "schemas/causal_edge.schema.json")
+    validate(edge, "schemas/causal_edge.schema.json", scope="item")
     return edge
 
 
@@ -219,8 +216,10 @@ def _register_edge(edges_by_key: dict[tuple[str, str, str], dict], edge: dict) -
     }
 
 
-def _add_finding(findings_by_key: dict[tuple[str, str], dict], finding: dict) -> None:
-    key = (finding["code"], _sort_key(finding))
+def _add_finding(
+    findings_by_key: dict[tuple[str, tuple[str, ...]], dict], finding: dict
+) -> None:
+    key = (finding["code"], sort_key(finding))
     findings_by_key[key] = finding
 
 
@@ -341,14 +340,14 @@ def _compute_causal_order(
 
 
 def compute_causal_graph(world_model: dict) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
 
     events = sorted(world_model["events"], key=_event_sort_key)
     events_by_id = {event["event_id"]: event for event in events}
     node_ids = [event["event_id"] for event in events]
     unknowns_by_event = _unknowns_by_event(world_model)
     edges_by_key: dict[tuple[str, str, str], dict] = {}
-    findings_by_key: dict[tuple[str, str], dict] = {}
+    findings_by_key: dict[tuple[str, tuple[str, ...]], dict] = {}
 
     known_events = [event for event in events if event["time"]["kind"] != "unknown"]
     for left, right in combinations(known_events, 2):
@@ -467,7 +466,7 @@ def compute_causal_graph(world_model: dict) -> dict:
 
     for conflict in sorted(
         world_model["conflicts"],
-        key=lambda item: (item["kind"], _sort_key(item["ref"])),
+        key=lambda item: (item["kind"], sort_key(item["ref"])),
     ):
         event_ids = conflict["ref"].get("event_ids", [])
         if not isinstance(event_ids, list):
@@ -497,7 +496,7 @@ def compute_causal_graph(world_model: dict) -> dict:
             edge["from_event_id"],
             edge["to_event_id"],
             edge["reason_code"],
-            _sort_key({"evidence": edge["evidence"]}),
+            sort_key({"evidence": edge["evidence"]}),
         ),
     )
     before_edges = [edge for edge in edges if edge["type"] == "before"]
@@ -525,7 +524,7 @@ def compute_causal_graph(world_model: dict) -> dict:
             ),
         )
     ]
-    validate(findings, "schemas/causal_findings.schema.json")
+    validate(findings, "schemas/causal_findings.schema.json", scope="item")
     causal_graph = {
         "version": "1.0",
         "nodes": node_ids,
@@ -535,5 +534,5 @@ def compute_causal_graph(world_model: dict) -> dict:
     }
     if cycle_nodes:
         causal_graph["causal_order"] = []
-    validate(causal_graph, "schemas/causal_graph.schema.json")
+    validate(causal_graph, "schemas/causal_graph.schema.json", scope="internal")
     return causal_graph
@@ -4,10 +4,6 @@ from core.determinism.canonical_json import dumps_canonical
 from core.determinism.schema_validate import validate
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _line_budget(sections: list[dict], max_lines: int) -> list[dict]:
     if max_lines <= 0:
         return [{"title": section["title"], "lines": []} for section in sections]
@@ -37,9 +33,12 @@ def render_causal_narrative_v2(
     max_lines: int = 200,
     verbosity: str = "brief",
 ) -> dict:
-    validate(causal_graph, "schemas/causal_graph.schema.json")
+    validate(causal_graph, "schemas/causal_graph.schema.json", scope="internal")
     if verification_result is not None:
-        validate(verification_result, "schemas/verification_result.schema.json")
+        validate(
+            verification_result, "schemas/verification_result.schema.json",
+            scope="internal",
+        )
 
     has_cycle = any(
         finding["code"] == "CYCLE_TEMPORAL_CONSTRAINT"
@@ -78,7 +77,7 @@ def render_causal_narrative_v2(
             + ", ".join(finding["event_ids"])
         )
         if verbosity == "full" and "details" in finding:
-            line += f" details={_sort_key(finding['details'])}"
+            line += f" details={dumps_canonical(finding['details']).decode('utf-8')}"
         finding_lines.append(line)
 
     sections = [
@@ -101,5 +100,5 @@ def render_causal_narrative_v2(
             "first_causal_order": causal_graph["causal_order"][:10],
         },
     }
-    validate(narrative, "schemas/causal_narrative_v2.schema.json")
+    validate(narrative, "schemas/causal_narrative_v2.schema.json", scope="internal")
     return narrative
@@ -28,7 +28,7 @@ def claim_fingerprint(claim: dict) -> str:
 
 
 def build_claim_graph(graph_obj: dict) -> dict:
-    validate(graph_obj, "schemas/claim_graph.schema.json")
+    validate(graph_obj, "schemas/claim_graph.schema.json", scope="internal")
     return graph_obj
 
 
@@ -92,5 +92,5 @@ def find_duplicates_and_contradictions(graph_obj: dict) -> dict:
             key=lambda item: (item["claim_a"], item["claim_b"], item["reason"]),
         ),
     }
-    validate(findings, "schemas/graph_findings.schema.json")
+    validate(findings, "schemas/graph_findings.schema.json", scope="internal")
     return findings
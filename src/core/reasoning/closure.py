@@ -105,5 +105,5 @@ def compute_closure(graph_obj: dict) -> dict:
             key=lambda item: (item["type"], item["from_id"], item["to_id"]),
         ),
     }
-    validate(result, "schemas/derived_edges.schema.json")
+    validate(result, "schemas/derived_edges.schema.json", scope="internal")
     return result
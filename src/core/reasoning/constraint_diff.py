@@ -3,13 +3,10 @@ from __future__ import annotations
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 from core.reasoning.world_diff import load_output_input
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _unwrap_output_and_meta(raw_output: dict) -> tuple[dict, dict]:
     if "output" in raw_output and isinstance(raw_output["output"], dict):
         return raw_output["output"], raw_output.get("__meta__", {})
@@ -24,7 +21,7 @@ def _extract_constraint_report(raw_output: dict) -> tuple[dict, dict]:
         report = output_obj["output"]["constraint_report"]
     else:
         raise ValueError("sealed output missing constraint_report")
-    validate(report, "schemas/constraint_report.schema.json")
+    validate(report, "schemas/constraint_report.schema.json", scope="internal")
     return report, meta
 
 
@@ -86,7 +83,7 @@ def _sort_violation(
         tuple(violation["events"]),
         tuple(violation["entities"]),
         violation["reason"],
-        _sort_key({"evidence": violation["evidence"]}),
+        sort_key({"evidence": violation["evidence"]}),
     )
 
 
@@ -175,7 +172,7 @@ def compute_constraint_diff(*, old_output: dict, new_output: dict) -> dict:
             "changed": len(changed),
         },
     }
-    validate(diff, "schemas/constraint_diff.schema.json")
+    validate(diff, "schemas/constraint_diff.schema.json", scope="internal")
     return diff
 
 
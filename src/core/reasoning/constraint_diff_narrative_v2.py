@@ -37,7 +37,7 @@ def render_constraint_diff_narrative_v2(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(diff, "schemas/constraint_diff.schema.json")
+    validate(diff, "schemas/constraint_diff.schema.json", scope="internal")
     summary_lines = [
         (
             "Delta: "
@@ -95,5 +95,8 @@ def render_constraint_diff_narrative_v2(
             "verification_new": diff["verification_change"]["new"],
         },
     }
-    validate(narrative, "schemas/constraint_diff_narrative_v2.schema.json")
+    validate(
+        narrative, "schemas/constraint_diff_narrative_v2.schema.json",
+        scope="internal",
+    )
     return narrative
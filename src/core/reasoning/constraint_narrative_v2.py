@@ -32,7 +32,10 @@ def render_constraint_narrative_v2(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(constraint_report, "schemas/constraint_report.schema.json")
+    validate(
+        constraint_report, "schemas/constraint_report.schema.json",
+        scope="internal",
+    )
     violations = constraint_report["violations"]
     summary_lines = [
         f"Violations: {len(violations)}",
@@ -82,5 +85,5 @@ def render_constraint_narrative_v2(
             "state_count": constraint_report["counts"]["state"],
         },
     }
-    validate(narrative, "schemas/constraint_narrative_v2.schema.json")
+    validate(narrative, "schemas/constraint_narrative_v2.schema.json", scope="internal")
     return narrative
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from collections import defaultdict
 
-from core.determinism.canonical_json import dumps_canonical
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 
 _POLICY_NEVER_SOURCE_TERMS = (
     "must never appear in source",
@@ -29,10 +29,6 @@ _STATE_NEGATIONS = {
 }
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _sort_evidence_refs(evidence_refs: list[dict]) -> list[dict]:
     unique_refs = {
         (
@@ -76,7 +72,7 @@ def _build_violation(
         "reason": reason,
         "evidence": _sort_evidence_refs(evidence),
     }
-    validate(violation, "schemas/constraint_violation.schema.json")
+    validate(violation, "schemas/constraint_violation.schema.json", scope="item")
     return violation
 
 
@@ -118,7 +114,7 @@ def _temporal_conflicts(
     causal_graph: dict,
 ) -> list[dict]:
     violations = []
-    for edge in sorted(causal_graph["edges"], key=_sort_key):
+    for edge in sorted(causal_graph["edges"], key=sort_key):
         if edge["type"] != "before":
             continue
         from_event = events_by_id[edge["from_event_id"]]
@@ -143,7 +139,7 @@ def _temporal_conflicts(
 
 def _causal_conflicts(events_by_id: dict[str, dict], causal_graph: dict) -> list[dict]:
     violations = []
-    for edge in sorted(causal_graph["edges"], key=_sort_key):
+    for edge in sorted(causal_graph["edges"], key=sort_key):
         if edge["type"] != "causes":
             continue
         from_event = events_by_id[edge["from_event_id"]]
@@ -215,8 +211,8 @@ def _state_conflicts(events: list[dict]) -> list[dict]:
 
 
 def compute_constraints(world_model: dict, causal_graph: dict) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
-    validate(causal_graph, "schemas/causal_graph.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
+    validate(causal_graph, "schemas/causal_graph.schema.json", scope="internal")
 
     events = sorted(world_model["events"], key=_time_sort_key)
     events_by_id = {event["event_id"]: event for event in events}
@@ -233,7 +229,7 @@ def compute_constraints(world_model: dict, causal_graph: dict) -> dict:
             tuple(item["events"]),
             tuple(item["entities"]),
             item["reason"],
-            _sort_key({"evidence": item["evidence"]}),
+            sort_key({"evidence": item["evidence"]}),
         ),
     )
     report = {
@@ -254,5 +250,5 @@ def compute_constraints(world_model: dict, causal_graph: dict) -> dict:
             ),
         },
     }
-    validate(report, "schemas/constraint_report.schema.json")
+    validate(report, "schemas/constraint_report.schema.json", scope="internal")
     return report
@@ -30,10 +30,6 @@ def _manifest_sha256() -> str:
     return sha256_bytes((_repo_root() / "MANIFEST.sha256").read_bytes())
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _write_atomic(path: Path, data: bytes) -> None:
     temp_path = path.with_name(f".{path.name}.tmp")
     temp_path.write_bytes(data)
@@ -156,7 +152,7 @@ def _normalize_legacy_task(task: dict) -> dict:
 
 def _validate_and_finalize_task(task: dict) -> dict:
     normalized = _normalize_legacy_task(task)
-    validate(normalized, "schemas/counterfactual_task.schema.json")
+    validate(normalized, "schemas/counterfactual_task.schema.json", scope="internal")
     return normalized
 
 
@@ -171,7 +167,7 @@ def _counterfactual_task_error(expected_task_id: str) -> ValueError:
 def canonicalize_counterfactual_task(task: dict) -> bytes:
     final_task = _validate_and_finalize_task(task)
     final_task["task_id"] = compute_counterfactual_task_id(final_task)
-    validate(final_task, "schemas/counterfactual_task.schema.json")
+    validate(final_task, "schemas/counterfactual_task.schema.json", scope="internal")
     return dumps_canonical(final_task)
 
 
@@ -189,7 +185,7 @@ def load_counterfactual_task(path: str) -> tuple[dict, bytes]:
     expected_task_id = compute_counterfactual_task_id(normalized_task)
     if normalized_task.get("task_id", "") != expected_task_id:
         raise _counterfactual_task_error(expected_task_id)
-    validate(normalized_task, "schemas/counterfactual_task.schema.json")
+    validate(normalized_task, "schemas/counterfactual_task.schema.json", scope="seal")
     return normalized_task, dumps_canonical(normalized_task)
 
 
@@ -347,7 +343,7 @@ def _normalize_world_model(world_model: dict) -> dict:
         "conflicts": _build_conflicts(events, entities),
     }
     normalized["world_sha256"] = _compute_world_sha256(normalized)
-    validate(normalized, "schemas/world_model.schema.json")
+    validate(normalized, "schemas/world_model.schema.json", scope="internal")
     return normalized
 
 
@@ -358,7 +354,7 @@ def _load_attestation(source_kind: str, source_path: Path) -> tuple[dict, bytes,
         attestation_path = _load_sibling(source_path, ["attestation.json"])
     attestation_bytes = attestation_path.read_bytes()
     attestation_obj = json.loads(attestation_bytes.decode("utf-8"))
-    validate(attestation_obj, "schemas/attestation_record.schema.json")
+    validate(attestation_obj, "schemas/attestation_record.schema.json", scope="seal")
     return attestation_obj, attestation_bytes, sha256_bytes(attestation_bytes)
 
 
@@ -372,7 +368,7 @@ def _load_bundle(source_kind: str, source_path: Path) -> tuple[dict, bytes, str]
         )
     bundle_bytes = bundle_path.read_bytes()
     bundle_obj = json.loads(bundle_bytes.decode("utf-8"))
-    validate(bundle_obj, "schemas/evidence_bundle.schema.json")
+    validate(bundle_obj, "schemas/evidence_bundle.schema.json", scope="seal")
     return bundle_obj, bundle_bytes, sha256_bytes(bundle_bytes)
 
 
@@ -426,7 +422,7 @@ def _validate_base_task_hashes(task: dict, base_loaded: dict) -> None:
 
 
 def apply_counterfactual(world_model: dict, operation: dict) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
     operation_type = operation["type"]
     target_id = operation["target_id"]
     updated = deepcopy(world_model)
@@ -517,7 +513,7 @@ def run_counterfactual_task(
     out_dir: str,
     mode_override: str | None = None,
 ) -> dict:
-    validate(task, "schemas/counterfactual_task.schema.json")
+    validate(task, "schemas/counterfactual_task.schema.json", scope="internal")
     expected_task_id = compute_counterfactual_task_id(task)
     if task.get("task_id") != expected_task_id:
         raise _counterfactual_task_error(expected_task_id)
@@ -611,7 +607,7 @@ def run_counterfactual_task(
             "counterfactual_path": "",
         },
     }
-    validate(diff, "schemas/world_diff.schema.json")
+    validate(diff, "schemas/world_diff.schema.json", scope="internal")
     planned_files = {
         "task.json": dumps_canonical(task),
         "output.json": sealed["output_bytes"],
@@ -640,8 +636,14 @@ def run_counterfactual_task(
             base_output=base_output,
             counterfactual_output=counterfactual_output,
         )
-        validate(result_obj, "schemas/counterfactual_result.schema.json")
-        validate(narrative_obj, "schemas/counterfactual_narrative_v2.schema.json")
+        validate(
+            result_obj, "schemas/counterfactual_result.schema.json",
+            scope="internal",
+        )
+        validate(
+            narrative_obj, "schemas/counterfactual_narrative_v2.schema.json",
+            scope="internal",
+        )
         planned_files["counterfactual_result.json"] = result_bytes
         planned_files["counterfactual_narrative_v2.json"] = dumps_canonical(
             narrative_obj
@@ -34,9 +34,12 @@ def render_counterfactual_narrative_v2(
     base_output: dict,
     counterfactual_output: dict,
 ) -> dict:
-    validate(task, "schemas/counterfactual_task.schema.json")
-    validate(result, "schemas/counterfactual_result.schema.json")
-    validate(world_diff_narrative, "schemas/world_diff_narrative.schema.json")
+    validate(task, "schemas/counterfactual_task.schema.json", scope="internal")
+    validate(result, "schemas/counterfactual_result.schema.json", scope="internal")
+    validate(
+        world_diff_narrative, "schemas/world_diff_narrative.schema.json",
+        scope="internal",
+    )
 
     base_causal = base_output["causal_graph"]
     new_causal = counterfactual_output["causal_graph"]
@@ -135,5 +138,8 @@ def render_counterfactual_narrative_v2(
             "has_cycle_new": has_cycle_new,
         },
     }
-    validate(narrative, "schemas/counterfactual_narrative_v2.schema.json")
+    validate(
+        narrative, "schemas/counterfactual_narrative_v2.schema.json",
+        scope="internal",
+    )
     return narrative
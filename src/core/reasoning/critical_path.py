@@ -108,7 +108,7 @@ def _longest_before_chain(causal_graph: dict) -> tuple[list[str], bool]:
 
 
 def compute_critical_path(causal_graph: dict, *, top_k: int = 5) -> dict:
-    validate(causal_graph, "schemas/causal_graph.schema.json")
+    validate(causal_graph, "schemas/causal_graph.schema.json", scope="internal")
 
     nodes = list(causal_graph["nodes"])
     influence_adjacency, influence_edges = _adjacency_for_types(
@@ -131,5 +131,5 @@ def compute_critical_path(causal_graph: dict, *, top_k: int = 5) -> dict:
     }
     if cycle_detected:
         critical_path["receipts"]["cycle_detected"] = True
-    validate(critical_path, "schemas/critical_path.schema.json")
+    validate(critical_path, "schemas/critical_path.schema.json", scope="internal")
     return critical_path
@@ -32,7 +32,7 @@ def render_critical_path_narrative_v2(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(critical_path, "schemas/critical_path.schema.json")
+    validate(critical_path, "schemas/critical_path.schema.json", scope="internal")
 
     top_event = critical_path["top_events"][0] if critical_path["top_events"] else None
     summary_lines = [
@@ -85,5 +85,8 @@ def render_critical_path_narrative_v2(
             ),
         },
     }
-    validate(narrative, "schemas/critical_path_narrative_v2.schema.json")
+    validate(
+        narrative, "schemas/critical_path_narrative_v2.schema.json",
+        scope="internal",
+    )
     return narrative
@@ -35,8 +35,8 @@ def render_narrative(
     findings: dict,
     verification_result: dict | None = None,
 ) -> dict:
-    validate(support_tree, "schemas/support_tree.schema.json")
-    validate(findings, "schemas/graph_findings.schema.json")
+    validate(support_tree, "schemas/support_tree.schema.json", scope="internal")
+    validate(findings, "schemas/graph_findings.schema.json", scope="internal")
 
     claims_by_id = {
         node["claim_id"]: node["claim"]
@@ -183,5 +183,5 @@ def render_narrative(
         "text": text,
         "paragraphs": paragraphs,
     }
-    validate(narrative, "schemas/narrative.schema.json")
+    validate(narrative, "schemas/narrative.schema.json", scope="internal")
     return narrative
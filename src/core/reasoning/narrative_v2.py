@@ -2,10 +2,7 @@ from __future__ import annotations
 
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.schema_validate import validate
-
-
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
+from core.reasoning.canonical_keys import sort_key
 
 
 def _truncate(text: str, limit: int = 120) -> str:
@@ -83,9 +80,12 @@ def render_narrative_v2(
     show_receipts: bool = False,
     max_lines: int = 200,
 ) -> dict:
-    validate(support_tree, "schemas/support_tree.schema.json")
-    validate(findings, "schemas/graph_findings.schema.json")
-    validate(verification_result, "schemas/verification_result.schema.json")
+    validate(support_tree, "schemas/support_tree.schema.json", scope="internal")
+    validate(findings, "schemas/graph_findings.schema.json", scope="internal")
+    validate(
+        verification_result, "schemas/verification_result.schema.json",
+        scope="internal",
+    )
 
     claims_by_id = {node["claim_id"]: node["claim"] for node in support_tree["nodes"]}
 
@@ -203,10 +203,10 @@ def render_narrative_v2(
         "sections": bounded_sections,
         "receipts_summary": _summarize_refs(
             evidence_refs=receipts["evidence_refs"],
-            proofs=sorted(receipts["proofs"], key=_sort_key),
-            findings=sorted(receipts["findings"], key=_sort_key),
+            proofs=sorted(receipts["proofs"], key=sort_key),
+            findings=sorted(receipts["findings"], key=sort_key),
         ),
         "target_claim_id": support_tree["target_claim_id"],
     }
-    validate(narrative_v2, "schemas/narrative_v2.schema.json")
+    validate(narrative_v2, "schemas/narrative_v2.schema.json", scope="internal")
     return narrative_v2
@@ -3,10 +3,7 @@ from __future__ import annotations
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
-
-
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
+from core.reasoning.canonical_keys import sort_key
 
 
 def _time_value(event: dict) -> str | None:
@@ -109,7 +106,7 @@ def _build_hint(
         },
     }
     hint["hint_id"] = "hint:" + sha256_bytes(dumps_canonical(hint))
-    validate(hint, "schemas/repair_hint.schema.json")
+    validate(hint, "schemas/repair_hint.schema.json", scope="item")
     return hint
 
 
@@ -276,9 +273,12 @@ def compute_repair_hints(
     causal_graph: dict,
     world_model: dict,
 ) -> dict:
-    validate(constraint_report, "schemas/constraint_report.schema.json")
-    validate(causal_graph, "schemas/causal_graph.schema.json")
-    validate(world_model, "schemas/world_model.schema.json")
+    validate(
+        constraint_report, "schemas/constraint_report.schema.json",
+        scope="internal",
+    )
+    validate(causal_graph, "schemas/causal_graph.schema.json", scope="internal")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
 
     events_by_id = {
         event["event_id"]: event
@@ -286,7 +286,7 @@ def compute_repair_hints(
     }
 
     hints = []
-    for violation in sorted(constraint_report["violations"], key=_sort_key):
+    for violation in sorted(constraint_report["violations"], key=sort_key):
         related_edges = _collect_related_edges(causal_graph, violation)
         if violation["type"] == "POLICY_CONFLICT":
             hints.extend(_policy_hints(violation, events_by_id, related_edges))
@@ -311,5 +311,5 @@ def compute_repair_hints(
         "version": "1.0",
         "hints": hints,
     }
-    validate(result, "schemas/repair_hints.schema.json")
+    validate(result, "schemas/repair_hints.schema.json", scope="internal")
     return result
@@ -32,7 +32,7 @@ def render_repair_hints_narrative_v2(
     max_lines: int = 200,
     verbosity: str = "brief",
 ) -> dict:
-    validate(repair_hints, "schemas/repair_hints.schema.json")
+    validate(repair_hints, "schemas/repair_hints.schema.json", scope="internal")
     hints = repair_hints["hints"]
     hint_limit = 6 if verbosity == "brief" else len(hints)
     summary_lines = [
@@ -86,5 +86,8 @@ def render_repair_hints_narrative_v2(
             "high_risk_count": sum(1 for hint in hints if hint["risk"] == "high"),
         },
     }
-    validate(narrative, "schemas/repair_hints_narrative_v2.schema.json")
+    validate(
+        narrative, "schemas/repair_hints_narrative_v2.schema.json",
+        scope="internal",
+    )
     return narrative
@@ -622,7 +622,7 @@ def run_repair_loop(
         },
         "applied_changes": applied_changes,
     }
-    validate(run_record, "schemas/repair_run_record.schema.json")
+    validate(run_record, "schemas/repair_run_record.schema.json", scope="internal")
 
     narrative_obj = render_repair_narrative_v2(
         plan,
@@ -31,9 +31,9 @@ def render_repair_narrative_v2(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(plan, "schemas/repair_plan.schema.json")
+    validate(plan, "schemas/repair_plan.schema.json", scope="internal")
     if record is not None:
-        validate(record, "schemas/repair_run_record.schema.json")
+        validate(record, "schemas/repair_run_record.schema.json", scope="item")
 
     summary_lines = [
         f"Plan: {plan['plan_id']}",
@@ -124,5 +124,5 @@ def render_repair_narrative_v2(
             "replay_ok": replay_ok,
         },
     }
-    validate(narrative, "schemas/repair_narrative_v2.schema.json")
+    validate(narrative, "schemas/repair_narrative_v2.schema.json", scope="internal")
     return narrative
@@ -6,14 +6,11 @@ from pathlib import Path
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 
 _RISK_ORDER = {"low": 0, "medium": 1, "high": 2}
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _extract_output_obj(base_output: dict) -> dict:
     if "output" in base_output and isinstance(base_output["output"], dict):
         return base_output["output"]
@@ -72,9 +69,9 @@ def _collect_entity_ids_from_verification(verification_result: dict) -> list[str
 
 def _collect_evidence_refs(verification_result: dict) -> list[dict]:
     refs = verification_result.get("receipts", {}).get("evidence_refs", [])
-    unique: dict[str, dict] = {}
+    unique: dict[tuple[str, ...], dict] = {}
     for ref in refs:
-        unique[_sort_key(ref)] = ref
+        unique[sort_key(ref)] = ref
     return [unique[key] for key in sorted(unique)]
 
 
@@ -303,7 +300,7 @@ def compute_repair_plan(base_output: dict, ruleset_id: str) -> dict:
     }
     plan["plan_id"] = _plan_id(plan)
 
-    validate(plan, "schemas/repair_plan.schema.json")
+    validate(plan, "schemas/repair_plan.schema.json", scope="internal")
     return plan
 
 
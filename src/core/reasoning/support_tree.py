@@ -14,7 +14,7 @@ def build_support_tree(
     target_claim_id: str,
 ) -> dict:
     graph = build_claim_graph(graph_obj)
-    validate(derived_obj, "schemas/derived_edges.schema.json")
+    validate(derived_obj, "schemas/derived_edges.schema.json", scope="internal")
 
     claims_by_id = {
         claim["claim_id"]: claim
@@ -102,5 +102,5 @@ def build_support_tree(
         "nodes": nodes,
         "edges": edges,
     }
-    validate(support_tree, "schemas/support_tree.schema.json")
+    validate(support_tree, "schemas/support_tree.schema.json", scope="internal")
     return support_tree
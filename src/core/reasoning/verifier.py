@@ -7,6 +7,7 @@ from core.determinism.bundle import build_evidence_bundle
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 
 _SECURITY_RELEVANT_EVENT_TYPES = {
     "Access",
@@ -21,16 +22,12 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def load_ruleset(ruleset_id: str) -> tuple[dict, str]:
     ruleset_path = Path(ruleset_id)
     if not ruleset_path.exists():
         ruleset_path = _repo_root() / "rulesets" / f"{ruleset_id}.json"
     ruleset_obj = json.loads(ruleset_path.read_text(encoding="utf-8"))
-    validate(ruleset_obj, "schemas/ruleset.schema.json")
+    validate(ruleset_obj, "schemas/ruleset.schema.json", scope="seal")
     return ruleset_obj, sha256_bytes(dumps_canonical(ruleset_obj))
 
 
@@ -50,7 +47,7 @@ def _sort_evidence_refs(evidence_refs: list[dict]) -> list[dict]:
 
 def _dedupe_reasons(reasons: list[dict]) -> list[dict]:
     unique_reasons = {
-        (reason["code"], _sort_key(reason["ref"])): reason
+        (reason["code"], sort_key(reason["ref"])): reason
         for reason in reasons
     }
     return [
@@ -61,7 +58,7 @@ def _dedupe_reasons(reasons: list[dict]) -> list[dict]:
 
 def _dedupe_required_info(required_info: list[dict]) -> list[dict]:
     unique_items = {
-        (item["kind"], _sort_key(item["ref"])): item
+        (item["kind"], sort_key(item["ref"])): item
         for item in required_info
     }
     return [
@@ -108,7 +105,7 @@ def _support_tree_proofs(sealed_output_obj: dict) -> list[dict]:
         for edge in support_tree["edges"]
         if edge["derived"]
     ]
-    return sorted(proofs, key=_sort_key)
+    return sorted(proofs, key=sort_key)
 
 
 def _world_evidence_refs(sealed_output_obj: dict) -> list[dict]:
@@ -144,7 +141,7 @@ def _world_security_required_info(
     ]
     return sorted(
         required_info,
-        key=lambda item: (item["kind"], _sort_key(item["ref"])),
+        key=lambda item: (item["kind"], sort_key(item["ref"])),
     )
 
 
@@ -157,7 +154,7 @@ def _causal_findings(sealed_output_obj: dict) -> list[dict]:
         key=lambda finding: (
             finding["code"],
             tuple(finding["event_ids"]),
-            _sort_key(finding.get("details", {})),
+            sort_key(finding.get("details", {})),
         ),
     )
 
@@ -204,7 +201,10 @@ def _constraint_violations(sealed_output_obj: dict) -> list[dict]:
     constraint_report = sealed_output_obj.get("constraint_report")
     if constraint_report is None:
         return []
-    validate(constraint_report, "schemas/constraint_report.schema.json")
+    validate(
+        constraint_report, "schemas/constraint_report.schema.json",
+        scope="internal",
+    )
     return sorted(
         constraint_report["violations"],
         key=lambda item: (
@@ -212,7 +212,7 @@ def _constraint_violations(sealed_output_obj: dict) -> list[dict]:
             tuple(item["events"]),
             tuple(item["entities"]),
             item["reason"],
-            _sort_key({"evidence": item["evidence"]}),
+            sort_key({"evidence": item["evidence"]}),
         ),
     )
 
@@ -226,7 +226,10 @@ def verify_claim(
     strict_manifest: bool = False,
 ) -> dict:
     del strict_manifest
-    validate(evidence_bundle_obj, "schemas/evidence_bundle.schema.json")
+    validate(
+        evidence_bundle_obj, "schemas/evidence_bundle.schema.json",
+        scope="internal",
+    )
     ruleset_obj, ruleset_sha256 = load_ruleset(ruleset_id)
 
     _bundle_bytes, bundle_sha256 = build_evidence_bundle(evidence_bundle_obj)
@@ -416,9 +419,12 @@ def verify_claim(
             "proofs": proofs,
             "findings": sorted(
                 findings + causal_findings + constraint_violations,
-                key=_sort_key,
+                key=sort_key,
             ),
         },
     }
-    validate(verification_result, "schemas/verification_result.schema.json")
+    validate(
+        verification_result, "schemas/verification_result.schema.json",
+        scope="internal",
+    )
     return verification_result
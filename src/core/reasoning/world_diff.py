@@ -6,10 +6,7 @@ from pathlib import Path
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes
 from core.determinism.schema_validate import validate
-
-
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
+from core.reasoning.canonical_keys import sort_key
 
 
 def _read_json_file(path: Path) -> dict:
@@ -139,8 +136,8 @@ def _diff_object_lists(
     *,
     sort_fn,
 ) -> tuple[list[dict], list[dict]]:
-    old_map = {_sort_key(item): item for item in old_items}
-    new_map = {_sort_key(item): item for item in new_items}
+    old_map = {sort_key(item): item for item in old_items}
+    new_map = {sort_key(item): item for item in new_items}
     added_keys = sorted(set(new_map) - set(old_map))
     removed_keys = sorted(set(old_map) - set(new_map))
     return (
@@ -149,16 +146,16 @@ def _diff_object_lists(
     )
 
 
-def _unknown_sort_key(item: dict) -> tuple[str, str]:
-    return (item["kind"], _sort_key(item["ref"]))
+def _unknown_sort_key(item: dict) -> tuple[str, tuple[str, ...]]:
+    return (item["kind"], sort_key(item["ref"]))
 
 
-def _conflict_sort_key(item: dict) -> tuple[str, str]:
-    return (item["kind"], _sort_key(item["ref"]))
+def _conflict_sort_key(item: dict) -> tuple[str, tuple[str, ...]]:
+    return (item["kind"], sort_key(item["ref"]))
 
 
-def _reason_sort_key(item: dict) -> tuple[str, str]:
-    return (item["code"], _sort_key(item["ref"]))
+def _reason_sort_key(item: dict) -> tuple[str, tuple[str, ...]]:
+    return (item["code"], sort_key(item["ref"]))
 
 
 def compute_world_diff(*, old_output: dict, new_output: dict) -> dict:
@@ -215,7 +212,7 @@ def compute_world_diff(*, old_output: dict, new_output: dict) -> dict:
             "required_info_removed": required_info_removed,
         },
     }
-    validate(diff, "schemas/world_diff.schema.json")
+    validate(diff, "schemas/world_diff.schema.json", scope="internal")
     return diff
 
 
@@ -37,7 +37,7 @@ def render_world_diff_narrative(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(diff, "schemas/world_diff.schema.json")
+    validate(diff, "schemas/world_diff.schema.json", scope="internal")
     delta_line = (
         "Delta: "
         f"Entities +{len(diff['entities']['added'])}"
@@ -108,5 +108,5 @@ def render_world_diff_narrative(
         "text": _render_text(bounded_sections),
         "sections": bounded_sections,
     }
-    validate(narrative, "schemas/world_diff_narrative.schema.json")
+    validate(narrative, "schemas/world_diff_narrative.schema.json", scope="internal")
     return narrative
@@ -31,7 +31,7 @@ def render_world_narrative(
     world_model: dict,
     verification_result: dict | None = None,
 ) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
 
     summary = {
         "pid": "01-summary",
@@ -127,5 +127,5 @@ def render_world_narrative(
         "text": text,
         "paragraphs": paragraphs,
     }
-    validate(narrative, "schemas/world_narrative.schema.json")
+    validate(narrative, "schemas/world_narrative.schema.json", scope="internal")
     return narrative
@@ -2,10 +2,7 @@ from __future__ import annotations
 
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.schema_validate import validate
-
-
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
+from core.reasoning.canonical_keys import sort_key
 
 
 def _truncate(text: str, limit: int = 120) -> str:
@@ -60,8 +57,11 @@ def render_world_narrative_v2(
     show_receipts: bool = False,
     max_lines: int = 200,
 ) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
-    validate(verification_result, "schemas/verification_result.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
+    validate(
+        verification_result, "schemas/verification_result.schema.json",
+        scope="internal",
+    )
 
     verification_lines = [f"Status: {verification_result['status']}"]
     verification_lines.extend(
@@ -182,14 +182,14 @@ def render_world_narrative_v2(
                     f"{proof.get('from_id', '')}"
                     f"->{proof.get('to_id', '')}:{proof.get('type', '')}"
                 )
-                for proof in sorted(receipts["proofs"], key=_sort_key)[:5]
+                for proof in sorted(receipts["proofs"], key=sort_key)[:5]
             ],
             "top_findings": [
-                _sort_key(finding)
-                for finding in sorted(receipts["findings"], key=_sort_key)[:5]
+                dumps_canonical(finding).decode("utf-8")
+                for finding in sorted(receipts["findings"], key=sort_key)[:5]
             ],
         },
         "world_sha256": world_model["world_sha256"],
     }
-    validate(narrative_v2, "schemas/world_narrative_v2.schema.json")
+    validate(narrative_v2, "schemas/world_narrative_v2.schema.json", scope="internal")
     return narrative_v2
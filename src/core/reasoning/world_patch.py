@@ -10,6 +10,7 @@ from core.determinism.finalize import finalize
 from core.determinism.hashing import sha256_bytes
 from core.determinism.ledger import write_run
 from core.determinism.schema_validate import validate
+from core.reasoning.canonical_keys import sort_key
 from core.reasoning.causal import compute_causal_graph
 from core.reasoning.causal_narrative_v2 import render_causal_narrative_v2
 from core.reasoning.constraint_diff import compute_constraint_diff
@@ -64,10 +65,6 @@ def _manifest_sha256() -> str:
     return sha256_bytes((_repo_root() / "MANIFEST.sha256").read_bytes())
 
 
-def _sort_key(obj: dict) -> str:
-    return dumps_canonical(obj).decode("utf-8")
-
-
 def _write_atomic(path: Path, data: bytes) -> None:
     temp_path = path.with_name(f".{path.name}.tmp")
     temp_path.write_bytes(data)
@@ -159,7 +156,7 @@ def _build_patch_with_ids(raw_patch: dict) -> tuple[dict, str]:
             )
         op["op_id"] = expected_op_id
 
-    validate(normalized, "schemas/world_patch.schema.json")
+    validate(normalized, "schemas/world_patch.schema.json", scope="internal")
     return normalized, patch_sha256
 
 
@@ -168,7 +165,7 @@ def load_world_patch(path: str) -> tuple[dict, bytes, str]:
     raw_obj = json.loads(_normalize_text_input(raw_bytes))
     patch_obj, patch_sha256 = _build_patch_with_ids(raw_obj)
     patch_bytes = dumps_canonical(patch_obj)
-    validate(patch_obj, "schemas/world_patch.schema.json")
+    validate(patch_obj, "schemas/world_patch.schema.json", scope="seal")
     return patch_obj, patch_bytes, patch_sha256
 
 
@@ -207,7 +204,7 @@ def _build_unknowns(events: list[dict]) -> list[dict]:
                     "ref": {"event_id": event["event_id"]},
                 }
             )
-    return sorted(unknowns, key=lambda item: (item["kind"], _sort_key(item["ref"])))
+    return sorted(unknowns, key=lambda item: (item["kind"], sort_key(item["ref"])))
 
 
 def _build_conflicts(events: list[dict], entities: list[dict]) -> list[dict]:
@@ -251,7 +248,7 @@ def _build_conflicts(events: list[dict], entities: list[dict]) -> list[dict]:
             )
     return sorted(
         conflicts,
-        key=lambda conflict: (conflict["kind"], _sort_key(conflict["ref"])),
+        key=lambda conflict: (conflict["kind"], sort_key(conflict["ref"])),
     )
 
 
@@ -277,7 +274,7 @@ def _normalize_world_model(world_model: dict) -> dict:
             relation["from_id"],
             relation["to_id"],
             1 if relation.get("derived", False) else 0,
-            _sort_key({"proof": relation.get("proof")}),
+            sort_key({"proof": relation.get("proof")}),
         ),
     )
     normalized = {
@@ -290,7 +287,7 @@ def _normalize_world_model(world_model: dict) -> dict:
         "conflicts": _build_conflicts(events, entities),
     }
     normalized["world_sha256"] = _compute_world_sha256(normalized)
-    validate(normalized, "schemas/world_model.schema.json")
+    validate(normalized, "schemas/world_model.schema.json", scope="internal")
     return normalized
 
 
@@ -335,8 +332,8 @@ def _all_world_ids(world_model: dict) -> set[str]:
 
 
 def apply_world_patch(world_model: dict, patch_obj: dict) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
-    validate(patch_obj, "schemas/world_patch.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
+    validate(patch_obj, "schemas/world_patch.schema.json", scope="internal")
     updated = deepcopy(world_model)
 
     for op in patch_obj["ops"]:
@@ -436,7 +433,7 @@ def apply_world_patch(world_model: dict, patch_obj: dict) -> dict:
                     "objects": sorted(payload["objects"]),
                     "action": payload["action"],
                     "state": deepcopy(payload["state"]),
-                    "evidence": sorted(payload["evidence"], key=_sort_key),
+                    "evidence": sorted(payload["evidence"], key=sort_key),
                 }
             )
             continue
@@ -466,7 +463,7 @@ def apply_world_patch(world_model: dict, patch_obj: dict) -> dict:
             if "objects" in payload:
                 event["objects"] = sorted(event["objects"])
             if "evidence" in payload:
-                event["evidence"] = sorted(event["evidence"], key=_sort_key)
+                event["evidence"] = sorted(event["evidence"], key=sort_key)
             continue
 
         if op_type == "REMOVE_EVENT":
@@ -517,7 +514,7 @@ def apply_world_patch(world_model: dict, patch_obj: dict) -> dict:
                 "proof": deepcopy(payload["proof"]),
             }
             if any(
-                _sort_key(item) == _sort_key(relation_obj)
+                sort_key(item) == sort_key(relation_obj)
                 for item in updated["relations"]
             ):
                 raise ValueError(
@@ -797,7 +794,7 @@ def run_world_patch(
         patch_result["world_diff"] = world_diff
     if constraint_diff is not None:
         patch_result["constraint_diff"] = constraint_diff
-    validate(patch_result, "schemas/world_patch_result.schema.json")
+    validate(patch_result, "schemas/world_patch_result.schema.json", scope="internal")
 
     narrative_obj = render_world_patch_narrative_v2(
         patch_obj,
@@ -805,7 +802,10 @@ def run_world_patch(
         mode=mode,
         max_lines=max_lines,
     )
-    validate(narrative_obj, "schemas/world_patch_narrative_v2.schema.json")
+    validate(
+        narrative_obj, "schemas/world_patch_narrative_v2.schema.json",
+        scope="internal",
+    )
 
     planned_files = {
         "patch.json": patch_bytes,
@@ -45,8 +45,11 @@ def render_world_patch_narrative_v2(
     mode: str = "brief",
     max_lines: int = 200,
 ) -> dict:
-    validate(patch_obj, "schemas/world_patch.schema.json")
-    validate(patch_result_obj, "schemas/world_patch_result.schema.json")
+    validate(patch_obj, "schemas/world_patch.schema.json", scope="internal")
+    validate(
+        patch_result_obj, "schemas/world_patch_result.schema.json",
+        scope="internal",
+    )
 
     counts: dict[str, int] = {}
     for op in patch_obj["ops"]:
@@ -122,5 +125,8 @@ def render_world_patch_narrative_v2(
             "top_targets": top_targets,
         },
     }
-    validate(narrative, "schemas/world_patch_narrative_v2.schema.json")
+    validate(
+        narrative, "schemas/world_patch_narrative_v2.schema.json",
+        scope="internal",
+    )
     return narrative
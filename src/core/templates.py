@@ -1,5 +1,7 @@
 import json
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from core.attestation import sha256_text
@@ -46,18 +48,216 @@ def fallback_chain(ref: str, template_dir: Path, extra_chain=None):
     return chain
 
 
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+_INDEXED_KEY = re.compile(r"([a-zA-Z_]+)_(\d+)")
+
+
+def _stat_signature(path) -> tuple[int, int, int]:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Placeholder:
+    # One "{key}" with its dotted suffix and list fallbacks worked out up front.
+    __slots__ = ("key", "base", "rest", "candidates", "index")
+
+    def __init__(self, key: str):
+        self.key = key
+        base, dot, rest = key.partition(".")
+        self.base = base
+        self.rest = rest if dot else None
+        self.candidates = ()
+        self.index = 0
+        match = _INDEXED_KEY.match(base)
+        if match:
+            name = match.group(1)
+            index = int(match.group(2))
+            self.candidates = (
+                name,
+                f"{name}s",
+                f"{name}_list",
+                f"{name}s_detailed",
+                f"{name}_detailed",
+            )
+            self.index = 0 if index == 0 else index - 1
+
+    def lookup(self, context: dict):
+        value = self._lookup_base(context)
+        if self.rest is None:
+            return value
+        if isinstance(value, dict):
+            return value.get(self.rest)
+        return None
+
+    def _lookup_base(self, context: dict):
+        if self.base in context:
+            return context[self.base]
+        for name in self.candidates:
+            if name in context and isinstance(context[name], list):
+                list_val = context[name]
+                if 0 <= self.index < len(list_val):
+                    return list_val[self.index]
+        return None
+
+    def render(self, context: dict) -> str:
+        resolved = self.lookup(context)
+        if resolved is None:
+            return f"{{missing:{self.key}}}"
+        return str(resolved)
+
+
+class _Text:
+    # Literal strings interleaved with placeholders.
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: tuple):
+        self.parts = parts
+
+    def render(self, context: dict) -> str:
+        return "".join(
+            part if type(part) is str else part.render(context) for part in self.parts
+        )
+
+
+class _List:
+    __slots__ = ("items",)
+
+    def __init__(self, items: tuple):
+        self.items = items
+
+
+class _Dict:
+    __slots__ = ("items",)
+
+    def __init__(self, items: tuple):
+        self.items = items
+
+
+@lru_cache(maxsize=4096)
+def _compile_text(text: str):
+    # Returns text itself when it holds no placeholder.
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(text):
+        if match.start() > position:
+            parts.append(text[position : match.start()])
+        parts.append(_Placeholder(match.group(1)))
+        position = match.end()
+    if not parts:
+        return text
+    if position < len(text):
+        parts.append(text[position:])
+    return _Text(tuple(parts))
+
+
+def _compile(value):
+    if isinstance(value, str):
+        return _compile_text(value)
+    if isinstance(value, list):
+        return _List(tuple(_compile(v) for v in value))
+    if isinstance(value, dict):
+        return _Dict(tuple((k, _compile(v)) for k, v in value.items()))
+    return value
+
+
+def _render(node, context: dict):
+    kind = type(node)
+    if kind is _Text:
+        return node.render(context)
+    if kind is _Dict:
+        return {k: _render(v, context) for k, v in node.items}
+    if kind is _List:
+        return [_render(v, context) for v in node.items]
+    return node
+
+
+class CompiledTemplate:
+    def __init__(self, raw: str, path: str, sha256: str):
+        self.raw = raw
+        self.path = path
+        self.sha256 = sha256
+        self._tree = _compile(self.document())
+
+    def document(self) -> dict:
+        # A fresh copy on every call, so callers may mutate it.
+        template = json.loads(self.raw)
+        template["_template_path"] = self.path
+        template["_template_sha256"] = self.sha256
+        return template
+
+    def render(self, context: dict) -> dict:
+        # Same result as resolve_placeholders(self.document(), context).
+        return _render(self._tree, context)
+
+
+class TemplateRegistry:
+    # Lists each template directory once and compiles each template file once.
+    # A directory is re-listed when its own mtime changes (a file was added,
+    # removed or renamed) and a template is recompiled when its stat changes.
+
+    def __init__(self):
+        self._listings: dict[str, tuple[tuple[int, int, int], frozenset[str]]] = {}
+        self._templates: dict[str, tuple[tuple[int, int, int], CompiledTemplate]] = {}
+
+    def _names(self, directory: Path) -> frozenset[str]:
+        key = os.fspath(directory)
+        try:
+            signature = _stat_signature(key)
+        except OSError:
+            self._listings.pop(key, None)
+            return frozenset()
+        cached = self._listings.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        names = frozenset(os.listdir(key))
+        self._listings[key] = (signature, names)
+        return names
+
+    def exists(self, path: Path) -> bool:
+        return path.name in self._names(path.parent)
+
+    def compiled(self, path: Path) -> CompiledTemplate:
+        key = os.fspath(path)
+        signature = _stat_signature(key)
+        cached = self._templates.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        raw = path.read_text(encoding="utf-8-sig")
+        normalized = raw.replace("\r\n", "\n").replace("\r", "\n")
+        compiled = CompiledTemplate(
+            raw, _to_repo_relative(path), sha256_text(normalized)
+        )
+        self._templates[key] = (signature, compiled)
+        return compiled
+
+    def lookup(self, ref: str, template_dir: Path, chain=None) -> CompiledTemplate:
+        template_dir = Path(template_dir)
+        paths = chain or fallback_chain(ref, template_dir)
+        for path in paths:
+            path = Path(path)
+            if self.exists(path):
+                return self.compiled(path)
+        raise FileNotFoundError(f"No template found for ref '{ref}' in {template_dir}")
+
+    def clear(self) -> None:
+        self._listings.clear()
+        self._templates.clear()
+
+
+_REGISTRY = TemplateRegistry()
+
+
+def template_registry() -> TemplateRegistry:
+    return _REGISTRY
+
+
 def load_template(ref: str, template_dir: Path, chain=None):
-    template_dir = Path(template_dir)
-    paths = chain or fallback_chain(ref, template_dir)
-    for path in paths:
-        if path.exists():
-            raw = path.read_text(encoding="utf-8-sig")
-            normalized = raw.replace("\r\n", "\n").replace("\r", "\n")
-            template = json.loads(raw)
-            template["_template_path"] = _to_repo_relative(path)
-            template["_template_sha256"] = sha256_text(normalized)
-            return template
-    raise FileNotFoundError(f"No template found for ref '{ref}' in {template_dir}")
+    return _REGISTRY.lookup(ref, template_dir, chain=chain).document()
+
+
+def render_template(ref: str, template_dir: Path, context: dict, chain=None):
+    # load_template followed by resolve_placeholders, from the compiled tree.
+    return _REGISTRY.lookup(ref, template_dir, chain=chain).render(context)
 
 
 def resolve_placeholders(value, context: dict):
@@ -71,45 +271,7 @@ def resolve_placeholders(value, context: dict):
 
 
 def _render_text(text: str, context: dict) -> str:
-    def repl(match):
-        key = match.group(1)
-        resolved = _resolve_key(key, context)
-        if resolved is None:
-            return f"{{missing:{key}}}"
-        return str(resolved)
-
-    return re.sub(r"\{([^{}]+)\}", repl, text)
-
-
-def _resolve_key(key: str, context: dict):
-    if "." in key:
-        base, rest = key.split(".", 1)
-        base_val = _resolve_base(base, context)
-        if isinstance(base_val, dict):
-            return base_val.get(rest)
-        return None
-    return _resolve_base(key, context)
-
-
-def _resolve_base(key: str, context: dict):
-    if key in context:
-        return context[key]
-
-    match = re.match(r"([a-zA-Z_]+)_(\d+)", key)
-    if match:
-        base = match.group(1)
-        index = int(match.group(2))
-        candidates = [
-            base,
-            f"{base}s",
-            f"{base}_list",
-            f"{base}s_detailed",
-            f"{base}_detailed",
-        ]
-        for name in candidates:
-            if name in context and isinstance(context[name], list):
-                list_val = context[name]
-                idx = 0 if index == 0 else index - 1
-                if 0 <= idx < len(list_val):
-                    return list_val[idx]
-    return None
+    compiled = _compile_text(text)
+    if type(compiled) is _Text:
+        return compiled.render(context)
+    return text
@@ -1,10 +1,16 @@
 import argparse
 import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from core.attestation import sha256_bytes, sha256_text, verify_attestation
-from core.manifest import resolve_input
+from core.manifest import load_manifest_cached, resolve_input
 from core.pipeline import DeterministicPipeline
+from core.pipeline_stream import StreamingPipeline
 from domains.biblical_text.extractors import BiblicalTextExtractors
 from domains.clinical_records.extractors import ClinicalRecordsExtractors
 from domains.credit_scoring.extractors import CreditScoringExtractors
@@ -126,17 +132,29 @@ def _build_provenance_meta(args, resolved: dict) -> dict:
     return provenance_meta
 
 
-def run_pipeline(args):
-    domain_config = DOMAIN_REGISTRY.get(args.domain)
-    if not domain_config:
-        raise ValueError(f"unknown domain: {args.domain}")
+_PIPELINES = {}
+
+
+def _get_pipeline(domain, stream=False):
+    # One pipeline per domain and mode per process, so batch workers keep their
+    # extractors and compiled patterns warm across refs.
+    key = (domain, stream)
+    if key not in _PIPELINES:
+        domain_config = DOMAIN_REGISTRY.get(domain)
+        if not domain_config:
+            raise ValueError(f"unknown domain: {domain}")
+        pipeline_cls = StreamingPipeline if stream else DeterministicPipeline
+        _PIPELINES[key] = pipeline_cls(
+            domain,
+            domain_config["extractor"],
+            domain_config["templates"],
+            manifest_path=domain_config["manifest"],
+        )
+    return _PIPELINES[key]
 
-    pipeline = DeterministicPipeline(
-        args.domain,
-        domain_config["extractor"],
-        domain_config["templates"],
-        manifest_path=domain_config["manifest"],
-    )
+
+def run_pipeline(args):
+    pipeline = _get_pipeline(args.domain, args.stream)
 
     context = _parse_context(args.context)
     resolved = _load_input(
@@ -144,6 +162,10 @@ def run_pipeline(args):
     )
 
     output_dir = Path(args.out)
+    provenance_meta = _build_provenance_meta(args, resolved)
+    timed = getattr(args, "timings", False)
+    if timed and not hasattr(pipeline.extractor, "extract_timed"):
+        raise ValueError(f"extractor timings not supported for domain: {args.domain}")
     return pipeline.process(
         resolved["ref"],
         resolved["data"],
@@ -151,8 +173,128 @@ def run_pipeline(args):
         context,
         output_dir,
         input_meta=resolved["input_meta"],
-        provenance_meta=_build_provenance_meta(args, resolved),
+        provenance_meta=provenance_meta,
+        timed=timed,
+    )
+
+
+def _batch_manifest_path(args) -> Path:
+    if args.dataset and args.domain == "biblical_text":
+        return DATA_ROOT / "scripture" / args.dataset / "manifest.json"
+    if args.manifest:
+        return Path(args.manifest)
+    return Path(DOMAIN_REGISTRY[args.domain]["manifest"])
+
+
+def _batch_refs(args, manifest_path: Path) -> list:
+    refs = list(args.ref or [])
+    if args.refs_file:
+        lines = Path(args.refs_file).read_text(encoding="utf-8").splitlines()
+        refs.extend(
+            line.strip()
+            for line in lines
+            if line.strip() and not line.strip().startswith("#")
+        )
+    if not refs:
+        records, _ = load_manifest_cached(manifest_path)
+        refs = list(records)
+    return list(dict.fromkeys(refs))
+
+
+def _ref_dirname(ref: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", ref).strip("._") or "ref"
+
+
+def _run_batch_task(task):
+    ref, out_dir, options = task
+    started = time.perf_counter()
+    record = {"ref": ref, "output_dir": out_dir}
+    try:
+        pipeline = _get_pipeline(options.domain, options.stream)
+        resolved = _load_input(
+            options.domain, ref, None, options.dataset, options.manifest
+        )
+        result = pipeline.process(
+            resolved["ref"],
+            resolved["data"],
+            resolved["bytes"],
+            dict(options.context),
+            Path(out_dir),
+            input_meta=resolved["input_meta"],
+            provenance_meta=_build_provenance_meta(options, resolved),
+        )
+    except Exception as exc:
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    else:
+        record.update(status="ok", attestation_sha256=result["attestation_sha256"])
+    record["seconds"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def _percentile(ordered, percent):
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_batch(args) -> dict:
+    if args.domain not in DOMAIN_REGISTRY:
+        raise ValueError(f"unknown domain: {args.domain}")
+    started = time.perf_counter()
+    manifest_path = _batch_manifest_path(args)
+    out_root = Path(args.out)
+    options = argparse.Namespace(
+        domain=args.domain,
+        stream=args.stream,
+        dataset=args.dataset,
+        manifest=args.manifest,
+        context=_parse_context(args.context),
+        timestamp=args.timestamp,
+        commit_ref=args.commit_ref,
+        repo_tag=args.repo_tag,
     )
+    tasks = []
+    claimed = {}
+    for ref in _batch_refs(args, manifest_path):
+        dirname = _ref_dirname(ref)
+        if dirname in claimed:
+            raise ValueError(
+                f"refs {claimed[dirname]!r} and {ref!r} share output dir {dirname}"
+            )
+        claimed[dirname] = ref
+        tasks.append((ref, str(out_root / dirname), options))
+
+    max_workers = max(1, args.workers or os.cpu_count() or 1)
+    if max_workers == 1 or len(tasks) <= 1:
+        runs = [_run_batch_task(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            runs = list(pool.map(_run_batch_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(run["seconds"] for run in runs)
+    return {
+        "domain": args.domain,
+        "manifest": _relpath(manifest_path, REPO_ROOT),
+        "workers": max_workers,
+        "totals": {
+            "refs": len(runs),
+            "ok": sum(1 for run in runs if run["status"] == "ok"),
+            "error": sum(1 for run in runs if run["status"] == "error"),
+        },
+        "elapsed_seconds": round(elapsed, 6),
+        "refs_per_second": round(len(runs) / elapsed, 3) if elapsed else 0.0,
+        "latency_seconds": {
+            "mean": round(sum(latencies) / len(latencies), 6) if latencies else 0.0,
+            "p50": _percentile(latencies, 50),
+            "p90": _percentile(latencies, 90),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        "runs": runs,
+    }
 
 
 def validate_provenance(paths):
@@ -203,6 +345,42 @@ def main(argv=None):
     run_parser.add_argument("--commit-ref")
     run_parser.add_argument("--repo-tag")
     run_parser.add_argument("--out", required=True)
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="encode JSON in bounded chunks and report peak RSS in log.txt",
+    )
+    run_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="record per-sub-extractor seconds in provenance_meta",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "run-batch", help="Run the pipeline for many refs over a process pool"
+    )
+    batch_parser.add_argument("--domain", required=True)
+    batch_parser.add_argument("--manifest")
+    batch_parser.add_argument("--dataset")
+    batch_parser.add_argument("--ref", action="append")
+    batch_parser.add_argument("--refs-file")
+    batch_parser.add_argument("--context", action="append")
+    batch_parser.add_argument("--timestamp")
+    batch_parser.add_argument("--commit-ref")
+    batch_parser.add_argument("--repo-tag")
+    batch_parser.add_argument("--out", required=True)
+    batch_parser.add_argument("--workers", type=int, default=None)
+    batch_parser.add_argument(
+        "--report", help="report path (default: <out>/batch_report.json)"
+    )
+    batch_parser.add_argument("--stream", action="store_true")
+
+    credit_parser = subparsers.add_parser(
+        "credit-batch", help="Score a columnar applicant table (csv, jsonl, npz)"
+    )
+    credit_parser.add_argument("--input", required=True)
+    credit_parser.add_argument("--context", action="append")
+    credit_parser.add_argument("--out", required=True)
 
     validate_parser = subparsers.add_parser("validate-provenance")
     validate_parser.add_argument("paths", nargs="+")
@@ -211,7 +389,12 @@ def main(argv=None):
         argv = list(__import__("sys").argv[1:])
     else:
         argv = list(argv)
-    if argv and argv[0] not in ("run", "validate-provenance"):
+    if argv and argv[0] not in (
+        "run",
+        "run-batch",
+        "credit-batch",
+        "validate-provenance",
+    ):
         argv = ["run"] + argv
     args = parser.parse_args(argv)
 
@@ -220,10 +403,41 @@ def main(argv=None):
         print(json.dumps(results, indent=2))
         return
 
+    if args.command == "run-batch":
+        report = run_batch(args)
+        report_path = Path(args.report or Path(args.out) / "batch_report.json")
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        totals = report["totals"]
+        print(
+            f"refs={totals['refs']} ok={totals['ok']} error={totals['error']} "
+            f"workers={report['workers']} refs_per_second={report['refs_per_second']}"
+        )
+        return 1 if totals["error"] else 0
+
+    if args.command == "credit-batch":
+        # Imported here so run and run-batch never load NumPy.
+        from domains.credit_scoring import batch as credit_batch
+
+        input_path = Path(args.input)
+        batch = credit_batch.score_batch(
+            credit_batch.load_table(input_path),
+            Path(args.out),
+            context=_parse_context(args.context),
+            input_sha256=sha256_bytes(input_path.read_bytes()),
+        )
+        print(
+            f"applicants={batch['applicants']} "
+            f"attestation_sha256={batch['attestation_sha256']}"
+        )
+        return
+
     if args.command in (None, "run"):
         run_pipeline(args)
         return
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
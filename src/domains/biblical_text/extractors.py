@@ -1,6 +1,13 @@
 import re
 
-from core.extraction import extract_relationships, normalize_input, segment
+from core.extraction import (
+    EntityMatcher,
+    MentionWindow,
+    SpanIndex,
+    extract_relationships,
+    normalize_input,
+    segment,
+)
 
 VERB_LEXICON = {
     "am",
@@ -113,6 +120,15 @@ def _entity_patterns():
     ]
 
 
+ENTITY_MATCHER = EntityMatcher(_entity_patterns())
+TIME_MARKER_MATCHER = EntityMatcher(
+    [
+        (kind, re.compile(re.escape(phrase), re.IGNORECASE))
+        for phrase, kind in TIME_MARKER_PATTERNS
+    ]
+)
+
+
 def _entity_meta():
     return {
         "Jesus": {
@@ -139,24 +155,34 @@ def _entity_meta():
 
 class BiblicalTextExtractors:
     domain = "biblical_text"
+    # normalize_input only joins lines within blank-line separated paragraphs.
+    normalizes_paragraphs = True
 
     def normalize_input(self, text: str) -> str:
         return normalize_input(text)
 
     def extract(self, normalized_text: str, context: dict):
         segments, boundaries, sentence_spans = segment(normalized_text)
+        span_index = SpanIndex(segments)
+        entity_matches = ENTITY_MATCHER.finditer(normalized_text)
         verbs = _extract_verbs(normalized_text, segments)
-        time_markers = _extract_time_markers(normalized_text, segments)
-        utterances = _extract_utterances(normalized_text, segments)
-        characters = _build_characters(normalized_text, segments)
-        coref_links = _build_coref_links(normalized_text, segments, characters)
+        time_markers = _extract_time_markers(normalized_text, span_index)
+        utterances = _extract_utterances(normalized_text, span_index)
+        characters = _build_characters(entity_matches, span_index)
+        coref_links = _build_coref_links(
+            normalized_text, segments, characters, span_index
+        )
         frames = extract_relationships(
             normalized_text,
             segments,
             verbs,
-            _entity_patterns(),
+            ENTITY_MATCHER,
             PRONOUNS,
             coref_links=coref_links,
+            span_index=span_index,
+            entity_matches=[
+                (match.start(), match.end(), label) for label, match in entity_matches
+            ],
         )
 
         return {
@@ -317,37 +343,27 @@ def _extract_verbs(text: str, segments):
     return verbs
 
 
-def _extract_time_markers(text: str, segments):
+def _extract_time_markers(text: str, span_index):
     markers = []
-    for phrase, kind in TIME_MARKER_PATTERNS:
-        for match in re.finditer(re.escape(phrase), text, re.IGNORECASE):
-            clause_id = None
-            for seg in segments:
-                if seg["token_start"] <= match.start() < seg["token_end"]:
-                    clause_id = seg["clause_id"]
-                    break
-            markers.append(
-                {
-                    "text": match.group(0),
-                    "type": kind,
-                    "clause_id": clause_id,
-                    "token_span": [match.start(), match.end()],
-                }
-            )
+    for kind, match in TIME_MARKER_MATCHER.finditer(text):
+        markers.append(
+            {
+                "text": match.group(0),
+                "type": kind,
+                "clause_id": span_index.clause_id_at(match.start()),
+                "token_span": [match.start(), match.end()],
+            }
+        )
     markers.sort(key=lambda m: (m["token_span"][0], m["text"]))
     return markers
 
 
-def _extract_utterances(text: str, segments):
+def _extract_utterances(text: str, span_index):
     utterances = []
     for match in re.finditer(r"\"([^\"]+)\"", text):
         utterance_text = match.group(1).strip()
         start, end = match.start(1), match.end(1)
-        clause_id = None
-        for seg in segments:
-            if seg["token_start"] <= start < seg["token_end"]:
-                clause_id = seg["clause_id"]
-                break
+        clause_id = span_index.clause_id_at(start)
         speaker_guess = _guess_speaker(text[:start])
         speech_act = "question" if utterance_text.endswith("?") else "unknown"
         utterances.append(
@@ -374,25 +390,18 @@ def _guess_speaker(prefix_text: str):
     return "unknown"
 
 
-def _build_characters(text: str, segments):
+def _build_characters(entity_matches, span_index):
     meta = _entity_meta()
-    patterns = _entity_patterns()
     mentions_by_id = {m["char_id"]: [] for m in meta.values()}
-    for label, pattern in patterns:
-        for match in re.finditer(pattern, text):
-            entry = meta[label]
-            clause_id = None
-            for seg in segments:
-                if seg["token_start"] <= match.start() < seg["token_end"]:
-                    clause_id = seg["clause_id"]
-                    break
-            mentions_by_id[entry["char_id"]].append(
-                {
-                    "clause_id": clause_id,
-                    "token_span": [match.start(), match.end()],
-                    "surface": match.group(0),
-                }
-            )
+    for label, match in entity_matches:
+        entry = meta[label]
+        mentions_by_id[entry["char_id"]].append(
+            {
+                "clause_id": span_index.clause_id_at(match.start()),
+                "token_span": [match.start(), match.end()],
+                "surface": match.group(0),
+            }
+        )
     characters = []
     for label, entry in meta.items():
         mentions = mentions_by_id[entry["char_id"]]
@@ -408,21 +417,18 @@ def _build_characters(text: str, segments):
     return characters
 
 
-def _build_coref_links(text: str, segments, characters):
-    candidate_mentions = []
+def _build_coref_links(text: str, segments, characters, span_index):
+    window = MentionWindow(lookback_sentences=2)
     for char in characters:
         gender = _entity_meta().get(char["label"], {}).get("gender")
         number = _entity_meta().get(char["label"], {}).get("number")
         for m in char["mentions"]:
-            sentence_id = _sentence_for_span(segments, m["token_span"][0])
-            candidate_mentions.append(
-                {
-                    "label": char["label"],
-                    "gender": gender,
-                    "number": number,
-                    "sentence_id": sentence_id,
-                    "token_start": m["token_span"][0],
-                }
+            window.add(
+                span_index.sentence_at(m["token_span"][0]),
+                m["token_span"][0],
+                char["label"],
+                gender,
+                number,
             )
 
     coref_links = []
@@ -436,19 +442,8 @@ def _build_coref_links(text: str, segments, characters):
             start = seg["token_start"] + match.start()
             end = seg["token_start"] + match.end()
             gender, number = PRONOUNS.get(pronoun.lower(), ("N", "S"))
-            lookback = [
-                c
-                for c in candidate_mentions
-                if 0 <= seg["sentence_id"] - c["sentence_id"] <= 2
-            ]
-            filtered = []
-            for c in lookback:
-                if gender in {"M", "F"} and c.get("gender") and c["gender"] != gender:
-                    continue
-                if number == "P" and c.get("number") and c["number"] != "P":
-                    continue
-                filtered.append(c)
-            if not filtered:
+            label = window.resolve(seg["sentence_id"], gender, number)
+            if label is None:
                 unknown_state[gender] += 1
                 unknown_id = f"char_unknown_{gender}_{unknown_state[gender]}"
                 coref_links.append(
@@ -464,10 +459,6 @@ def _build_coref_links(text: str, segments, characters):
                     }
                 )
                 continue
-            filtered.sort(
-                key=lambda c: (seg["sentence_id"] - c["sentence_id"], -c["token_start"])
-            )
-            chosen = filtered[0]
             coref_links.append(
                 {
                     "from": {
@@ -475,9 +466,9 @@ def _build_coref_links(text: str, segments, characters):
                         "token_span": [start, end],
                         "surface_pronoun": pronoun,
                     },
-                    "to": chosen["label"],
+                    "to": label,
                     "rule": "recency",
-                    "evidence": f"resolved {pronoun} to {chosen['label']} by recency",
+                    "evidence": f"resolved {pronoun} to {label} by recency",
                 }
             )
 
@@ -486,13 +477,6 @@ def _build_coref_links(text: str, segments, characters):
     return coref_links
 
 
-def _sentence_for_span(segments, token_start):
-    for seg in segments:
-        if seg["token_start"] <= token_start < seg["token_end"]:
-            return seg["sentence_id"]
-    return 0
-
-
 def _frame_string(actor, verb, obj, indirect_object):
     if indirect_object:
         return f"{actor} {verb} to {indirect_object}"
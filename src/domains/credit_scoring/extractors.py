@@ -1,85 +1,120 @@
-class CreditScoringExtractors:
-    domain = "credit_scoring"
+DTI_THRESHOLD = 0.55
+CREDIT_SCORE_THRESHOLD = 640
+EMPLOYMENT_MONTHS_THRESHOLD = 24
 
-    def normalize_input(self, data: dict) -> dict:
-        return data or {}
 
-    def extract(self, normalized_input: dict, context: dict):
-        income = float(normalized_input.get("income_monthly", 0) or 0)
-        debt = float(normalized_input.get("debt_monthly", 0) or 0)
-        credit_score = int(normalized_input.get("credit_score", 0) or 0)
-        delinq = int(normalized_input.get("delinquencies_12mo", 0) or 0)
-        employment = int(normalized_input.get("employment_months", 0) or 0)
-
-        dti = round(debt / income, 2) if income else 0.0
-
-        risk_signals = [
+def build_record(
+    actor,
+    income,
+    debt,
+    credit_score,
+    delinq,
+    employment,
+    dti,
+    dti_status,
+    delinquency_status,
+    credit_score_status,
+    employment_status,
+    risk_tier,
+    decision,
+):
+    # The record extract() returns, from already coerced values and statuses;
+    # domains.credit_scoring.batch builds the same record for every row.
+    return {
+        "income": income,
+        "debt": debt,
+        "dti": dti,
+        "credit_score": credit_score,
+        "delinquencies": delinq,
+        "employment_months": employment,
+        "risk_tier": risk_tier,
+        "decision": decision,
+        "signals": [
             {
                 "id": "signal_0",
                 "type": "debt_to_income",
                 "value": dti,
-                "threshold": 0.55,
-                "status": "pass" if dti <= 0.55 else "fail",
+                "threshold": DTI_THRESHOLD,
+                "status": dti_status,
             },
             {
                 "id": "signal_1",
                 "type": "recent_delinquency",
                 "count": delinq,
                 "threshold": 0,
-                "status": "caution" if delinq > 0 else "pass",
+                "status": delinquency_status,
             },
             {
                 "id": "signal_2",
                 "type": "credit_score",
                 "value": credit_score,
-                "threshold": 640,
-                "status": "pass" if credit_score >= 640 else "caution",
+                "threshold": CREDIT_SCORE_THRESHOLD,
+                "status": credit_score_status,
             },
             {
                 "id": "signal_3",
                 "type": "employment_months",
                 "value": employment,
-                "threshold": 24,
-                "status": "pass" if employment >= 24 else "caution",
+                "threshold": EMPLOYMENT_MONTHS_THRESHOLD,
+                "status": employment_status,
             },
-        ]
-
-        frames = [
+        ],
+        "frames": [
             {
                 "id": "frame_0",
-                "actor": f"applicant_{normalized_input.get('applicant_id', 'unknown')}",
+                "actor": actor,
                 "action": "earn",
                 "amount": income,
                 "frequency": "monthly",
             },
             {
                 "id": "frame_1",
-                "actor": f"applicant_{normalized_input.get('applicant_id', 'unknown')}",
+                "actor": actor,
                 "action": "owe",
                 "amount": debt,
                 "frequency": "monthly",
             },
-        ]
+        ],
+    }
+
+
+class CreditScoringExtractors:
+    domain = "credit_scoring"
+
+    def normalize_input(self, data: dict) -> dict:
+        return data or {}
+
+    def extract(self, normalized_input: dict, context: dict):
+        income = float(normalized_input.get("income_monthly", 0) or 0)
+        debt = float(normalized_input.get("debt_monthly", 0) or 0)
+        credit_score = int(normalized_input.get("credit_score", 0) or 0)
+        delinq = int(normalized_input.get("delinquencies_12mo", 0) or 0)
+        employment = int(normalized_input.get("employment_months", 0) or 0)
+
+        dti = round(debt / income, 2) if income else 0.0
 
         risk_tier = context.get("risk_tier") or (
-            "subprime_tier3" if credit_score < 640 else "prime_tier1"
+            "subprime_tier3" if credit_score < CREDIT_SCORE_THRESHOLD else "prime_tier1"
         )
-        decision = "approved_conditional" if dti <= 0.55 else "denied"
+        decision = "approved_conditional" if dti <= DTI_THRESHOLD else "denied"
         if delinq > 0 and decision == "approved_conditional":
             decision = "approved_conditional"
 
-        return {
-            "income": income,
-            "debt": debt,
-            "dti": dti,
-            "credit_score": credit_score,
-            "delinquencies": delinq,
-            "employment_months": employment,
-            "risk_tier": risk_tier,
-            "decision": decision,
-            "signals": risk_signals,
-            "frames": frames,
-        }
+        return build_record(
+            f"applicant_{normalized_input.get('applicant_id', 'unknown')}",
+            income,
+            debt,
+            credit_score,
+            delinq,
+            employment,
+            dti,
+            "pass" if dti <= DTI_THRESHOLD else "fail",
+            "caution" if delinq > 0 else "pass",
+            "pass" if credit_score >= CREDIT_SCORE_THRESHOLD else "caution",
+            "pass" if employment >= EMPLOYMENT_MONTHS_THRESHOLD else "caution",
+            risk_tier,
+            decision,
+        )
 
     def build_evidence_map(self, extracted: dict, normalized_input: dict):
         return {
@@ -99,7 +134,7 @@ class CreditScoringExtractors:
             "decision": extracted["decision"],
             "rate": 0.089 if extracted["risk_tier"] == "subprime_tier3" else 0.049,
             "collateral_type": normalized_input.get("collateral"),
-            "threshold_dti": 0.55,
+            "threshold_dti": DTI_THRESHOLD,
             "threshold_delinquency_months": 12,
             "threshold_delinquency_count": 0,
             "verification_method": "bank_statement",
@@ -108,7 +143,9 @@ class CreditScoringExtractors:
             ),
             "signal_credit_history": f"credit score {extracted['credit_score']}",
             "signal_collateral": "none",
-            "risk_signal_1": "debt_to_income" if extracted["dti"] > 0.55 else "none",
+            "risk_signal_1": "debt_to_income"
+            if extracted["dti"] > DTI_THRESHOLD
+            else "none",
             "risk_signal_2": "recent_delinquency"
             if extracted["delinquencies"] > 0
             else "none",
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import re
+import time
+from bisect import bisect_right
 from collections import OrderedDict
 from datetime import datetime
+from functools import cached_property
+from itertools import chain
 
 from domains.legal_contract.templates import build_output
 
@@ -36,16 +40,21 @@ MONTH_NAMES = {
     "december": 12,
 }
 
+_NAME = r"[A-Z][A-Za-z0-9&.,'\- ]+?"
+_ROLES = "|".join(ROLE_NAMES)
+_PARTY_LINE_TAIL = r",\s+a[n]?\s+[^,\n]+?\((?P<labels>[^)]+)\)"
+_ROLE_PAIR_TAIL = (
+    r"\s+as\s+(?P<left_role>" + _ROLES + r")\s+and\s+(?P<right>" + _NAME + r")"
+    r"\s+as\s+(?P<right_role>" + _ROLES + r")\b"
+)
+_TERM_ALIAS = r'\(the\s+"(?P<term>[A-Z][A-Za-z0-9 ]+)"\)'
+
 PARTY_LINE_PATTERN = re.compile(
-    r"(?P<name>[A-Z][A-Za-z0-9&.,'\- ]+?),\s+a[n]?\s+[^,\n]+?\((?P<labels>[^)]+)\)",
+    r"(?P<name>" + _NAME + r")" + _PARTY_LINE_TAIL,
     re.IGNORECASE,
 )
 ROLE_PAIR_PATTERN = re.compile(
-    r"\b(?P<left>[A-Z][A-Za-z0-9&.,'\- ]+?)\s+as\s+(?P<left_role>"
-    + "|".join(ROLE_NAMES)
-    + r")\s+and\s+(?P<right>[A-Z][A-Za-z0-9&.,'\- ]+?)\s+as\s+(?P<right_role>"
-    + "|".join(ROLE_NAMES)
-    + r")\b",
+    r"\b(?P<left>" + _NAME + r")" + _ROLE_PAIR_TAIL,
     re.IGNORECASE,
 )
 DATE_PATTERN = re.compile(
@@ -72,13 +81,7 @@ DEFINED_TERM_PATTERNS = (
         ),
         re.IGNORECASE,
     ),
-    re.compile(
-        (
-            r"(?P<definition>[A-Za-z0-9 ,\-]+?)\s+"
-            r'\(the\s+"(?P<term>[A-Z][A-Za-z0-9 ]+)"\)'
-        ),
-        re.IGNORECASE,
-    ),
+    re.compile(r"(?P<definition>[A-Za-z0-9 ,\-]+?)\s+" + _TERM_ALIAS, re.IGNORECASE),
 )
 OBLIGATION_PATTERN = re.compile(
     r"\b(shall|must|agrees to|is required to|will)\b",
@@ -98,6 +101,20 @@ TERMINATION_PATTERN = re.compile(
 SENTENCE_PATTERN = re.compile(r"[^.!?]+[.!?]", re.DOTALL)
 WHITESPACE_PATTERN = re.compile(r"[ \t]+")
 
+# The party, alias-definition and termination patterns start with a lazy or
+# greedy run of common characters, so re.finditer over the whole text retries
+# every start position across long paragraphs. Each match lies in one run of
+# the characters its leading group accepts and needs an anchor (the text after
+# that group) in the same run, so ContractIndex searches only those runs.
+_NAME_RUN = re.compile(r"[A-Za-z0-9&.,'\- ]+", re.IGNORECASE)
+_DEFINITION_RUN = re.compile(r"[A-Za-z0-9 ,\-\s]+", re.IGNORECASE)
+_PARTY_LINE_HINT = re.compile(r",\s+a[n]?\s", re.IGNORECASE)
+_PARTY_LINE_ANCHOR = re.compile(_PARTY_LINE_TAIL, re.IGNORECASE)
+_ROLE_PAIR_HINT = re.compile(r"(?=\s+as\s+(?:" + _ROLES + r")\s+and\s)", re.IGNORECASE)
+_ROLE_PAIR_ANCHOR = re.compile(_ROLE_PAIR_TAIL, re.IGNORECASE)
+_TERM_ALIAS_ANCHOR = re.compile(_TERM_ALIAS, re.IGNORECASE)
+_TERMINATE_WORD = re.compile(r"\bterminate(?:d|s)?\b", re.IGNORECASE)
+
 
 def _normalize_text(text: str) -> str:
     if text is None:
@@ -145,6 +162,128 @@ def _ordered_term_map(terms: dict[str, str]) -> OrderedDict[str, str]:
     return ordered
 
 
+def _timed(timings: dict | None, name: str, func, *args):
+    if timings is None:
+        return func(*args)
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings[name] = round(time.perf_counter() - started, 6)
+
+
+class _Runs:
+    # Maximal runs of one character class, found in a single scan.
+    def __init__(self, pattern: re.Pattern, text: str):
+        spans = [match.span() for match in pattern.finditer(text)]
+        self.starts = [start for start, _ in spans]
+        self.ends = [end for _, end in spans]
+
+    def containing(self, position: int) -> tuple[int, int] | None:
+        idx = bisect_right(self.starts, position) - 1
+        if idx >= 0 and position < self.ends[idx]:
+            return self.starts[idx], self.ends[idx]
+        return None
+
+
+def _add_window(windows: dict, run: tuple[int, int] | None, limit: int) -> None:
+    if run is None:
+        return
+    start, run_end = run
+    previous = windows.get(start)
+    windows[start] = (run_end, max(limit, previous[1]) if previous else limit)
+
+
+def _windowed_finditer(pattern: re.Pattern, text: str, windows: dict):
+    # Yields what pattern.finditer(text) would, given that every match starts
+    # in some window's [start, run_end) and ends by that window's limit.
+    # Matches starting past run_end are left to the window they belong to.
+    #
+    # Why this equals finditer: windows are disjoint runs visited in order,
+    # and none of these patterns matches the empty string. A search bounded
+    # by limit only finds starts that also match in the full text: no pattern
+    # reads past its last character, except ROLE_PAIR's closing \b, and every
+    # limit is an anchor end where that \b holds in the full text too. Say
+    # both sides have yielded the same matches so far and pos is the last
+    # end. finditer next yields m, the leftmost match starting at or after
+    # pos. By the premise, m starts in some window W and ends by W's limit.
+    # A window before W cannot hold a start in [pos, m.start()), since m is
+    # leftmost, so its search breaks and pos is unchanged. In W, the bounded
+    # search from max(pos, start) <= m.start() returns m itself. If finditer
+    # has no match left, no window can produce one. So both yield the same
+    # matches, in the same order.
+    pos = 0
+    for start in sorted(windows):
+        run_end, limit = windows[start]
+        while max(pos, start) < run_end:
+            match = pattern.search(text, max(pos, start), limit)
+            if match is None or match.start() >= run_end:
+                break
+            yield match
+            pos = match.end()
+
+
+class ContractIndex:
+    # Section map of one normalized contract, built once per extract() and
+    # shared by the sub-extractors: sentence boundaries, character runs,
+    # the party-alias index and the defined-term index.
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def sentences(self) -> list[tuple[int, int]]:
+        return [match.span() for match in SENTENCE_PATTERN.finditer(self.text)]
+
+    @cached_property
+    def name_runs(self) -> _Runs:
+        return _Runs(_NAME_RUN, self.text)
+
+    @cached_property
+    def definition_runs(self) -> _Runs:
+        return _Runs(_DEFINITION_RUN, self.text)
+
+    def party_line_matches(self):
+        windows = {}
+        for hint in _PARTY_LINE_HINT.finditer(self.text):
+            anchor = _PARTY_LINE_ANCHOR.match(self.text, hint.start())
+            if anchor:
+                run = self.name_runs.containing(hint.start())
+                _add_window(windows, run, anchor.end())
+        return _windowed_finditer(PARTY_LINE_PATTERN, self.text, windows)
+
+    def role_pair_matches(self):
+        windows = {}
+        for hint in _ROLE_PAIR_HINT.finditer(self.text):
+            anchor = _ROLE_PAIR_ANCHOR.match(self.text, hint.start())
+            if anchor and hint.start() > 0:
+                run = self.name_runs.containing(hint.start() - 1)
+                _add_window(windows, run, anchor.end())
+        return _windowed_finditer(ROLE_PAIR_PATTERN, self.text, windows)
+
+    def defined_term_matches(self):
+        windows = {}
+        for anchor in _TERM_ALIAS_ANCHOR.finditer(self.text):
+            if anchor.start() > 0:
+                run = self.definition_runs.containing(anchor.start() - 1)
+                _add_window(windows, run, anchor.end())
+        return chain(
+            DEFINED_TERM_PATTERNS[0].finditer(self.text),
+            _windowed_finditer(DEFINED_TERM_PATTERNS[1], self.text, windows),
+        )
+
+    def termination_matches(self):
+        # A termination clause is the whole run between two periods that holds
+        # the keyword, up to and including the closing period.
+        text = self.text
+        windows = {}
+        for keyword in _TERMINATE_WORD.finditer(text):
+            run_end = text.find(".", keyword.end())
+            if run_end >= 0:
+                run_start = text.rfind(".", 0, keyword.start()) + 1
+                _add_window(windows, (run_start, run_end), run_end + 1)
+        return _windowed_finditer(TERMINATION_PATTERN, text, windows)
+
+
 class LegalContractExtractors:
     domain = "legal_contract"
 
@@ -152,17 +291,42 @@ class LegalContractExtractors:
         return _normalize_text(text)
 
     def extract(self, normalized_text: str, context: dict):
+        return self._extract(normalized_text, None)
+
+    def extract_timed(self, normalized_text: str, context: dict):
+        # extract() plus the seconds each sub-extractor took, for provenance.
+        timings = {}
+        return self._extract(normalized_text, timings), timings
+
+    def _extract(self, normalized_text: str, timings: dict | None):
+        index = ContractIndex(normalized_text)
         try:
-            parties, party_aliases = self._extract_parties(normalized_text)
-            effective_date = self._extract_effective_date(normalized_text)
-            term = self._extract_term(normalized_text, effective_date)
-            obligations = self._extract_obligations(
-                normalized_text, parties, party_aliases
+            parties, party_aliases = _timed(
+                timings, "parties", self._extract_parties, index
+            )
+            effective_date = _timed(
+                timings, "effective_date", self._extract_effective_date, index
+            )
+            term = _timed(timings, "term", self._extract_term, index, effective_date)
+            obligations = _timed(
+                timings,
+                "obligations",
+                self._extract_obligations,
+                index,
+                parties,
+                party_aliases,
+            )
+            defined_terms = _timed(
+                timings, "defined_terms", self._extract_defined_terms, index
+            )
+            governing_law = _timed(
+                timings, "governing_law", self._extract_governing_law, index
             )
-            defined_terms = self._extract_defined_terms(normalized_text)
-            governing_law = self._extract_governing_law(normalized_text)
-            termination_conditions = self._extract_termination_conditions(
-                normalized_text
+            termination_conditions = _timed(
+                timings,
+                "termination_conditions",
+                self._extract_termination_conditions,
+                index,
             )
             warnings = self._warnings_for(
                 parties=parties,
@@ -245,9 +409,11 @@ class LegalContractExtractors:
             extraction_warnings=extracted["extraction_warnings"],
         )
 
-    def _extract_parties(self, text: str) -> tuple[list[dict], dict[str, str]]:
+    def _extract_parties(
+        self, index: ContractIndex
+    ) -> tuple[list[dict], dict[str, str]]:
         role_map: dict[str, str] = {}
-        for match in ROLE_PAIR_PATTERN.finditer(text):
+        for match in index.role_pair_matches():
             role_map[_clean_clause(match.group("left"))] = match.group(
                 "left_role"
             ).lower()
@@ -258,7 +424,7 @@ class LegalContractExtractors:
         parties: list[dict] = []
         aliases: dict[str, str] = {}
         seen_names: set[str] = set()
-        for match in PARTY_LINE_PATTERN.finditer(text):
+        for match in index.party_line_matches():
             name = _clean_party_name(match.group("name"))
             if name in seen_names:
                 continue
@@ -276,14 +442,14 @@ class LegalContractExtractors:
         parties.sort(key=lambda item: item["name"])
         return parties, aliases
 
-    def _extract_effective_date(self, text: str) -> str | None:
-        match = EFFECTIVE_DATE_PATTERN.search(text)
+    def _extract_effective_date(self, index: ContractIndex) -> str | None:
+        match = EFFECTIVE_DATE_PATTERN.search(index.text)
         if match:
             return _date_to_iso(match.group("date"))
         return None
 
-    def _extract_term(self, text: str, effective_date: str | None) -> dict:
-        match = TERM_PATTERN.search(text)
+    def _extract_term(self, index: ContractIndex, effective_date: str | None) -> dict:
+        match = TERM_PATTERN.search(index.text)
         if not match:
             return {"start": effective_date, "end": None, "duration_string": None}
         start = match.group("start")
@@ -297,22 +463,26 @@ class LegalContractExtractors:
         }
 
     def _extract_obligations(
-        self, text: str, parties: list[dict], aliases: dict[str, str]
+        self, index: ContractIndex, parties: list[dict], aliases: dict[str, str]
     ) -> list[dict]:
         known_subjects = [(party["name"], party["name"]) for party in parties]
         for alias, canonical in aliases.items():
             known_subjects.append((alias, canonical))
         for party in parties:
             known_subjects.append((party["role"].title(), party["name"]))
+        subject_patterns = [
+            (re.compile(rf"\b{re.escape(subject)}\b"), canonical)
+            for subject, canonical in known_subjects
+        ]
 
         obligations: list[dict] = []
-        for match in SENTENCE_PATTERN.finditer(text):
-            sentence = _clean_clause(match.group(0))
+        for start, end in index.sentences:
+            sentence = _clean_clause(index.text[start:end])
             if not OBLIGATION_PATTERN.search(sentence):
                 continue
             subject_hits = []
-            for subject, canonical in known_subjects:
-                subject_match = re.search(rf"\b{re.escape(subject)}\b", sentence)
+            for pattern, canonical in subject_patterns:
+                subject_match = pattern.search(sentence)
                 if subject_match:
                     subject_hits.append((subject_match.start(), canonical))
             party_name = None
@@ -324,24 +494,23 @@ class LegalContractExtractors:
                 {
                     "party": party_name,
                     "text": sentence,
-                    "offset": match.start(),
+                    "offset": start,
                 }
             )
         obligations.sort(key=lambda item: item["offset"])
         return obligations
 
-    def _extract_defined_terms(self, text: str) -> OrderedDict[str, str]:
+    def _extract_defined_terms(self, index: ContractIndex) -> OrderedDict[str, str]:
         terms: dict[str, str] = {}
-        for pattern in DEFINED_TERM_PATTERNS:
-            for match in pattern.finditer(text):
-                term = _clean_clause(match.group("term"))
-                definition = _clean_clause(match.group("definition")).rstrip(",")
-                if term not in terms:
-                    terms[term] = definition
+        for match in index.defined_term_matches():
+            term = _clean_clause(match.group("term"))
+            definition = _clean_clause(match.group("definition")).rstrip(",")
+            if term not in terms:
+                terms[term] = definition
         return _ordered_term_map(terms)
 
-    def _extract_governing_law(self, text: str) -> dict:
-        match = GOVERNING_LAW_PATTERN.search(text)
+    def _extract_governing_law(self, index: ContractIndex) -> dict:
+        match = GOVERNING_LAW_PATTERN.search(index.text)
         if not match:
             return {"jurisdiction": None, "full_clause": None}
         return {
@@ -349,9 +518,9 @@ class LegalContractExtractors:
             "full_clause": _clean_clause(match.group("clause")),
         }
 
-    def _extract_termination_conditions(self, text: str) -> list[str]:
+    def _extract_termination_conditions(self, index: ContractIndex) -> list[str]:
         clauses = []
-        for match in TERMINATION_PATTERN.finditer(text):
+        for match in index.termination_matches():
             clause = _clean_clause(match.group("clause"))
             if clause.lower().startswith("the term of this agreement"):
                 continue
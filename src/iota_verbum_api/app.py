@@ -22,7 +22,10 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from core.determinism.catalog import install_write_hook, uninstall_write_hook
 from core.determinism.replay import verify_run
+from core.determinism.schema_validate import preload_schemas, validator_cache_stats
+from core.determinism.verify_cache import verification_cache_stats
 from iota_verbum_api.casefile_studio import router as casefile_studio_router
 from iota_verbum_api.config import settings
 from iota_verbum_api.constants import (
@@ -64,6 +67,7 @@ from iota_verbum_api.services.storage import (
     next_record_id,
     write_provenance_record,
 )
+from iota_verbum_api.services.verification import verify_ledger
 from iota_verbum_api.utils import (
     hash_sensitive,
     isoformat_utc,
@@ -78,6 +82,9 @@ rate_limiter = InMemoryRateLimiter(settings.rate_limit_per_minute)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     run_migrations()
+    if settings.schema_preload:
+        preload_schemas()
+    catalog_hook = install_write_hook() if settings.ledger_catalog else None
     state = RuntimeState(started_at=now_utc())
     app.state.runtime = state
     with new_session() as db:
@@ -120,6 +127,8 @@ async def lifespan(app: FastAPI):
     finally:
         if state.retention_task:
             state.retention_task.cancel()
+        if catalog_hook is not None:
+            uninstall_write_hook(catalog_hook)
 
 
 app = FastAPI(title="IOTA VERBUM CORE", version=VERSION, lifespan=lifespan)
@@ -286,6 +295,8 @@ def status_endpoint(request: Request):
         "uptime_seconds": int((now_utc() - runtime.started_at).total_seconds()),
         "last_successful_db_write": isoformat_utc(runtime.last_successful_db_write),
         "last_successful_analysis": isoformat_utc(runtime.last_successful_analysis),
+        "schema_cache": validator_cache_stats(),
+        "verify_cache": verification_cache_stats(),
     }
 
 
@@ -594,9 +605,11 @@ def casefile_verify(
 ):
     del auth
     try:
-        verification = verify_run(
+        verification = verify_ledger(
             payload.ledger_dir,
             strict_manifest=payload.strict_manifest,
+            force_rehash=payload.force_rehash,
+            verifier=verify_run,
         )
         return {
             "status": "VERIFIED_OK",
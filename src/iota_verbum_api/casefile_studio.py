@@ -11,6 +11,7 @@ from fastapi.responses import FileResponse
 
 from core.determinism.hashing import sha256_bytes, sha256_text
 from core.determinism.replay import verify_run
+from iota_verbum_api.services.verification import verify_ledger
 from proposal.cli_demo import run_demo
 
 FIXTURES_PATH = Path("data/demo_cases/fixtures.json")
@@ -293,7 +294,9 @@ def _tracked_run_by_run_id(run_id: str) -> dict | None:
 
 def _authoritative_replay_status(ledger_dir: str) -> tuple[str, dict]:
     try:
-        verification = verify_run(ledger_dir, strict_manifest=True)
+        verification = verify_ledger(
+            ledger_dir, strict_manifest=True, verifier=verify_run
+        )
         return "VERIFIED_OK", {"verification": verification}
     except Exception as exc:  # noqa: BLE001
         return "VERIFIED_FAIL", {"error": str(exc)}
@@ -609,7 +612,10 @@ def api_replay_verify(run_id: str, payload: dict | None = None) -> dict:
     workspace = _run_workspace(run_id)
     ledger_dir = workspace["casefile"]["ledger_dir"]
     try:
-        result = verify_run(ledger_dir, strict_manifest=True)
+        # An explicit replay always re-hashes and refreshes the shared cache.
+        result = verify_ledger(
+            ledger_dir, strict_manifest=True, force_rehash=True, verifier=verify_run
+        )
         response = {
             "status": "VERIFIED_OK",
             "ledger_dir": ledger_dir,
@@ -20,6 +20,20 @@ class Settings:
     )
     retention_days_audit_log: int = int(os.getenv("RETENTION_DAYS_AUDIT_LOG", "2555"))
     rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
+    schema_preload: bool = os.getenv("SCHEMA_PRELOAD", "false").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    verify_cache_ttl_seconds: float = float(
+        os.getenv("VERIFY_CACHE_TTL_SECONDS", "3600")
+    )
+    verify_cache_path: str = os.getenv("VERIFY_CACHE_PATH", "")
+    ledger_catalog: bool = os.getenv("LEDGER_CATALOG", "false").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+    }
 
     @property
     def api_keys(self) -> dict[str, str]:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 
 from iota_verbum_api.utils import normalize_text
 
@@ -22,6 +23,12 @@ class RuleDefinition:
     clause_type_en: str
     rule_id: str
     patterns: tuple[str, ...]
+    compiled: tuple[re.Pattern, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Compiled once, when RULE_SETS is built at import.
+        compiled = tuple(re.compile(pattern) for pattern in self.patterns)
+        object.__setattr__(self, "compiled", compiled)
 
 
 @dataclass(frozen=True)
@@ -33,9 +40,10 @@ class LanguageRuleSet:
 
     def extract(self, text: str) -> dict:
         normalized = normalize_text(text)
+        found = _match_rules(normalized, self.rules)
         clauses = []
         for rule in self.rules:
-            sentence = _extract_matching_sentence(normalized, rule.patterns)
+            sentence = found.get(rule.rule_id)
             if not sentence:
                 continue
             clauses.append(
@@ -59,14 +67,39 @@ class LanguageRuleSet:
         }
 
 
-def _extract_matching_sentence(text: str, patterns: tuple[str, ...]) -> str | None:
-    sentences = re.split(r"(?<=[.!?])\s+|\n\n+", text)
-    for sentence in sentences:
-        candidate = sentence.strip()
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\n+")
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    # The pieces re.split(_SENTENCE_BREAK, text) returns, stripped, produced
+    # lazily so a sweep that stops early never splits the rest of the text.
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        yield text[start : match.start()].strip()
+        start = match.end()
+    yield text[start:].strip()
+
+
+def _match_rules(text: str, rules: tuple[RuleDefinition, ...]) -> dict[str, str]:
+    # One sweep over the sentences, each lowercased once. Maps every rule_id to
+    # the first sentence all of its patterns match, and stops once every rule
+    # has one.
+    pending = [(rule.rule_id, rule.compiled) for rule in rules]
+    found: dict[str, str] = {}
+    for candidate in _iter_sentences(text):
         lowered = candidate.lower()
-        if all(re.search(pattern, lowered) for pattern in patterns):
-            return candidate
-    return None
+        remaining = []
+        for rule_id, patterns in pending:
+            for pattern in patterns:
+                if pattern.search(lowered) is None:
+                    remaining.append((rule_id, patterns))
+                    break
+            else:
+                found[rule_id] = candidate
+        if not remaining:
+            break
+        pending = remaining
+    return found
 
 
 RULE_SETS = {
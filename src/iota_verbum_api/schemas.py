@@ -25,3 +25,4 @@ class CasefileGenerateRequest(BaseModel):
 class CasefileVerifyRequest(BaseModel):
     ledger_dir: str
     strict_manifest: bool = True
+    force_rehash: bool = False
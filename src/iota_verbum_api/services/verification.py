@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from core.determinism.replay import verify_run
+from core.determinism.verify_cache import verify_run_cached
+from iota_verbum_api.config import settings
+
+
+def verify_ledger(
+    ledger_dir: str,
+    *,
+    strict_manifest: bool,
+    force_rehash: bool = False,
+    verifier=verify_run,
+) -> dict:
+    return verify_run_cached(
+        ledger_dir,
+        strict_manifest=strict_manifest,
+        force_rehash=force_rehash,
+        ttl_seconds=settings.verify_cache_ttl_seconds,
+        cache_path=settings.verify_cache_path or None,
+        verifier=verifier,
+    )
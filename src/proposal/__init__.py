@@ -12,6 +12,8 @@ from proposal.claim_propose import (
 from proposal.cli_demo import run_demo
 from proposal.cli_world import main as world_cli_main
 from proposal.evidence_pack import build_evidence_pack
+from proposal.pack_index import PackIndex, load_pack_index
+from proposal.pack_ndjson import NdjsonPack, convert_pack, write_ndjson_pack
 from proposal.text_normalize import normalize_text
 from proposal.world_enrich import apply_world_enrichment, load_world_enrichment
 from proposal.world_propose import (
@@ -24,12 +26,16 @@ from proposal.world_propose import (
 )
 
 __all__ = [
+    "NdjsonPack",
+    "PackIndex",
     "build_evidence_pack",
     "build_evidence_bundle_from_pack",
     "chunk_document",
+    "convert_pack",
     "dumps_claim_graph",
     "load_evidence_pack",
     "load_pack",
+    "load_pack_index",
     "load_world_pack",
     "normalize_text",
     "apply_world_enrichment",
@@ -43,4 +49,5 @@ __all__ = [
     "select_chunks",
     "dumps_world_model",
     "world_cli_main",
+    "write_ndjson_pack",
 ]
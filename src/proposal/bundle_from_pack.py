@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import heapq
 import json
 import re
 from pathlib import Path
 
 from core.determinism.bundle import build_evidence_bundle
-from core.determinism.hashing import sha256_text
 from core.determinism.schema_validate import validate
+from core.determinism.text_store import TextStore
+from proposal.pack_index import PackIndex, query_tokens
+from proposal.pack_ndjson import NdjsonPack, is_ndjson_pack
 from proposal.text_normalize import normalize_text
 
 
 def load_pack(path: str) -> dict:
+    if is_ndjson_pack(path):
+        # Header and documents are checked on open; chunks as they are read.
+        return NdjsonPack(path).as_pack()
     pack = json.loads(Path(path).read_text(encoding="utf-8"))
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="seal")
     return pack
 
 
@@ -27,10 +33,15 @@ def select_chunks(
     mode: str,
     query: str,
     max_chunks: int,
+    index: PackIndex | None = None,
 ) -> list[dict]:
-    validate(pack, "schemas/evidence_pack.schema.json")
+    if isinstance(pack["chunks"], list):
+        validate(pack, "schemas/evidence_pack.schema.json", scope="internal")
     if max_chunks < 0:
         raise ValueError("max_chunks must be non-negative")
+    if index is not None:
+        index.check(pack)
+        return _select_indexed(pack, index, mode, query, max_chunks)
 
     docs_by_id = {
         document["doc_id"]: document
@@ -75,6 +86,10 @@ def select_chunks(
                     )
             scored.sort()
             selected = [item[-1] for item in scored]
+        elif mode == "bm25":
+            return _select_indexed(
+                pack, PackIndex.build(pack), mode, query, max_chunks
+            )
         else:
             raise ValueError(f"unsupported selection mode: {mode}")
 
@@ -83,6 +98,50 @@ def select_chunks(
     return selected[:max_chunks]
 
 
+def _select_indexed(
+    pack: dict, index: PackIndex, mode: str, query: str, max_chunks: int
+) -> list[dict]:
+    # Same selections as the unindexed path; keyword and topk only search the
+    # chunks the index cannot rule out.
+    if mode == "all":
+        ordinals = range(len(index.order))
+    else:
+        terms = _query_terms(query)
+        if not terms:
+            ordinals = []
+        elif mode in ("keyword", "topk"):
+            candidates = index.substring_candidates(
+                terms, match_all=mode == "keyword"
+            )
+            if candidates is None:
+                candidates = range(len(index.order))
+            if mode == "keyword":
+                ordinals = []
+                for ordinal in candidates:
+                    if len(ordinals) == max_chunks:
+                        break
+                    text = index.text(pack, ordinal)
+                    if all(term in text for term in terms):
+                        ordinals.append(ordinal)
+            else:
+                scored = []
+                for ordinal in candidates:
+                    text = index.text(pack, ordinal)
+                    score = sum(text.count(term) for term in terms)
+                    if score > 0:
+                        scored.append((-score, ordinal))
+                ordinals = [
+                    ordinal for _, ordinal in heapq.nsmallest(max_chunks, scored)
+                ]
+        elif mode == "bm25":
+            ordinals = index.bm25(query_tokens(query), limit=max_chunks)
+        else:
+            raise ValueError(f"unsupported selection mode: {mode}")
+
+    chunks = pack["chunks"]
+    return [chunks[index.order[ordinal]] for ordinal in ordinals[:max_chunks]]
+
+
 def build_evidence_bundle_from_pack(
     pack: dict,
     *,
@@ -94,12 +153,17 @@ def build_evidence_bundle_from_pack(
     mode: str = "all",
     query: str = "",
     max_chunks: int = 50,
+    index: PackIndex | None = None,
+    text_store: TextStore | None = None,
 ) -> tuple[dict, bytes, str]:
+    if text_store is None:
+        text_store = TextStore()
     selected_chunks = select_chunks(
         pack,
         mode=mode,
         query=query,
         max_chunks=max_chunks,
+        index=index,
     )
     artifacts = sorted(
         [
@@ -120,8 +184,9 @@ def build_evidence_bundle_from_pack(
         ),
     )
     for artifact in artifacts:
-        if sha256_text(artifact["text"]) != artifact["text_sha256"]:
+        if text_store.sha256(artifact["text"]) != artifact["text_sha256"]:
             raise ValueError("artifact text_sha256 does not match artifact text")
+        artifact["text"] = text_store.add(artifact["text"])
 
     bundle_obj = {
         "bundle_version": "1.0",
@@ -144,5 +209,9 @@ def build_evidence_bundle_from_pack(
             "ruleset_id": ruleset_id,
         },
     }
-    bundle_bytes, bundle_sha256 = build_evidence_bundle(bundle_obj)
+    # The artifacts were just checked through text_store, so the bundle's own
+    # text_sha256 pass finds every digest already computed.
+    bundle_bytes, bundle_sha256 = build_evidence_bundle(
+        bundle_obj, text_store=text_store
+    )
     return bundle_obj, bundle_bytes, bundle_sha256
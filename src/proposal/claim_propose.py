@@ -15,7 +15,7 @@ _BULLET_RE = re.compile(r"^(?:[-*]|\d+\.)\s+(.*)$")
 
 def load_evidence_pack(path: str) -> dict:
     pack = json.loads(Path(path).read_text(encoding="utf-8"))
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="seal")
     return pack
 
 
@@ -39,7 +39,7 @@ def _claim_id(
 
 
 def propose_claim_graph(evidence_pack: dict) -> dict:
-    validate(evidence_pack, "schemas/evidence_pack.schema.json")
+    validate(evidence_pack, "schemas/evidence_pack.schema.json", scope="internal")
 
     claims = []
     for document in evidence_pack["documents"]:
@@ -107,9 +107,9 @@ def propose_claim_graph(evidence_pack: dict) -> dict:
     claims.sort(key=lambda claim: claim["_sort_key"])
     for claim in claims:
         del claim["_sort_key"]
-        validate(claim, "schemas/claim.schema.json")
+        validate(claim, "schemas/claim.schema.json", scope="item")
         for evidence_ref in claim["evidence"]:
-            validate(evidence_ref, "schemas/evidence_ref.schema.json")
+            validate(evidence_ref, "schemas/evidence_ref.schema.json", scope="item")
 
     subject_groups: dict[str, list[dict]] = {}
     for claim in claims:
@@ -143,7 +143,7 @@ def propose_claim_graph(evidence_pack: dict) -> dict:
             key=lambda edge: (edge["type"], edge["from_id"], edge["to_id"]),
         ),
     }
-    validate(graph, "schemas/claim_graph.schema.json")
+    validate(graph, "schemas/claim_graph.schema.json", scope="internal")
     return graph
 
 
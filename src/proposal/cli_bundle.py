@@ -4,6 +4,7 @@ import argparse
 from pathlib import Path
 
 from proposal.bundle_from_pack import build_evidence_bundle_from_pack, load_pack
+from proposal.pack_index import load_pack_index
 
 
 def _write_atomic(path: Path, data: bytes) -> None:
@@ -20,12 +21,16 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--created-utc", required=True)
     parser.add_argument("--core-version", required=True)
     parser.add_argument("--ruleset-id", required=True)
-    parser.add_argument("--mode", default="all", choices=["all", "keyword", "topk"])
+    parser.add_argument(
+        "--mode", default="all", choices=["all", "keyword", "topk", "bm25"]
+    )
     parser.add_argument("--query", default="")
     parser.add_argument("--max-chunks", type=int, default=50)
+    parser.add_argument("--index", help="search sidecar written by cli_pack --index")
     args = parser.parse_args(argv)
 
     pack = load_pack(args.pack)
+    index = load_pack_index(args.index, pack) if args.index else None
     bundle_obj, bundle_bytes, bundle_sha256 = build_evidence_bundle_from_pack(
         pack,
         prompt=args.prompt,
@@ -36,6 +41,7 @@ def main(argv: list[str] | None = None) -> int:
         mode=args.mode,
         query=args.query,
         max_chunks=args.max_chunks,
+        index=index,
     )
     output_path = Path(args.out)
     output_path.parent.mkdir(parents=True, exist_ok=True)
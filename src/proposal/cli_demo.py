@@ -12,6 +12,7 @@ from core.determinism.canonical_json import dumps_canonical
 from core.determinism.finalize import finalize
 from core.determinism.hashing import sha256_bytes, sha256_text
 from core.determinism.ledger import write_run
+from core.determinism.schema_validate import VALIDATION_POLICIES, validation_policy
 from core.reasoning.casefile import build_casefile, casefile_artifact_sha256
 from core.reasoning.causal import compute_causal_graph
 from core.reasoning.causal_narrative_v2 import render_causal_narrative_v2
@@ -672,24 +673,26 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--diff-against", default="")
     parser.add_argument("--max-events", type=int, default=30)
     parser.add_argument("--enrich", default="")
+    parser.add_argument("--validation-policy", choices=VALIDATION_POLICIES)
     args = parser.parse_args(argv)
 
-    result = run_demo(
-        folder=args.folder,
-        query=args.query,
-        prompt=args.prompt,
-        max_chunks=args.max_chunks,
-        created_utc=args.created_utc,
-        core_version=args.core_version,
-        ruleset_id=args.ruleset_id,
-        world=_parse_bool(args.world),
-        verbosity=args.verbosity,
-        show_receipts=_parse_bool(args.show_receipts),
-        max_lines=args.max_lines,
-        diff_against=args.diff_against,
-        max_events=args.max_events,
-        enrich=args.enrich,
-    )
+    with validation_policy(args.validation_policy):
+        result = run_demo(
+            folder=args.folder,
+            query=args.query,
+            prompt=args.prompt,
+            max_chunks=args.max_chunks,
+            created_utc=args.created_utc,
+            core_version=args.core_version,
+            ruleset_id=args.ruleset_id,
+            world=_parse_bool(args.world),
+            verbosity=args.verbosity,
+            show_receipts=_parse_bool(args.show_receipts),
+            max_lines=args.max_lines,
+            diff_against=args.diff_against,
+            max_events=args.max_events,
+            enrich=args.enrich,
+        )
     print(result["report"], end="")
     return 0
 
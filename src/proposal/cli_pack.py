@@ -3,7 +3,11 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from core.determinism.canonical_json import dumps_canonical
+from core.determinism.text_store import TextStore
 from proposal.evidence_pack import build_evidence_pack
+from proposal.pack_index import PackIndex, index_path_for
+from proposal.pack_ndjson import dumps_ndjson_pack, is_ndjson_pack
 
 
 def _write_atomic(path: Path, data: bytes) -> None:
@@ -15,26 +19,52 @@ def _write_atomic(path: Path, data: bytes) -> None:
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("folder")
-    parser.add_argument("--out", required=True)
+    parser.add_argument(
+        "--out", required=True, help="a .ndjson path writes the NDJSON layout"
+    )
     parser.add_argument("--root-hint", default="")
     parser.add_argument("--max-chars", type=int, default=1200)
     parser.add_argument("--overlap-chars", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--cache", help="SQLite file caching per-file documents and chunks"
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="also write the <pack>.index.json search sidecar",
+    )
+    parser.add_argument(
+        "--dedup-report",
+        action="store_true",
+        help="print how often chunk texts repeat across documents",
+    )
     args = parser.parse_args(argv)
+    text_store = TextStore()
 
     pack_obj, pack_bytes = build_evidence_pack(
         args.folder,
         root_hint=args.root_hint,
         max_chars=args.max_chars,
         overlap_chars=args.overlap_chars,
+        workers=args.workers,
+        cache_path=args.cache,
+        text_store=text_store,
     )
     output_path = Path(args.out)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    if is_ndjson_pack(output_path):
+        pack_bytes = dumps_ndjson_pack(pack_obj)
     _write_atomic(output_path, pack_bytes)
+    if args.index:
+        _write_atomic(index_path_for(output_path), PackIndex.build(pack_obj).dumps())
     print(
         f"{pack_obj['pack_sha256']} "
         f"docs={len(pack_obj['documents'])} "
         f"chunks={len(pack_obj['chunks'])}"
     )
+    if args.dedup_report:
+        print(dumps_canonical(text_store.report()).decode("utf-8"))
     return 0
 
 
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import argparse
+
+from proposal.pack_ndjson import convert_pack
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert an evidence pack between .json and .ndjson layouts."
+    )
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args(argv)
+
+    print(convert_pack(args.source, args.destination))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Hashable, Iterable
+
+
+class AhoCorasick:
+    """Finds every pattern occurring in a text in one pass over the text.
+
+    Each pattern carries a value; search() returns the values of all patterns
+    that occur, exactly as ``pattern in text`` would report them.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, Hashable]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        values: list[set] = [set()]
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    values.append(set())
+                state = next_state
+            values[state].add(value)
+
+        # Breadth-first, so a state's failure link is final before its
+        # children need it; each state also inherits its suffix's values.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                values[next_state] |= values[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._values = [frozenset(found) for found in values]
+
+    def search(self, text: str) -> set:
+        goto = self._goto
+        fail = self._fail
+        values = self._values
+        matched_states = set()
+        state = 0
+        for char in text:
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            if values[state]:
+                matched_states.add(state)
+        # An empty pattern occurs in every text.
+        found = set(values[0])
+        for matched in matched_states:
+            found |= values[matched]
+        return found
+
+
+class EntityAutomaton:
+    """Entity names and aliases, matched case-insensitively in bullet lines.
+
+    Built once per event proposal; match() gives a line's objects, state and
+    entity label tokens from a single scan of the lowercased line.
+    """
+
+    def __init__(self, entities: list[dict]) -> None:
+        patterns = []
+        labels: dict[str, set[str]] = {}
+        for entity in entities:
+            entity_id = entity["entity_id"]
+            # Secret state is keyed by name and found only through the name.
+            secret_name = entity["name"] if entity["type"] == "Secret" else None
+            patterns.append((entity["name"].lower(), (entity_id, secret_name)))
+            for alias in entity["aliases"]:
+                patterns.append((alias.lower(), (entity_id, None)))
+            labels.setdefault(entity_id, set()).update(
+                token.lower() for token in (entity["name"], *entity["aliases"])
+            )
+        self._automaton = AhoCorasick(patterns)
+        self._labels = labels
+
+    def match(self, action: str) -> tuple[list[str], dict | None, list[str]]:
+        lower = action.lower()
+        found = self._automaton.search(lower)
+        objects = sorted({entity_id for entity_id, _ in found})
+
+        if "never in source" in lower or "never in repo" in lower:
+            state_value = "never-in-repo"
+        elif "environment only" in lower or "env-only" in lower:
+            state_value = "env-only"
+        else:
+            state_value = None
+        state = None
+        if state_value is not None:
+            names = sorted({name for _, name in found if name is not None})
+            if names:
+                state = {name: state_value for name in names}
+
+        label_tokens = sorted(
+            {token for entity_id in objects for token in self._labels[entity_id]}
+        )
+        return objects, state, label_tokens
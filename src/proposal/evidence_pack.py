@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from core.determinism.canonical_json import dumps_canonical
 from core.determinism.hashing import sha256_bytes, sha256_text
 from core.determinism.schema_validate import validate
+from core.determinism.text_store import TextStore
 from proposal.chunking import chunk_document
+from proposal.pack_cache import PackCache, file_fingerprint, record_lookups
 from proposal.text_normalize import normalize_text
 
 
@@ -22,11 +25,75 @@ def _iter_source_files(folder: Path) -> list[Path]:
     )
 
 
-def _compute_pack_sha256(pack_obj: dict) -> str:
-    pack_for_hash = deepcopy(pack_obj)
-    pack_for_hash["pack_sha256"] = ""
-    canonical_bytes = dumps_canonical(pack_for_hash)
-    return sha256_bytes(canonical_bytes)
+_BLANK_PACK_SHA256 = b'"pack_sha256":""'
+
+
+def _seal_pack(pack_obj: dict) -> tuple[str, bytes]:
+    # The pack is encoded once. pack_sha256 hashes those bytes with the field
+    # blank, and the sealed bytes differ only in that top-level value. String
+    # contents are escaped, so the unescaped marker can only be that key.
+    blank_bytes = dumps_canonical({**pack_obj, "pack_sha256": ""})
+    pack_sha256 = sha256_bytes(blank_bytes)
+    if blank_bytes.count(_BLANK_PACK_SHA256) != 1:
+        raise ValueError("evidence pack has no unique pack_sha256 field")
+    sealed_bytes = blank_bytes.replace(
+        _BLANK_PACK_SHA256, f'"pack_sha256":"{pack_sha256}"'.encode("ascii")
+    )
+    return pack_sha256, sealed_bytes
+
+
+def _build_document(
+    task: tuple[str, str, int, int], text_store: TextStore | None = None
+) -> tuple[dict, list[dict]]:
+    path, relpath, max_chars, overlap_chars = task
+    if text_store is None:
+        text_store = TextStore()
+    raw_bytes = Path(path).read_bytes()
+    try:
+        decoded_text = raw_bytes.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise ValueError(f"file is not valid UTF-8: {relpath}") from exc
+
+    canonical_doc_text = normalize_text(decoded_text)
+    doc_sha256 = sha256_text(canonical_doc_text)
+    doc_id = f"doc:{doc_sha256}"
+    canonical_doc_bytes = canonical_doc_text.encode("utf-8")
+
+    document = {
+        "doc_id": doc_id,
+        "relpath": relpath,
+        "sha256": doc_sha256,
+        "bytes": len(canonical_doc_bytes),
+    }
+    chunks = []
+    for chunk in chunk_document(
+        canonical_doc_text,
+        max_chars=max_chars,
+        overlap_chars=overlap_chars,
+    ):
+        chunk_sha256 = text_store.sha256(chunk["text"])
+        chunks.append(
+            {
+                "doc_id": doc_id,
+                "chunk_id": f"chunk:{chunk_sha256}",
+                "index": chunk["index"],
+                "offset_start": chunk["offset_start"],
+                "offset_end": chunk["offset_end"],
+                "text": chunk["text"],
+                "text_sha256": chunk_sha256,
+            }
+        )
+    return document, chunks
+
+
+def _build_documents(
+    tasks: list, workers: int, text_store: TextStore
+) -> list[tuple[dict, list[dict]]]:
+    if workers <= 1 or len(tasks) <= 1:
+        return [_build_document(task, text_store) for task in tasks]
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_document, tasks, chunksize=chunksize))
 
 
 def build_evidence_pack(
@@ -35,50 +102,67 @@ def build_evidence_pack(
     root_hint: str = "",
     max_chars: int = 1200,
     overlap_chars: int = 120,
+    workers: int = 1,
+    cache_path: str | Path | None = None,
+    text_store: TextStore | None = None,
 ) -> tuple[dict, bytes]:
     root = Path(folder)
-    documents = []
-    chunks = []
-
-    for path in _iter_source_files(root):
-        relpath = path.relative_to(root).as_posix()
-        raw_bytes = path.read_bytes()
-        try:
-            decoded_text = raw_bytes.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            raise ValueError(f"file is not valid UTF-8: {relpath}") from exc
+    if text_store is None:
+        text_store = TextStore()
+    files = [
+        (path, path.relative_to(root).as_posix()) for path in _iter_source_files(root)
+    ]
+    built: list[tuple[dict, list[dict]] | None] = [None] * len(files)
 
-        canonical_doc_text = normalize_text(decoded_text)
-        doc_sha256 = sha256_text(canonical_doc_text)
-        doc_id = f"doc:{doc_sha256}"
-        canonical_doc_bytes = canonical_doc_text.encode("utf-8")
+    # Files whose fingerprint matches the cache reuse their document and
+    # chunks; the rest are rebuilt, in parallel when workers > 1. Results are
+    # reassembled in relpath order, so the pack bytes match a cold serial build.
+    cache = PackCache(cache_path) if cache_path else None
+    if cache is not None:
+        root_key = str(root.resolve())
+        cached = cache.load(root_key, max_chars=max_chars, overlap_chars=overlap_chars)
+        fingerprints = []
+        for position, (path, relpath) in enumerate(files):
+            fingerprint = file_fingerprint(path.stat())
+            fingerprints.append(fingerprint)
+            entry = cached.get(relpath)
+            if entry is not None and entry[0] == fingerprint:
+                built[position] = (json.loads(entry[1]), json.loads(entry[2]))
 
-        documents.append(
-            {
-                "doc_id": doc_id,
-                "relpath": relpath,
-                "sha256": doc_sha256,
-                "bytes": len(canonical_doc_bytes),
-            }
-        )
+    misses = [position for position, result in enumerate(built) if result is None]
+    results = _build_documents(
+        [
+            (str(files[position][0]), files[position][1], max_chars, overlap_chars)
+            for position in misses
+        ],
+        workers,
+        text_store,
+    )
+    for position, result in zip(misses, results):
+        built[position] = result
 
-        for chunk in chunk_document(
-            canonical_doc_text,
+    if cache is not None:
+        current = {relpath for _, relpath in files}
+        cache.update(
+            root_key,
             max_chars=max_chars,
             overlap_chars=overlap_chars,
-        ):
-            chunk_sha256 = sha256_text(chunk["text"])
-            chunks.append(
-                {
-                    "doc_id": doc_id,
-                    "chunk_id": f"chunk:{chunk_sha256}",
-                    "index": chunk["index"],
-                    "offset_start": chunk["offset_start"],
-                    "offset_end": chunk["offset_end"],
-                    "text": chunk["text"],
-                    "text_sha256": chunk_sha256,
-                }
-            )
+            entries=[
+                (files[position][1], fingerprints[position], *built[position])
+                for position in misses
+            ],
+            stale=[relpath for relpath in cached if relpath not in current],
+        )
+        record_lookups(hits=len(files) - len(misses), misses=len(misses))
+
+    documents = []
+    chunks = []
+    for document, document_chunks in built:
+        documents.append(document)
+        chunks.extend(document_chunks)
+    # Repeated texts, however they were built, end up sharing one string.
+    for chunk in chunks:
+        chunk["text"] = text_store.add(chunk["text"], chunk["text_sha256"])
 
     pack_obj = {
         "pack_version": "1.0",
@@ -87,7 +171,6 @@ def build_evidence_pack(
         "chunks": chunks,
         "pack_sha256": "",
     }
-    pack_obj["pack_sha256"] = _compute_pack_sha256(pack_obj)
-    validate(pack_obj, "schemas/evidence_pack.schema.json")
-    pack_bytes = dumps_canonical(pack_obj)
+    pack_obj["pack_sha256"], pack_bytes = _seal_pack(pack_obj)
+    validate(pack_obj, "schemas/evidence_pack.schema.json", scope="io")
     return pack_obj, pack_bytes
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+# Bump when the cached entry layout changes. Entries are also keyed by a
+# digest of the modules that build a file's document and chunks, so editing
+# the chunker or the normalizer invalidates them without a manual bump.
+PACK_CACHE_FORMAT = 1
+_BUILDER_SOURCES = ("chunking.py", "text_normalize.py", "evidence_pack.py")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pack_entries (
+    root TEXT NOT NULL,
+    relpath TEXT NOT NULL,
+    max_chars INTEGER NOT NULL,
+    overlap_chars INTEGER NOT NULL,
+    builder_version TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    document_json TEXT NOT NULL,
+    chunks_json TEXT NOT NULL,
+    PRIMARY KEY (root, relpath, max_chars, overlap_chars)
+)
+"""
+
+_STATS_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0, "pruned": 0}
+
+
+def _bump(counter: str, amount: int = 1) -> None:
+    with _STATS_LOCK:
+        _STATS[counter] += amount
+
+
+def record_lookups(*, hits: int, misses: int) -> None:
+    _bump("hits", hits)
+    _bump("misses", misses)
+
+
+def pack_cache_stats() -> dict:
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
+@lru_cache(maxsize=1)
+def builder_version() -> str:
+    digest = hashlib.sha256(f"pack_cache:{PACK_CACHE_FORMAT}".encode("ascii"))
+    for name in _BUILDER_SOURCES:
+        digest.update(b"\0" + (Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+def file_fingerprint(stat: os.stat_result) -> str:
+    # ctime and inode ride along with size and mtime, as in the verification
+    # cache: a rewrite that restores the old mtime still misses.
+    return (
+        f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ctime_ns}"
+        f":{stat.st_dev}:{stat.st_ino}"
+    )
+
+
+class PackCache:
+    """Per-file documents and chunks from earlier builds of the same folder."""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self.version = builder_version()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(_SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+    def load(
+        self, root: str, *, max_chars: int, overlap_chars: int
+    ) -> dict[str, tuple[str, str, str]]:
+        """relpath -> (fingerprint, document_json, chunks_json) for one build.
+
+        Entries written by another builder_version are left out; the next
+        update() deletes them.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT relpath, fingerprint, document_json, chunks_json "
+                "FROM pack_entries WHERE root = ? AND max_chars = ? "
+                "AND overlap_chars = ? AND builder_version = ?",
+                (root, max_chars, overlap_chars, self.version),
+            ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def update(
+        self,
+        root: str,
+        *,
+        max_chars: int,
+        overlap_chars: int,
+        entries: list[tuple[str, str, dict, list[dict]]],
+        stale: list[str],
+    ) -> None:
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO pack_entries "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        root,
+                        relpath,
+                        max_chars,
+                        overlap_chars,
+                        self.version,
+                        fingerprint,
+                        json.dumps(document),
+                        json.dumps(chunks),
+                    )
+                    for relpath, fingerprint, document, chunks in entries
+                ],
+            )
+            pruned = connection.executemany(
+                "DELETE FROM pack_entries WHERE root = ? AND relpath = ? "
+                "AND max_chars = ? AND overlap_chars = ?",
+                [(root, relpath, max_chars, overlap_chars) for relpath in stale],
+            ).rowcount
+            pruned += connection.execute(
+                "DELETE FROM pack_entries WHERE root = ? AND builder_version != ?",
+                (root, self.version),
+            ).rowcount
+        _bump("pruned", pruned)
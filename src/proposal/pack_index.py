@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+from core.determinism.canonical_json import dumps_canonical
+from proposal.text_normalize import normalize_text
+
+INDEX_VERSION = "1.0"
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"\w+")
+
+
+def index_path_for(pack_path: str | Path) -> Path:
+    path = Path(pack_path)
+    return path.with_name(f"{path.stem}.index.json")
+
+
+def chunk_order(pack: dict) -> list[int]:
+    """Chunk positions in select_chunks order: relpath, doc_id, index, chunk_id."""
+    relpaths = {
+        document["doc_id"]: document["relpath"] for document in pack["documents"]
+    }
+    chunks = pack["chunks"]
+    return sorted(
+        range(len(chunks)),
+        key=lambda position: (
+            relpaths[chunks[position]["doc_id"]],
+            chunks[position]["doc_id"],
+            chunks[position]["index"],
+            chunks[position]["chunk_id"],
+        ),
+    )
+
+
+def _search_text(chunk: dict) -> str:
+    return normalize_text(chunk["text"]).lower()
+
+
+def _tokens(text: str) -> list[str]:
+    if text.isascii():
+        return _TOKEN.findall(text)
+    return [unicodedata.normalize("NFC", token) for token in _TOKEN.findall(text)]
+
+
+def query_tokens(query: str) -> list[str]:
+    return list(dict.fromkeys(_tokens(normalize_text(query).lower())))
+
+
+class PackIndex:
+    """Inverted index over a pack's chunks, in select_chunks order.
+
+    Ordinals are positions in that order; ``order[ordinal]`` is the chunk's
+    position in ``pack["chunks"]``. Postings map an NFC token of the lowercased
+    chunk text to its (ordinal, tf) pairs in ordinal order, flattened into
+    ``[ordinal, tf, ordinal, tf, ...]``. ``loose`` lists the
+    ordinals whose lowercased text is not NFC, where a token may not be a
+    substring of the text the keyword and topk modes search.
+    """
+
+    def __init__(self, pack_sha256, order, doc_lengths, postings, loose):
+        self.pack_sha256 = pack_sha256
+        self.order = order
+        self.doc_lengths = doc_lengths
+        self.postings = postings
+        self.loose = loose
+        self._texts: dict[int, str] = {}
+        self._norms: list[float] | None = None
+        self._containing: dict[str, frozenset[int]] = {}
+
+    @classmethod
+    def build(cls, pack: dict) -> "PackIndex":
+        order = chunk_order(pack)
+        chunks = pack["chunks"]
+        doc_lengths = []
+        postings: dict[str, list[int]] = {}
+        loose = []
+        for ordinal, position in enumerate(order):
+            text = _search_text(chunks[position])
+            if not text.isascii() and not unicodedata.is_normalized("NFC", text):
+                loose.append(ordinal)
+            tokens = _tokens(text)
+            doc_lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                entry = postings.get(token)
+                if entry is None:
+                    postings[token] = [ordinal, tf]
+                else:
+                    entry += (ordinal, tf)
+        return cls(pack["pack_sha256"], order, doc_lengths, postings, loose)
+
+    def to_json(self) -> dict:
+        return {
+            "index_version": INDEX_VERSION,
+            "pack_sha256": self.pack_sha256,
+            "chunk_order": self.order,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+            "loose_ordinals": self.loose,
+        }
+
+    @classmethod
+    def from_json(cls, obj: dict) -> "PackIndex":
+        if obj.get("index_version") != INDEX_VERSION:
+            raise ValueError("unsupported pack index version")
+        return cls(
+            obj["pack_sha256"],
+            obj["chunk_order"],
+            obj["doc_lengths"],
+            obj["postings"],
+            obj["loose_ordinals"],
+        )
+
+    def dumps(self) -> bytes:
+        return dumps_canonical(self.to_json())
+
+    def check(self, pack: dict) -> None:
+        if self.pack_sha256 != pack["pack_sha256"] or len(self.order) != len(
+            pack["chunks"]
+        ):
+            raise ValueError("pack index does not match evidence pack")
+
+    def text(self, pack: dict, ordinal: int) -> str:
+        text = self._texts.get(ordinal)
+        if text is None:
+            text = _search_text(pack["chunks"][self.order[ordinal]])
+            self._texts[ordinal] = text
+        return text
+
+    def substring_candidates(
+        self, terms: list[str], *, match_all: bool
+    ) -> list[int] | None:
+        # A term made only of word characters can occur only inside one token
+        # of the text, so the chunks holding a token that contains it are a
+        # superset of the chunks containing it. None means every chunk.
+        candidates = None
+        for term in terms:
+            if not _TOKEN.fullmatch(term) or not unicodedata.is_normalized("NFC", term):
+                if match_all:
+                    continue
+                return None
+            ordinals = self._ordinals_containing(term)
+            if candidates is None:
+                candidates = set(ordinals)
+            elif match_all:
+                candidates &= ordinals
+            else:
+                candidates |= ordinals
+        return None if candidates is None else sorted(candidates)
+
+    def _ordinals_containing(self, term: str) -> frozenset[int]:
+        # The exact token is a direct lookup; only tokens longer than the term
+        # need the vocabulary scan, which runs once per term per index.
+        ordinals = self._containing.get(term)
+        if ordinals is None:
+            found = set(self.loose)
+            found.update(self.postings.get(term, ())[::2])
+            size = len(term)
+            for token, postings in self.postings.items():
+                if len(token) > size and term in token:
+                    found.update(postings[::2])
+            ordinals = self._containing[term] = frozenset(found)
+        return ordinals
+
+    def _bm25_norms(self) -> list[float]:
+        if self._norms is None:
+            count = len(self.doc_lengths)
+            average = sum(self.doc_lengths) / count if count else 0.0
+            self._norms = [
+                BM25_K1 * (1 - BM25_B + BM25_B * length / average) if average else 0.0
+                for length in self.doc_lengths
+            ]
+        return self._norms
+
+    def bm25(self, terms: list[str], limit: int | None = None) -> list[int]:
+        """Ordinals with a positive BM25 score, best first, ties by ordinal."""
+        norms = self._bm25_norms()
+        count = len(self.doc_lengths)
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            df = len(postings) // 2
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            weight = idf * (BM25_K1 + 1)
+            pairs = iter(postings)
+            for ordinal, tf in zip(pairs, pairs):
+                scores[ordinal] = scores.get(ordinal, 0.0) + weight * tf / (
+                    tf + norms[ordinal]
+                )
+        # Rounded so libm differences in log() cannot reorder near-ties.
+        ranked = ((-round(score, 9), ordinal) for ordinal, score in scores.items())
+        if limit is not None and limit < len(scores):
+            return [ordinal for _, ordinal in heapq.nsmallest(limit, ranked)]
+        return [ordinal for _, ordinal in sorted(ranked)]
+
+
+def load_pack_index(path: str | Path, pack: dict | None = None) -> PackIndex:
+    index = PackIndex.from_json(json.loads(Path(path).read_text(encoding="utf-8")))
+    if pack is not None:
+        index.check(pack)
+    return index
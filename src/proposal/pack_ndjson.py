@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mmap
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO
+
+from core.determinism.canonical_json import dumps_canonical
+from core.determinism.schema_validate import validate
+
+NDJSON_FORMAT = "evidence_pack.ndjson"
+NDJSON_FORMAT_VERSION = "1.0"
+
+# "chunks" sorts first among the pack keys, so the canonical pack is this
+# prefix, the chunks joined by commas, and the canonical encoding of the rest.
+_CHUNKS_PREFIX = b'{"chunks":['
+
+
+def is_ndjson_pack(path: str | Path) -> bool:
+    return Path(path).suffix.lower() == ".ndjson"
+
+
+def _shell(pack: dict, pack_sha256: str) -> dict:
+    return {
+        "pack_version": pack["pack_version"],
+        "root_hint": pack["root_hint"],
+        "documents": pack["documents"],
+        "chunks": [],
+        "pack_sha256": pack_sha256,
+    }
+
+
+def _tail(shell: dict) -> bytes:
+    # Everything after the last chunk: "]" and the non-chunk fields.
+    data = dumps_canonical(shell)
+    if not data.startswith(_CHUNKS_PREFIX + b"]"):
+        raise ValueError("evidence pack must not carry keys sorting before chunks")
+    return data[len(_CHUNKS_PREFIX) :]
+
+
+def write_ndjson_pack(pack_obj: dict, fp: BinaryIO) -> str:
+    """Writes pack_obj as NDJSON and returns the streamed pack_sha256.
+
+    Lines: header, documents table, one canonical chunk per line, then the
+    offset index ``{"chunk_ids": [...], "offsets": [...]}``. ``offsets`` holds
+    the byte offset of every chunk line plus that of the index line.
+    """
+    hasher = hashlib.sha256(_CHUNKS_PREFIX)
+    header = {
+        "format": NDJSON_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "pack_version": pack_obj["pack_version"],
+        "root_hint": pack_obj["root_hint"],
+        "pack_sha256": pack_obj["pack_sha256"],
+        "document_count": len(pack_obj["documents"]),
+        "chunk_count": len(pack_obj["chunks"]),
+    }
+    position = 0
+    for line in (dumps_canonical(header), dumps_canonical(pack_obj["documents"])):
+        fp.write(line + b"\n")
+        position += len(line) + 1
+    chunk_ids = []
+    offsets = []
+    for ordinal, chunk in enumerate(pack_obj["chunks"]):
+        line = dumps_canonical(chunk)
+        if ordinal:
+            hasher.update(b",")
+        hasher.update(line)
+        fp.write(line + b"\n")
+        chunk_ids.append(chunk["chunk_id"])
+        offsets.append(position)
+        position += len(line) + 1
+    offsets.append(position)
+    fp.write(dumps_canonical({"chunk_ids": chunk_ids, "offsets": offsets}) + b"\n")
+    hasher.update(_tail(_shell(pack_obj, "")))
+    pack_sha256 = hasher.hexdigest()
+    if pack_sha256 != pack_obj["pack_sha256"]:
+        raise ValueError("evidence pack pack_sha256 does not match its contents")
+    return pack_sha256
+
+
+def dumps_ndjson_pack(pack_obj: dict) -> bytes:
+    buffer = io.BytesIO()
+    write_ndjson_pack(pack_obj, buffer)
+    return buffer.getvalue()
+
+
+class LazyChunks(Sequence):
+    """pack["chunks"] for an NDJSON pack; each chunk is parsed when read."""
+
+    def __init__(self, pack: NdjsonPack) -> None:
+        self._pack = pack
+
+    def __len__(self) -> int:
+        return len(self._pack.chunk_ids)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._pack.chunk(p) for p in range(len(self))[position]]
+        return self._pack.chunk(range(len(self))[position])
+
+    def __iter__(self) -> Iterator[dict]:
+        return self._pack.iter_chunks()
+
+
+class NdjsonPack:
+    """A memory-mapped NDJSON evidence pack.
+
+    Opening reads the header, documents table and offset index; chunks are
+    parsed only when read, by position or by chunk_id.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise ValueError(f"empty NDJSON evidence pack: {path}") from exc
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+        self._positions: dict[str, list[int]] | None = None
+
+    def _open(self) -> None:
+        data = self._map
+        header_end = data.find(b"\n")
+        documents_end = data.find(b"\n", header_end + 1)
+        index_start = data.rfind(b"\n", 0, len(data) - 1) + 1
+        if (
+            header_end < 0
+            or documents_end < 0
+            or index_start <= documents_end
+            or data[-1:] != b"\n"
+        ):
+            raise ValueError("malformed NDJSON evidence pack")
+        header = json.loads(data[:header_end])
+        validate(
+            header, "schemas/evidence_pack_ndjson_header.schema.json", scope="seal"
+        )
+        self.header = header
+        self.documents = json.loads(data[header_end + 1 : documents_end])
+        validate(
+            self._shell(self.pack_sha256),
+            "schemas/evidence_pack.schema.json",
+            scope="seal",
+        )
+        index = json.loads(data[index_start:-1])
+        if not isinstance(index, dict):
+            raise ValueError("malformed NDJSON evidence pack index")
+        self.chunk_ids = index.get("chunk_ids")
+        self.offsets = index.get("offsets")
+        count = header["chunk_count"]
+        if (
+            not isinstance(self.chunk_ids, list)
+            or not isinstance(self.offsets, list)
+            or len(self.documents) != header["document_count"]
+            or len(self.chunk_ids) != count
+            or len(self.offsets) != count + 1
+            or self.offsets[0] != documents_end + 1
+            or self.offsets[-1] != index_start
+            or any(a >= b for a, b in zip(self.offsets, self.offsets[1:]))
+        ):
+            raise ValueError("NDJSON evidence pack index does not match its header")
+
+    @property
+    def pack_sha256(self) -> str:
+        return self.header["pack_sha256"]
+
+    def _shell(self, pack_sha256: str) -> dict:
+        return _shell({**self.header, "documents": self.documents}, pack_sha256)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> NdjsonPack:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def _line(self, position: int) -> memoryview:
+        start, end = self.offsets[position], self.offsets[position + 1] - 1
+        return memoryview(self._map)[start:end]
+
+    def chunk(self, position: int) -> dict:
+        start, end = self.offsets[position], self.offsets[position + 1] - 1
+        chunk = json.loads(self._map[start:end])
+        validate(chunk, "schemas/evidence_chunk.schema.json", scope="seal")
+        if chunk["chunk_id"] != self.chunk_ids[position]:
+            raise ValueError(f"NDJSON evidence pack index is stale at chunk {position}")
+        return chunk
+
+    def chunks_by_id(self, chunk_id: str) -> list[dict]:
+        """Every chunk with this chunk_id, in pack order (text can repeat)."""
+        if self._positions is None:
+            positions: dict[str, list[int]] = {}
+            for position, known_id in enumerate(self.chunk_ids):
+                positions.setdefault(known_id, []).append(position)
+            self._positions = positions
+        return [self.chunk(position) for position in self._positions.get(chunk_id, [])]
+
+    def iter_chunks(self) -> Iterator[dict]:
+        for position in range(len(self.chunk_ids)):
+            yield self.chunk(position)
+
+    def as_pack(self) -> dict:
+        """The pack as a dict whose "chunks" are read lazily from this file."""
+        pack = self._shell(self.pack_sha256)
+        pack["chunks"] = LazyChunks(self)
+        return pack
+
+    def to_pack(self) -> dict:
+        pack = self.as_pack()
+        pack["chunks"] = list(self.iter_chunks())
+        return pack
+
+    def _stream(self, sinks: tuple, pack_sha256: str) -> None:
+        # The chunk lines are the chunks' canonical bytes, so they are passed
+        # through without being parsed.
+        for sink in sinks:
+            sink(_CHUNKS_PREFIX)
+        for position in range(len(self.chunk_ids)):
+            with self._line(position) as line:
+                for sink in sinks:
+                    if position:
+                        sink(b",")
+                    sink(line)
+        tail = _tail(self._shell(pack_sha256))
+        for sink in sinks:
+            sink(tail)
+
+    def compute_pack_sha256(self) -> str:
+        hasher = hashlib.sha256()
+        self._stream((hasher.update,), "")
+        return hasher.hexdigest()
+
+    def write_json(self, fp: BinaryIO) -> None:
+        """Writes the bytes build_evidence_pack would return for this pack."""
+        self._stream((fp.write,), self.pack_sha256)
+
+    def verify(self) -> None:
+        for position, chunk in enumerate(self.iter_chunks()):
+            with self._line(position) as line:
+                if dumps_canonical(chunk) != line:
+                    raise ValueError(f"chunk {position} is not canonical JSON")
+        if dumps_canonical(self.documents) != self._documents_line():
+            raise ValueError("documents table is not canonical JSON")
+        if self.compute_pack_sha256() != self.pack_sha256:
+            raise ValueError("NDJSON evidence pack pack_sha256 mismatch")
+
+    def _documents_line(self) -> bytes:
+        header_end = self._map.find(b"\n")
+        return self._map[header_end + 1 : self.offsets[0] - 1]
+
+
+def convert_pack(source: str | Path, destination: str | Path) -> str:
+    """Converts between the JSON and NDJSON layouts, by destination suffix.
+
+    Returns the pack_sha256, which is the same in both layouts.
+    """
+    source = Path(source)
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if not (is_ndjson_pack(source) or is_ndjson_pack(destination)):
+        raise ValueError("one side of a pack conversion must be .ndjson")
+    temp_path = destination.with_name(f".{destination.name}.tmp")
+    try:
+        if is_ndjson_pack(destination):
+            if is_ndjson_pack(source):
+                with NdjsonPack(source) as ndjson_pack:
+                    pack = ndjson_pack.to_pack()
+            else:
+                pack = json.loads(source.read_text(encoding="utf-8"))
+            validate(pack, "schemas/evidence_pack.schema.json", scope="seal")
+            with temp_path.open("wb") as handle:
+                pack_sha256 = write_ndjson_pack(pack, handle)
+        else:
+            with NdjsonPack(source) as ndjson_pack, temp_path.open("wb") as handle:
+                ndjson_pack.verify()
+                ndjson_pack.write_json(handle)
+                pack_sha256 = ndjson_pack.pack_sha256
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    temp_path.replace(destination)
+    return pack_sha256
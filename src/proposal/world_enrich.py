@@ -31,7 +31,7 @@ def _normalize_time(time_ref: dict) -> dict:
         normalized = {"kind": "unknown"}
     else:
         raise ValueError(f"unsupported enrichment time kind: {kind}")
-    validate(normalized, "schemas/time_ref.schema.json")
+    validate(normalized, "schemas/time_ref.schema.json", scope="item")
     return normalized
 
 
@@ -78,7 +78,7 @@ def _normalize_enrichment(enrichment: dict) -> dict:
         "version": "1.0",
         "events": sorted(normalized_events, key=lambda item: item["event_id"]),
     }
-    validate(normalized, "schemas/world_enrichment.schema.json")
+    validate(normalized, "schemas/world_enrichment.schema.json", scope="internal")
     return normalized
 
 
@@ -86,7 +86,7 @@ def load_world_enrichment(path: str | Path) -> dict:
     raw_text = Path(path).read_text(encoding="utf-8")
     normalized_text = normalize_text(raw_text)
     enrichment = json.loads(normalized_text)
-    validate(enrichment, "schemas/world_enrichment.schema.json")
+    validate(enrichment, "schemas/world_enrichment.schema.json", scope="seal")
     return _normalize_enrichment(enrichment)
 
 
@@ -102,8 +102,8 @@ def _conflict_sort_key(conflict: dict) -> tuple[str, str]:
 
 
 def apply_world_enrichment(world_model: dict, enrichment: dict) -> dict:
-    validate(world_model, "schemas/world_model.schema.json")
-    validate(enrichment, "schemas/world_enrichment.schema.json")
+    validate(world_model, "schemas/world_model.schema.json", scope="internal")
+    validate(enrichment, "schemas/world_enrichment.schema.json", scope="internal")
     enrichment = _normalize_enrichment(enrichment)
 
     enriched_world = deepcopy(world_model)
@@ -156,5 +156,5 @@ def apply_world_enrichment(world_model: dict, enrichment: dict) -> dict:
         key=_conflict_sort_key,
     )
     enriched_world["world_sha256"] = _compute_world_sha256(enriched_world)
-    validate(enriched_world, "schemas/world_model.schema.json")
+    validate(enriched_world, "schemas/world_model.schema.json", scope="internal")
     return enriched_world
@@ -10,6 +10,8 @@ from core.determinism.hashing import sha256_bytes, sha256_text
 from core.determinism.schema_validate import validate
 from core.reasoning.causal import compute_causal_graph
 from core.reasoning.constraints import compute_constraints
+from proposal.entity_automaton import EntityAutomaton
+from proposal.pack_ndjson import NdjsonPack, is_ndjson_pack
 from proposal.text_normalize import normalize_text
 
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
@@ -36,8 +38,12 @@ _QUERY_CATEGORY_HINTS = {
 
 
 def load_world_pack(path: str) -> dict:
-    pack = json.loads(Path(path).read_text(encoding="utf-8"))
-    validate(pack, "schemas/evidence_pack.schema.json")
+    if is_ndjson_pack(path):
+        with NdjsonPack(path) as ndjson_pack:
+            pack = ndjson_pack.to_pack()
+    else:
+        pack = json.loads(Path(path).read_text(encoding="utf-8"))
+    validate(pack, "schemas/evidence_pack.schema.json", scope="seal")
     return pack
 
 
@@ -58,7 +64,7 @@ def _compute_world_sha256(world_obj: dict) -> str:
 
 
 def dumps_world_model(world_obj: dict) -> bytes:
-    validate(world_obj, "schemas/world_model.schema.json")
+    validate(world_obj, "schemas/world_model.schema.json", scope="io")
     return dumps_canonical(world_obj)
 
 
@@ -190,7 +196,7 @@ def _propose_entities(source_items: list[dict]) -> list[dict]:
             "name": entity["name"],
             "aliases": aliases,
         }
-        validate(entity_obj, "schemas/entity.schema.json")
+        validate(entity_obj, "schemas/entity.schema.json", scope="item")
         entities.append(entity_obj)
 
     return sorted(
@@ -204,7 +210,7 @@ def _propose_entities(source_items: list[dict]) -> list[dict]:
 
 
 def propose_entities_from_pack(pack: dict) -> list[dict]:
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="internal")
     return _propose_entities(_source_items_from_pack(pack))
 
 
@@ -265,39 +271,6 @@ def _parse_time_ref(action: str) -> dict:
     return {"kind": "unknown"}
 
 
-def _entity_tokens(entity: dict) -> list[str]:
-    return [entity["name"], *entity["aliases"]]
-
-
-def _extract_objects(action: str, entities: list[dict]) -> list[str]:
-    action_lower = action.lower()
-    object_ids = set()
-    for entity in entities:
-        for token in _entity_tokens(entity):
-            if token.lower() in action_lower:
-                object_ids.add(entity["entity_id"])
-                break
-    return sorted(object_ids)
-
-
-def _extract_state(action: str, entities: list[dict]) -> dict | None:
-    lower = action.lower()
-    state = {}
-    for entity in entities:
-        if entity["type"] != "Secret":
-            continue
-        entity_name_lower = entity["name"].lower()
-        if entity_name_lower not in lower:
-            continue
-        if "environment only" in lower or "env-only" in lower:
-            state[entity["name"]] = "env-only"
-        if "never in source" in lower or "never in repo" in lower:
-            state[entity["name"]] = "never-in-repo"
-    if not state:
-        return None
-    return {key: state[key] for key in sorted(state)}
-
-
 def _event_id(
     event_type: str,
     time_ref: dict,
@@ -430,7 +403,8 @@ def _propose_events(
     query_tokens: list[str] | None = None,
 ) -> list[dict]:
     for entity in entities:
-        validate(entity, "schemas/entity.schema.json")
+        validate(entity, "schemas/entity.schema.json", scope="item")
+    entity_automaton = EntityAutomaton(entities)
 
     events_by_id: dict[str, dict] = {}
     effective_query_tokens = query_tokens or []
@@ -448,8 +422,7 @@ def _propose_events(
             continue
 
         time_ref = _parse_time_ref(action)
-        objects = _extract_objects(action, entities)
-        state = _extract_state(action, entities)
+        objects, state, entity_label_tokens = entity_automaton.match(action)
         event_type = _classify_event_type(action)
         evidence_ref = {
             "source_id": source_item["source_id"],
@@ -475,15 +448,7 @@ def _propose_events(
             "action": action,
             "state": state,
             "evidence": [evidence_ref],
-            "_entity_label_tokens": sorted(
-                {
-                    token.lower()
-                    for object_id in objects
-                    for entity in entities
-                    if entity["entity_id"] == object_id
-                    for token in _entity_tokens(entity)
-                }
-            ),
+            "_entity_label_tokens": entity_label_tokens,
             "_sort_key": (
                 source_item["scope_key"],
                 line_index,
@@ -505,13 +470,13 @@ def _propose_events(
         event["evidence"] = _sort_evidence_refs(event["evidence"])
         del event["_entity_label_tokens"]
         del event["_sort_key"]
-        validate(event, "schemas/event.schema.json")
+        validate(event, "schemas/event.schema.json", scope="item")
         normalized_events.append(event)
     return normalized_events
 
 
 def propose_events_from_pack(pack: dict, entities: list[dict]) -> list[dict]:
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="internal")
     return _propose_events(_source_items_from_pack(pack), entities, query_tokens=[])
 
 
@@ -641,7 +606,7 @@ def _build_conflicts(events: list[dict], entities: list[dict]) -> list[dict]:
 
 
 def propose_world_model(pack: dict) -> dict:
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="internal")
 
     entities = propose_entities_from_pack(pack)
     events = propose_events_from_pack(pack, entities)
@@ -667,7 +632,7 @@ def _build_world_model(entities: list[dict], events: list[dict]) -> dict:
         "conflicts": _build_conflicts(sorted_events, entities),
     }
     world_obj["world_sha256"] = _compute_world_sha256(world_obj)
-    validate(world_obj, "schemas/world_model.schema.json")
+    validate(world_obj, "schemas/world_model.schema.json", scope="internal")
     return world_obj
 
 
@@ -679,7 +644,7 @@ def propose_world_model_from_artifacts(
     max_chunks: int = 10,
     max_events: int = 30,
 ) -> dict:
-    validate(pack, "schemas/evidence_pack.schema.json")
+    validate(pack, "schemas/evidence_pack.schema.json", scope="internal")
     for artifact in artifacts:
         if sha256_text(artifact["text"]) != artifact["text_sha256"]:
             raise ValueError("artifact text_sha256 does not match artifact text")
@@ -0,0 +1,114 @@
+import json
+from pathlib import Path
+
+from core import manifest, templates
+from deterministic_ai import _ref_dirname, main
+
+SEALED_FILES = ("output.json", "provenance.json", "attestation.sha256")
+BATCH_ARGS = [
+    "run-batch",
+    "--domain",
+    "biblical_text",
+    "--dataset",
+    "esv_sample",
+    "--context",
+    "moment=batch test",
+    "--timestamp",
+    "2024-01-01T00:00:00Z",
+]
+
+
+def _sealed(out_dir: Path) -> dict:
+    return {
+        path.relative_to(out_dir).as_posix(): path.read_bytes()
+        for path in sorted(out_dir.rglob("*"))
+        if path.name in SEALED_FILES
+    }
+
+
+def test_run_batch_matches_across_workers_and_single_runs(tmp_path: Path):
+    serial = tmp_path / "serial"
+    pooled = tmp_path / "pooled"
+    assert main([*BATCH_ARGS, "--out", str(serial), "--workers", "1"]) == 0
+    assert main([*BATCH_ARGS, "--out", str(pooled), "--workers", "2"]) == 0
+
+    assert _sealed(serial) == _sealed(pooled)
+    assert len(_sealed(serial)) == 3 * len(SEALED_FILES)
+
+    single = tmp_path / "single"
+    main(
+        [
+            "run",
+            "--domain",
+            "biblical_text",
+            "--input-ref",
+            "John 4:7-10",
+            "--dataset",
+            "esv_sample",
+            "--context",
+            "moment=batch test",
+            "--timestamp",
+            "2024-01-01T00:00:00Z",
+            "--out",
+            str(single),
+        ]
+    )
+    assert _sealed(single) == {
+        name.split("/", 1)[1]: data
+        for name, data in _sealed(serial).items()
+        if name.startswith("John_4_7-10/")
+    }
+
+
+def test_run_batch_report(tmp_path: Path):
+    out_dir = tmp_path / "out"
+    report_path = tmp_path / "report.json"
+    code = main(
+        [
+            *BATCH_ARGS,
+            "--ref",
+            "John 1:14",
+            "--ref",
+            "Missing 1:1",
+            "--out",
+            str(out_dir),
+            "--workers",
+            "1",
+            "--report",
+            str(report_path),
+        ]
+    )
+    assert code == 1
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["totals"] == {"refs": 2, "ok": 1, "error": 1}
+    assert [run["ref"] for run in report["runs"]] == ["John 1:14", "Missing 1:1"]
+    assert [run["status"] for run in report["runs"]] == ["ok", "error"]
+    attestation = (out_dir / "John_1_14" / "attestation.sha256").read_text()
+    assert report["runs"][0]["attestation_sha256"] == attestation.strip()
+    assert set(report["latency_seconds"]) == {"mean", "p50", "p90", "p99", "max"}
+    assert report["refs_per_second"] > 0
+
+
+def test_ref_dirname():
+    assert _ref_dirname("John 4:7-10") == "John_4_7-10"
+    assert _ref_dirname("../etc") == "etc"
+
+
+def test_manifest_cache_reloads_on_change(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"a": {"file": "a.txt"}}), encoding="utf-8")
+    first, _ = manifest.load_manifest_cached(path)
+    assert manifest.load_manifest_cached(path)[0] is first
+
+    path.write_text(json.dumps({"bb": {"file": "bb.txt"}}), encoding="utf-8")
+    assert list(manifest.load_manifest_cached(path)[0]) == ["bb"]
+
+
+def test_load_template_returns_fresh_copies(tmp_path: Path):
+    (tmp_path / "generic.json").write_text('{"title": "{{ ref }}"}', encoding="utf-8")
+    first = templates.load_template("x", tmp_path)
+    first["title"] = "changed"
+    second = templates.load_template("x", tmp_path)
+    assert second["title"] == "{{ ref }}"
+    assert second["_template_sha256"] == first["_template_sha256"]
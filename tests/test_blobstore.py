@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.determinism.blobstore import BlobStore
+from core.determinism.finalize import finalize
+from core.determinism.hashing import sha256_bytes
+from core.determinism.ledger import read_run_file, write_run
+from core.determinism.replay import discover_runs, verify_all, verify_run
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _sealed(prompt: str, decision: str = "allow") -> dict:
+    bundle = json.loads(
+        (FIXTURES / "evidence_bundle_example.json").read_text(encoding="utf-8")
+    )
+    bundle["inputs"]["prompt"] = prompt
+    return finalize(
+        bundle,
+        {"decision": decision, "reasons": ["matched"]},
+        manifest_sha256=sha256_bytes(Path("MANIFEST.sha256").read_bytes()),
+        core_version="0.3.0",
+        ruleset_id="ruleset.core.v1",
+        created_utc="2026-03-01T12:05:00Z",
+    )
+
+
+def test_store_layout_verifies_like_loose_layout(tmp_path: Path):
+    sealed = _sealed("first")
+    loose_dir = write_run(ledger_root=str(tmp_path / "loose"), **sealed)
+    store_dir = write_run(ledger_root=str(tmp_path / "store"), layout="store", **sealed)
+
+    assert not store_dir.exists()
+    assert store_dir.name == loose_dir.name
+    assert read_run_file(store_dir, "output.json") == sealed["output_bytes"]
+    assert verify_run(str(store_dir), strict_manifest=True) == verify_run(
+        str(loose_dir), strict_manifest=True
+    )
+    loose_all, store_all = (
+        verify_all(str(tmp_path / layout), strict_manifest=True, workers=1)
+        for layout in ("loose", "store")
+    )
+    assert store_all["bytes_hashed"] == loose_all["bytes_hashed"] > 0
+
+
+def test_store_deduplicates_and_packs_blobs(tmp_path: Path):
+    ledger_root = tmp_path / "ledger"
+    run_dirs = [
+        write_run(ledger_root=str(ledger_root), layout="store", **_sealed(prompt))
+        for prompt in ("first", "second")
+    ]
+    store = BlobStore.for_ledger(ledger_root)
+
+    # Both runs share identical output.json bytes: 2 bundles + 2 attestations + 1.
+    assert store.stats() == {"runs": 2, "loose_blobs": 5, "packed_blobs": 0, "packs": 0}
+
+    pack_path = store.pack()
+
+    assert pack_path is not None and pack_path.is_file()
+    assert store.stats() == {"runs": 2, "loose_blobs": 0, "packed_blobs": 5, "packs": 1}
+    assert store.pack() is None
+    for run_dir in run_dirs:
+        assert verify_run(str(run_dir), strict_manifest=True)["ok"] is True
+    summary = verify_all(str(tmp_path), workers=1)
+    assert summary["totals"]["ok"] == 2
+
+
+def test_store_rejects_conflicting_rewrite(tmp_path: Path):
+    write_run(ledger_root=str(tmp_path), layout="store", **_sealed("first"))
+    conflicting = _sealed("first", decision="deny")
+
+    with pytest.raises(ValueError, match="existing ledger file mismatch: output.json"):
+        write_run(ledger_root=str(tmp_path), layout="store", **conflicting)
+
+
+def test_tampered_packed_blob_fails_replay(tmp_path: Path):
+    sealed = _sealed("first")
+    run_dir = write_run(ledger_root=str(tmp_path), layout="store", **sealed)
+    pack_path = BlobStore.for_ledger(tmp_path).pack()
+
+    data = bytearray(pack_path.read_bytes())
+    offset = bytes(data).index(sealed["output_bytes"])
+    data[offset + 2] ^= 0x01
+    pack_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="output_sha256 mismatch"):
+        verify_run(str(run_dir), strict_manifest=True)
+
+
+def test_discover_runs_only_reads_ledger_stores(tmp_path: Path):
+    run_dir = write_run(
+        ledger_root=str(tmp_path / "run1" / "ledger"), layout="store", **_sealed("a")
+    )
+    git_objects = tmp_path / ".git" / "objects"
+    (git_objects / "ab").mkdir(parents=True)
+    (git_objects / "ab" / "cdef").write_bytes(b"blob")
+    stray = tmp_path / "notes"
+    stray.mkdir()
+    (stray / "runs.log").write_text(f"{'0' * 64} {'1' * 64} {'2' * 64}\n")
+
+    assert discover_runs(str(tmp_path)) == [run_dir]
@@ -1,8 +1,15 @@
+import hashlib
+import io
 import math
 
 import pytest
 
-from core.determinism.canonical_json import dumps_canonical
+from core.determinism.canonical_json import (
+    dump_canonical,
+    dumps_canonical,
+    dumps_canonical_with_sha256,
+    sha256_canonical,
+)
 
 
 def test_dumps_canonical_ignores_dict_insertion_order():
@@ -22,3 +29,32 @@ def test_dumps_canonical_normalizes_strings_to_nfc():
 def test_dumps_canonical_rejects_non_finite_floats(value):
     with pytest.raises(ValueError, match="NaN or Infinity"):
         dumps_canonical({"value": value})
+
+
+def test_dumps_canonical_normalizes_keys_and_sorts_after_normalization():
+    payload = {"e\u0301": 1, "d": 2, "nested": ("Cafe\u0301", [1.5, None, True])}
+
+    assert dumps_canonical(payload) == (
+        '{"d":2,"nested":["Caf\u00e9",[1.5,null,true]],"\u00e9":1}'.encode("utf-8")
+    )
+
+
+@pytest.mark.parametrize("text", ["ascii", "Caf\u00e9", "Cafe\u0301"])
+def test_dump_canonical_streams_same_bytes_and_digest(text):
+    payload = {"rows": [{"text": text, "index": index} for index in range(20000)]}
+    expected = dumps_canonical(payload)
+    handle = io.BytesIO()
+    hasher = hashlib.sha256()
+
+    written = dump_canonical(payload, handle, hasher=hasher)
+
+    assert handle.getvalue() == expected
+    assert written == len(expected)
+    assert hasher.hexdigest() == hashlib.sha256(expected).hexdigest()
+    assert sha256_canonical(payload) == hashlib.sha256(expected).hexdigest()
+    assert dumps_canonical_with_sha256(payload) == (expected, hasher.hexdigest())
+
+
+def test_dump_canonical_rejects_non_finite_floats_when_streaming():
+    with pytest.raises(ValueError, match="NaN or Infinity"):
+        dump_canonical({"text": "Cafe\u0301", "value": math.nan}, io.BytesIO())
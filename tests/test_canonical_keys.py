@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import itertools
+
+from core.determinism.canonical_json import canonical_key, dumps_canonical
+from core.reasoning.canonical_keys import (
+    causal_edge_key,
+    evidence_ref_key,
+    evidence_wrapper_key,
+    sort_key,
+    unknown_ref_key,
+    violation_key,
+)
+
+
+def _ref(source_id: str, chunk_id: str, start: int, end: int) -> dict:
+    return {
+        "source_id": source_id,
+        "chunk_id": chunk_id,
+        "offset_start": start,
+        "offset_end": end,
+        "text_sha256": "a" * 64,
+    }
+
+
+def _text(obj) -> str:
+    return dumps_canonical(obj).decode("utf-8")
+
+
+RECORDS = [
+    _ref("doc:1", "c1", 9, 10),
+    _ref("doc:1", "c1", 10, 9),
+    _ref("doc:1", "c10", 2, 100),
+    _ref("doc:1", 'c"1', 2, 3),
+    {"event_id": "e1"},
+    {"event_id": "e1!"},
+    {"event_id": "é"},
+    {"evidence": []},
+    {"evidence": [_ref("doc:2", "c1", 0, 1)]},
+    {"evidence": [_ref("doc:2", "c1", 0, 1), _ref("doc:1", "c2", 0, 1)]},
+    {
+        "from_event_id": "e1",
+        "to_event_id": "e2",
+        "type": "before",
+        "reason_code": "TIME_ORDER",
+        "confidence": "high",
+        "evidence": [_ref("doc:1", "c1", 0, 4)],
+    },
+    {
+        "from_event_id": "e1",
+        "to_event_id": "e10",
+        "type": "before",
+        "reason_code": "TIME_ORDER",
+        "confidence": "high",
+        "evidence": [],
+    },
+    {
+        "type": "policy_violation",
+        "events": ["e1", "e2"],
+        "entities": ["ent:a"],
+        "reason": "rotation after deploy",
+        "evidence": [_ref("doc:1", "c1", 0, 4)],
+    },
+    {
+        "type": "policy_violation",
+        "events": ["e1"],
+        "entities": ["ent:é"],
+        "reason": "rotation after deploy",
+        "evidence": [],
+    },
+    {"a": 1, "b": [1, 2]},
+    {},
+    ["e1"],
+    "e1",
+]
+
+
+def test_sort_key_concatenates_to_canonical_text() -> None:
+    for record in RECORDS:
+        assert "".join(sort_key(record)) == _text(record)
+
+
+def test_sort_key_orders_like_canonical_text() -> None:
+    assert sorted(RECORDS, key=sort_key) == sorted(RECORDS, key=_text)
+    for left, right in itertools.combinations(RECORDS, 2):
+        assert (sort_key(left) < sort_key(right)) == (_text(left) < _text(right))
+
+
+def test_fast_paths_match_generic_key() -> None:
+    ref = RECORDS[0]
+    edge = RECORDS[10]
+    violation = RECORDS[12]
+    assert evidence_ref_key(ref) == canonical_key(ref)
+    assert causal_edge_key(edge) == canonical_key(edge)
+    assert violation_key(violation) == canonical_key(violation)
+    assert evidence_wrapper_key(RECORDS[9]) == canonical_key(RECORDS[9])
+    assert unknown_ref_key(RECORDS[4]) == canonical_key(RECORDS[4])
+
+
+def test_fast_paths_reject_unexpected_shapes() -> None:
+    assert evidence_ref_key({**RECORDS[0], "offset_start": 1.0}) is None
+    assert evidence_ref_key({**RECORDS[0], "extra": 1}) is None
+    assert unknown_ref_key({"event_id": "é"}) is None
+    assert violation_key(RECORDS[13]) is None
+    assert "".join(sort_key(RECORDS[13])) == _text(RECORDS[13])
+
+
+def test_equal_records_share_keys() -> None:
+    assert sort_key(_ref("doc:1", "c1", 9, 10)) == sort_key(RECORDS[0])
+    assert sort_key({"evidence": [RECORDS[0]]}) != sort_key({"evidence": []})
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+from core.determinism.catalog import (
+    LedgerCatalog,
+    install_write_hook,
+    main,
+    uninstall_write_hook,
+)
+from core.determinism.finalize import finalize
+from core.determinism.hashing import sha256_bytes
+from core.determinism.ledger import add_write_hook, remove_write_hook, write_run
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _sealed(ruleset_id: str, created_utc: str) -> dict:
+    bundle = json.loads(
+        (FIXTURES / "evidence_bundle_example.json").read_text(encoding="utf-8")
+    )
+    bundle["inputs"]["prompt"] = f"{ruleset_id} {created_utc}"
+    return finalize(
+        bundle,
+        {"decision": "allow", "reasons": ["matched"]},
+        manifest_sha256="1" * 64,
+        core_version="0.3.0",
+        ruleset_id=ruleset_id,
+        created_utc=created_utc,
+    )
+
+
+def test_write_hook_failure_does_not_fail_write_run(tmp_path: Path, caplog):
+    def failing_hook(record: dict) -> None:
+        raise RuntimeError("catalog unavailable")
+
+    add_write_hook(failing_hook)
+    try:
+        run_dir = write_run(
+            ledger_root=str(tmp_path),
+            **_sealed("ruleset.core.v1", "2026-03-01T12:05:00Z"),
+        )
+    finally:
+        remove_write_hook(failing_hook)
+
+    assert (run_dir / "attestation.json").is_file()
+    assert "ledger write hook failed" in caplog.text
+
+
+def test_write_hook_catalogs_attestation_with_missing_fields(tmp_path: Path):
+    sealed = _sealed("ruleset.core.v1", "2026-03-01T12:05:00Z")
+    attestation = json.loads(sealed["attestation_bytes"])
+    del attestation["attestation_version"]
+    sealed["attestation_bytes"] = json.dumps(attestation).encode("utf-8")
+    sealed["attestation_sha256"] = sha256_bytes(sealed["attestation_bytes"])
+    catalog = LedgerCatalog(tmp_path / "catalog.sqlite3")
+    hook = install_write_hook(catalog.db_path)
+    try:
+        write_run(ledger_root=str(tmp_path / "ledger"), **sealed)
+    finally:
+        uninstall_write_hook(hook)
+
+    rows = catalog.query()
+    assert len(rows) == 1
+    assert rows[0]["attestation_version"] == ""
+    assert rows[0]["ruleset_id"] == "ruleset.core.v1"
+
+
+def test_write_hook_records_runs(tmp_path: Path):
+    catalog = LedgerCatalog(tmp_path / "catalog.sqlite3")
+    hook = install_write_hook(catalog.db_path)
+    try:
+        sealed = _sealed("ruleset.core.v1", "2026-03-01T12:05:00Z")
+        run_dir = write_run(ledger_root=str(tmp_path / "ledger"), **sealed)
+        write_run(
+            ledger_root=str(tmp_path / "store"),
+            layout="store",
+            **_sealed("ruleset.core.v2", "2026-03-02T12:05:00Z"),
+        )
+    finally:
+        uninstall_write_hook(hook)
+
+    rows = catalog.query(ruleset_id="ruleset.core.v1")
+    assert len(rows) == 1
+    assert rows[0]["ledger_dir"] == run_dir.resolve().as_posix()
+    assert rows[0]["bundle_sha256"] == sealed["bundle_sha256"]
+    assert rows[0]["output_size"] == len(sealed["output_bytes"])
+    assert rows[0]["layout"] == "loose"
+    assert [row["layout"] for row in catalog.query(ruleset_id="ruleset.core.v2")] == [
+        "store"
+    ]
+
+
+def test_backfill_is_incremental_and_queryable(tmp_path: Path):
+    ledger_root = tmp_path / "outputs"
+    for index, day in enumerate(("01", "05", "09")):
+        write_run(
+            ledger_root=str(ledger_root / f"run-{index}" / "ledger"),
+            **_sealed(
+                "ruleset.core.v1" if index else "ruleset.other",
+                f"2026-03-{day}T00:00:00Z",
+            ),
+        )
+    catalog = LedgerCatalog(tmp_path / "catalog.sqlite3")
+
+    assert catalog.backfill(str(ledger_root)) == {"added": 3, "skipped": 0}
+    assert catalog.backfill(str(ledger_root)) == {"added": 0, "skipped": 3}
+
+    rows = catalog.query(
+        ruleset_id="ruleset.core.v1",
+        manifest_sha256="1" * 64,
+        created_from="2026-03-04T00:00:00Z",
+    )
+    assert [row["created_utc"] for row in rows] == [
+        "2026-03-05T00:00:00Z",
+        "2026-03-09T00:00:00Z",
+    ]
+    assert catalog.query(created_to="2026-03-02T00:00:00Z")[0]["ruleset_id"] == (
+        "ruleset.other"
+    )
+
+
+def test_catalog_cli_backfill_and_query(tmp_path: Path, capsys):
+    db_path = str(tmp_path / "catalog.sqlite3")
+    write_run(
+        ledger_root=str(tmp_path / "ledger"),
+        **_sealed("ruleset.core.v1", "2026-03-01T12:05:00Z"),
+    )
+
+    assert main(["--db", db_path, "backfill", str(tmp_path / "ledger")]) == 0
+    assert json.loads(capsys.readouterr().out) == {"added": 1, "skipped": 0}
+
+    assert main(["--db", db_path, "query", "--ruleset-id", "ruleset.core.v1"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["core_version"] == "0.3.0"
+
+    assert main(["--db", db_path, "query", "--since", "2026-04-01", "--count"]) == 0
+    assert capsys.readouterr().out.strip() == "0"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+
+from scripts.bench_coref import _legacy_resolve_references, build_entities, build_text
+
+from core.extraction import MentionWindow, resolve_references, segment
+from domains.biblical_text.extractors import PRONOUNS
+
+WORDS = ["he", "She", "them", "its", "their", "word", "and", ";", ".", "!", "\n"]
+GENDERS = ["M", "F", "N", "P", None, ""]
+NUMBERS = ["S", "P", None, ""]
+
+
+def test_resolve_references_matches_legacy_on_random_text() -> None:
+    rng = random.Random(17)
+    for _ in range(300):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 60)))
+        segments, _, _ = segment(text)
+        entities = []
+        for _ in range(rng.randint(0, 12)):
+            start = rng.randint(0, max(0, len(text) - 1))
+            entities.append(
+                {
+                    "label": rng.choice(["A", "B", "C", "D"]),
+                    "token_span": [start, start + 1],
+                    "gender": rng.choice(GENDERS),
+                    "number": rng.choice(NUMBERS),
+                }
+            )
+        lookback = rng.randint(0, 3)
+        assert resolve_references(
+            segments, entities, PRONOUNS, lookback_sentences=lookback
+        ) == _legacy_resolve_references(
+            segments, entities, PRONOUNS, lookback_sentences=lookback
+        )
+
+
+def test_resolve_references_matches_legacy_on_scripture() -> None:
+    text = build_text(5)
+    segments, _, _ = segment(text)
+    entities = build_entities(text, segments)
+    assert resolve_references(segments, entities, PRONOUNS) == (
+        _legacy_resolve_references(segments, entities, PRONOUNS)
+    )
+
+
+def test_mention_window_recency_and_ties() -> None:
+    window = MentionWindow(lookback_sentences=1)
+    window.add(0, 5, "Jesus", "M", "S")
+    window.add(1, 3, "woman", "F", "S")
+    window.add(1, 3, "Mary", "F", "S")
+    window.add(1, 9, "disciples", "P", "P")
+
+    assert window.resolve(1, "F", "S") == "woman"
+    assert window.resolve(1, "M", "S") == "Jesus"
+    assert window.resolve(1, "P", "P") == "disciples"
+    assert window.resolve(1, "N", "S") == "disciples"
+    assert window.resolve(2, "M", "S") is None
+    assert window.resolve(3, "F", "S") is None
@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from deterministic_ai import main  # noqa: E402
+from domains.credit_scoring.batch import (  # noqa: E402
+    ATTESTATION_NAME,
+    RECORDS_NAME,
+    ApplicantTable,
+    _dump_line,
+    iter_extracted,
+    iter_record_lines,
+    load_table,
+    round_dti,
+    score_batch,
+)
+from domains.credit_scoring.extractors import CreditScoringExtractors  # noqa: E402
+
+FLOATS = [0, None, "", 1, -3, "12.5", 4200, 2100.75, 0.0, -0.0, True, 1e-9, 637]
+INTS = [0, None, "", 1, -3, "640", 639, 640, 23, 24, 2.9, "0"]
+INT_NAMES = ("credit_score", "delinquencies_12mo", "employment_months")
+
+
+def _random_rows(rng: random.Random, count: int) -> list[dict]:
+    rows = []
+    for index in range(count):
+        row = {}
+        for name in ("income_monthly", "debt_monthly"):
+            if rng.random() < 0.9:
+                row[name] = rng.choice(FLOATS)
+        for name in INT_NAMES:
+            if rng.random() < 0.9:
+                row[name] = rng.choice(INTS)
+        if rng.random() < 0.8:
+            row["applicant_id"] = rng.choice([str(index), index, None, "é"])
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize("context", [{}, {"risk_tier": "manual_review"}])
+def test_batch_matches_scalar_extract(context):
+    extractor = CreditScoringExtractors()
+    rows = _random_rows(random.Random(20), 2000)
+    expected = [extractor.extract(extractor.normalize_input(r), context) for r in rows]
+    table = ApplicantTable.from_rows(rows)
+    assert list(iter_extracted(table, context)) == expected
+    assert list(iter_record_lines(table, context)) == [
+        _dump_line(record) for record in expected
+    ]
+
+
+def test_round_dti_matches_round_on_ties():
+    rng = np.random.default_rng(20)
+    debt = np.concatenate([[637.0, 2.5, 5.0, 1.0], rng.integers(0, 90_000, 50_000)])
+    income = np.concatenate([[200.0, 0.0, -0.0, 3.0], rng.integers(0, 9_000, 50_000)])
+    debt, income = debt / 100, income / 100
+    expected = [
+        round(d / i, 2) if i else 0.0 for d, i in zip(debt.tolist(), income.tolist())
+    ]
+    assert round_dti(debt, income).tolist() == expected
+
+
+def test_from_arrays_matches_rows_and_rejects_nan():
+    columns = {
+        "applicant_id": np.array(["a", "b"]),
+        "income_monthly": np.array([4200, 0]),
+        "debt_monthly": np.array([2100.5, 3.0]),
+        "credit_score": np.array([639.9, 700.0]),
+        "delinquencies_12mo": np.array([1, 0]),
+        "employment_months": np.array([36, 2]),
+    }
+    rows = [
+        {name: values.tolist()[index] for name, values in columns.items()}
+        for index in range(2)
+    ]
+    assert list(iter_extracted(ApplicantTable.from_arrays(columns))) == list(
+        iter_extracted(ApplicantTable.from_rows(rows))
+    )
+    columns["credit_score"] = np.array([np.nan, 700.0])
+    with pytest.raises(ValueError):
+        ApplicantTable.from_arrays(columns)
+
+
+def test_table_formats_and_batch_attestation(tmp_path: Path):
+    rows = [
+        {
+            "applicant_id": str(index),
+            "income_monthly": 4000 + index,
+            "debt_monthly": 1500 + 20 * index,
+            "credit_score": 600 + 5 * index,
+            "delinquencies_12mo": index % 2,
+            "employment_months": 12 + index,
+        }
+        for index in range(30)
+    ]
+    csv_path = tmp_path / "applicants.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    jsonl_path = tmp_path / "applicants.jsonl"
+    jsonl_path.write_text(
+        "".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8"
+    )
+    npz_path = tmp_path / "applicants.npz"
+    np.savez(npz_path, **{name: np.array([r[name] for r in rows]) for name in rows[0]})
+
+    results = [
+        score_batch(load_table(path), tmp_path / path.suffix[1:])
+        for path in (csv_path, jsonl_path, npz_path)
+    ]
+    assert len({result["attestation_sha256"] for result in results}) == 1
+    assert results[0]["applicants"] == 30
+    assert sum(results[0]["decisions"].values()) == 30
+
+    extractor = CreditScoringExtractors()
+    lines = (tmp_path / "csv" / RECORDS_NAME).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        extractor.extract(row, {}) for row in rows
+    ]
+
+    main(["credit-batch", "--input", str(csv_path), "--out", str(tmp_path / "cli")])
+    recorded = json.loads((tmp_path / "cli" / ATTESTATION_NAME).read_text())
+    assert recorded["records_sha256"] == results[0]["records_sha256"]
+    assert recorded["input_sha256"]
+    with pytest.raises(ValueError):
+        load_table(tmp_path / "applicants.xlsx")
+
+
+def test_cli_import_leaves_numpy_unloaded():
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, deterministic_ai; sys.exit('numpy' in sys.modules)",
+        ],
+        check=False,
+        env={
+            **os.environ,
+            "PYTHONPATH": str(Path(__file__).resolve().parents[1] / "src"),
+        },
+    )
+    assert completed.returncode == 0
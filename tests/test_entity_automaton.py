@@ -0,0 +1,75 @@
+import random
+
+from scripts.bench_world_events import build_pack, legacy_match
+
+from proposal.entity_automaton import AhoCorasick, EntityAutomaton
+from proposal.world_propose import _entity_id, propose_entities_from_pack
+
+ALPHABET = "abAB_ İiß"
+NAMES = [
+    "API_KEY",
+    "api_key",
+    "Token",
+    "İstanbul",
+    "i̇stanbul",
+    "STRASSE",
+    "straße",
+    "ΣΟΦΙΑ",
+    "σοφια",
+    "DB",
+    "db_pass",
+    "a",
+    "key",
+    "Key Vault",
+]
+PHRASES = ["never in source", "env-only", "environment only", "never in repo"]
+
+
+def test_automaton_reports_exactly_the_patterns_that_occur():
+    rng = random.Random(25)
+    for _ in range(300):
+        patterns = [
+            "".join(rng.choices(ALPHABET, k=rng.randint(0, 4)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        automaton = AhoCorasick((pattern, pattern) for pattern in patterns)
+        for _ in range(10):
+            text = "".join(rng.choices(ALPHABET, k=rng.randint(0, 30)))
+            assert automaton.search(text) == {p for p in patterns if p in text}
+
+
+def test_entity_automaton_matches_the_per_entity_scan():
+    rng = random.Random(25)
+    for _ in range(60):
+        entities = []
+        for _ in range(rng.randint(0, 30)):
+            entity_type = rng.choice(["Secret", "Concept", "Policy"])
+            name = rng.choice(NAMES) + rng.choice(["", "_2", " svc"])
+            aliases = sorted(set(rng.sample(NAMES, rng.randint(0, 2))) - {name})
+            entity_id = _entity_id(entity_type, name, aliases)
+            if entities and rng.random() < 0.1:
+                entity_id = entities[-1]["entity_id"]
+            entities.append(
+                {
+                    "entity_id": entity_id,
+                    "type": entity_type,
+                    "name": name,
+                    "aliases": aliases,
+                }
+            )
+        automaton = EntityAutomaton(entities)
+        for _ in range(20):
+            words = rng.choices(
+                NAMES + PHRASES + ["rotate", "the"], k=rng.randint(0, 8)
+            )
+            action = " ".join(words)
+            assert automaton.match(action) == legacy_match(action, entities), action
+
+
+def test_generated_pack_lines_match_the_per_entity_scan():
+    pack = build_pack(40, 30)
+    entities = propose_entities_from_pack(pack)
+    automaton = EntityAutomaton(entities)
+    for line in pack["chunks"][0]["text"].split("\n"):
+        if line.startswith("- "):
+            assert automaton.match(line[2:]) == legacy_match(line[2:], entities)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+import re
+
+from core.extraction import EntityMatcher, entity_matcher, extract_entities
+
+
+def _finditer_each(patterns, text):
+    found = [
+        (match.start(), idx, label, match.span())
+        for idx, (label, pattern) in enumerate(patterns)
+        for match in re.finditer(pattern, text)
+    ]
+    return [(label, span) for _, _, label, span in sorted(found)]
+
+
+def _spans(matcher, text):
+    return [(label, match.span()) for label, match in matcher.finditer(text)]
+
+
+PATTERNS = [
+    ("woman_of_Samaria", r"\bwoman of Samaria\b"),
+    ("woman_of_Samaria", r"\bSamaritan woman\b"),
+    ("place", r"\bSamaria\b"),
+    ("repeat", r"aa"),
+    ("Jesus", r"\bJesus\b"),
+]
+
+
+def test_matcher_matches_per_pattern_finditer() -> None:
+    rng = random.Random(13)
+    words = ["woman", "of", "Samaria", "Samaritan", "Jesus", "aaa", "a", " ", "."]
+    matcher = EntityMatcher(PATTERNS)
+    for _ in range(500):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+        assert _spans(matcher, text) == _finditer_each(PATTERNS, text)
+
+
+def test_matcher_keeps_overlapping_matches_of_different_patterns() -> None:
+    text = "the woman of Samaria came; aaaa"
+    assert _spans(EntityMatcher(PATTERNS), text) == [
+        ("woman_of_Samaria", (4, 20)),
+        ("place", (13, 20)),
+        ("repeat", (27, 29)),
+        ("repeat", (29, 31)),
+    ]
+
+
+def test_matcher_falls_back_for_groups_flags_and_empty_matches() -> None:
+    text = "abab ABAB x"
+    cases = [
+        [("pair", r"(ab)\1"), ("x", r"x")],
+        [("ab", re.compile("ab", re.IGNORECASE)), ("x", r"x")],
+        [("maybe", r"b*"), ("x", r"x")],
+    ]
+    for patterns in cases:
+        assert _spans(EntityMatcher(patterns), text) == _finditer_each(patterns, text)
+
+
+def test_entity_matcher_is_reused_for_equal_pattern_lists() -> None:
+    assert entity_matcher(list(PATTERNS)) is entity_matcher(list(PATTERNS))
+    matcher = EntityMatcher(PATTERNS)
+    assert entity_matcher(matcher) is matcher
+    text = "Jesus met the Samaritan woman."
+    assert extract_entities(text, [], PATTERNS) == extract_entities(text, [], matcher)
@@ -1,7 +1,12 @@
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 from core.determinism.hashing import sha256_text
+from proposal import cli_pack, pack_cache
 from proposal.evidence_pack import build_evidence_pack
+from proposal.pack_cache import PackCache, pack_cache_stats
 
 
 def test_build_evidence_pack_is_byte_identical_for_identical_inputs(tmp_path: Path):
@@ -81,3 +86,120 @@ def test_build_evidence_pack_changes_hash_when_file_changes(tmp_path: Path):
     second_obj, _ = build_evidence_pack(str(sample_dir))
 
     assert first_obj["pack_sha256"] != second_obj["pack_sha256"]
+
+
+def _write_sample(folder: Path) -> None:
+    for index in range(6):
+        path = folder / f"part{index % 2}" / f"doc{index}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Doc {index}\r\nCafé ledger {index} " * 9, "utf-8")
+
+
+def test_parallel_and_cached_builds_match_a_serial_build(tmp_path: Path):
+    sample_dir = tmp_path / "sample"
+    _write_sample(sample_dir)
+    cache_path = tmp_path / "pack_cache.sqlite3"
+    options = {"root_hint": "sample", "max_chars": 30, "overlap_chars": 4}
+
+    _, serial_bytes = build_evidence_pack(str(sample_dir), **options)
+    _, parallel_bytes = build_evidence_pack(str(sample_dir), workers=2, **options)
+    assert parallel_bytes == serial_bytes
+
+    before = pack_cache_stats()
+    _, cold_bytes = build_evidence_pack(
+        str(sample_dir), workers=2, cache_path=cache_path, **options
+    )
+    _, warm_bytes = build_evidence_pack(
+        str(sample_dir), cache_path=cache_path, **options
+    )
+    after = pack_cache_stats()
+    assert cold_bytes == warm_bytes == serial_bytes
+    assert after["misses"] - before["misses"] == 6
+    assert after["hits"] - before["hits"] == 6
+
+    # A different chunking never reuses these entries.
+    _, other_bytes = build_evidence_pack(
+        str(sample_dir),
+        cache_path=cache_path,
+        root_hint="sample",
+        max_chars=50,
+        overlap_chars=4,
+    )
+    assert (
+        other_bytes
+        == build_evidence_pack(
+            str(sample_dir), root_hint="sample", max_chars=50, overlap_chars=4
+        )[1]
+    )
+    assert pack_cache_stats()["misses"] - after["misses"] == 6
+
+
+def test_cache_rebuilds_edited_files_and_prunes_deleted_ones(tmp_path: Path):
+    sample_dir = tmp_path / "sample"
+    _write_sample(sample_dir)
+    cache_path = tmp_path / "pack_cache.sqlite3"
+    build_evidence_pack(str(sample_dir), cache_path=cache_path)
+
+    (sample_dir / "part0" / "doc2.md").write_text("edited", encoding="utf-8")
+    (sample_dir / "part1" / "doc3.md").unlink()
+    before = pack_cache_stats()
+    pack_obj, pack_bytes = build_evidence_pack(str(sample_dir), cache_path=cache_path)
+    after = pack_cache_stats()
+
+    assert pack_bytes == build_evidence_pack(str(sample_dir))[1]
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (
+        4,
+        1,
+    )
+    assert after["pruned"] - before["pruned"] == 1
+    cached = PackCache(cache_path).load(
+        str(sample_dir.resolve()), max_chars=1200, overlap_chars=120
+    )
+    assert sorted(cached) == [doc["relpath"] for doc in pack_obj["documents"]]
+
+
+def test_cache_entries_from_another_builder_version_are_rebuilt(
+    tmp_path: Path, monkeypatch
+):
+    sample_dir = tmp_path / "sample"
+    _write_sample(sample_dir)
+    cache_path = tmp_path / "pack_cache.sqlite3"
+    build_evidence_pack(str(sample_dir), cache_path=cache_path)
+
+    # The deleted file's entry is only reachable by the builder_version sweep.
+    (sample_dir / "part1" / "doc3.md").unlink()
+    monkeypatch.setattr(pack_cache, "builder_version", lambda: "edited chunker")
+    before = pack_cache_stats()
+    pack_bytes = build_evidence_pack(str(sample_dir), cache_path=cache_path)[1]
+    after = pack_cache_stats()
+
+    assert pack_bytes == build_evidence_pack(str(sample_dir))[1]
+    assert after["hits"] - before["hits"] == 0
+    assert after["misses"] - before["misses"] == 5
+    assert after["pruned"] - before["pruned"] == 1
+    with sqlite3.connect(cache_path) as connection:
+        versions = connection.execute(
+            "SELECT DISTINCT builder_version FROM pack_entries"
+        ).fetchall()
+    assert versions == [("edited chunker",)]
+
+
+def test_invalid_utf8_is_rejected_with_workers_and_cache(tmp_path: Path):
+    sample_dir = tmp_path / "sample"
+    _write_sample(sample_dir)
+    (sample_dir / "bad.txt").write_bytes(b"\xff\xfe")
+    with pytest.raises(ValueError, match="bad.txt"):
+        build_evidence_pack(
+            str(sample_dir), workers=2, cache_path=tmp_path / "pack_cache.sqlite3"
+        )
+
+
+def test_cli_pack_accepts_workers_and_cache(tmp_path: Path):
+    sample_dir = tmp_path / "sample"
+    _write_sample(sample_dir)
+    out = tmp_path / "evidence_pack.json"
+    cache = tmp_path / "pack_cache.sqlite3"
+    args = [str(sample_dir), "--out", str(out), "--workers", "2", "--cache", str(cache)]
+    assert cli_pack.main(args) == 0
+    assert cli_pack.main(args) == 0
+    assert out.read_bytes() == build_evidence_pack(str(sample_dir))[1]
@@ -0,0 +1,32 @@
+import hashlib
+import subprocess
+
+from scripts.generate_manifest import _hash_blobs, _index_blob_ids, check_manifest
+
+
+def test_batched_blob_hashes_match_git_show():
+    blob_ids = _index_blob_ids()
+    paths = ["LICENSE", "README.md", "pyproject.toml"]
+
+    digests = _hash_blobs([blob_ids[path] for path in paths])
+
+    for path in paths:
+        expected = hashlib.sha256(
+            subprocess.check_output(["git", "show", f":{path}"])
+        ).hexdigest()
+        assert digests[blob_ids[path]] == expected
+
+
+def test_check_manifest_lists_every_difference():
+    expected = f"{'a' * 64}  LICENSE\n{'b' * 64}  README.md\n{'c' * 64}  src/x.py\n"
+    existing = f"{'a' * 64}  LICENSE\n{'0' * 64}  README.md\n{'d' * 64}  old.py\n"
+
+    assert check_manifest(existing, expected) == [
+        "changed:  README.md",
+        "stale:    old.py",
+        "missing:  src/x.py",
+    ]
+    assert check_manifest(expected, expected) == []
+    assert check_manifest(expected.rstrip("\n"), expected) == [
+        "format:   MANIFEST.sha256 is not in canonical form"
+    ]
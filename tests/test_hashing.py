@@ -1,6 +1,7 @@
 import hashlib
 
-from core.determinism.hashing import sha256_text
+from core.determinism import hashing
+from core.determinism.hashing import sha256_file, sha256_text
 
 
 def test_sha256_text_normalizes_crlf_to_lf():
@@ -11,3 +12,15 @@ def test_sha256_text_normalizes_unicode_to_nfc():
     expected = hashlib.sha256("Caf\u00e9".encode("utf-8")).hexdigest()
 
     assert sha256_text("Cafe\u0301") == expected
+
+
+def test_sha256_file_matches_bytes_digest_with_and_without_mmap(
+    tmp_path, monkeypatch
+):
+    path = tmp_path / "output.json"
+    path.write_bytes(b"x" * 4096)
+    expected = hashlib.sha256(b"x" * 4096).hexdigest()
+
+    assert sha256_file(path) == expected
+    monkeypatch.setattr(hashing, "_MMAP_THRESHOLD", 1024)
+    assert sha256_file(path) == expected
@@ -1,7 +1,11 @@
 import json
+import random
 from pathlib import Path
 
+from scripts.bench_legal_contract import _LegacyExtractors, build_contract
+
 from deterministic_ai import main
+from domains.legal_contract.extractor import LegalContractExtractors
 
 
 def test_legal_contract_extraction(tmp_path: Path):
@@ -53,3 +57,85 @@ def test_sample_contract_manifest_matches_input():
 
     actual = hashlib.sha256(payload).hexdigest()
     assert actual == expected
+
+
+FRAGMENTS = [
+    "Acme Cloud Services, Inc.",
+    "Northwind Labs LLC",
+    "Café_Bleu",
+    ", a Delaware corporation (",
+    ', an LLC ("Provider")',
+    '("Licensee")',
+    ' (the "Software")',
+    ' (the "Term 2") means the platform, ',
+    '"Fees" means the amounts due',
+    " as licensor and ",
+    " as Customer and ",
+    "Either party may terminate this Agreement if ",
+    "terminate upon notice",
+    "The Term of this Agreement may terminate.",
+    "Provider shall deliver the reports.",
+    "Licensee must pay the fees.",
+    "effective as of January 15, 2024",
+    "governed by the laws of the State of Delaware.",
+    ". ",
+    "\n",
+    "\n\n",
+    " ",
+    ",",
+    "-",
+    "a",
+]
+
+
+def test_indexed_extraction_matches_legacy_scans():
+    extractor = LegalContractExtractors()
+    legacy = _LegacyExtractors()
+    rng = random.Random(19)
+    texts = [build_contract(3)]
+    for _ in range(300):
+        texts.append("".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40))))
+    for text in texts:
+        normalized = extractor.normalize_input(text)
+        assert extractor.extract(normalized, {}) == legacy.extract(normalized, {})
+
+
+def test_timings_flag_reaches_provenance_only(tmp_path: Path):
+    args = [
+        "--domain",
+        "legal_contract",
+        "--input-ref",
+        "sample_contract",
+        "--input-file",
+        "data/legal_contract_sample/sample_contract.txt",
+        "--timestamp",
+        "2026-02-28T14:32:00Z",
+    ]
+    main(args + ["--out", str(tmp_path / "plain")])
+    main(args + ["--timings", "--out", str(tmp_path / "timed")])
+
+    def read(name, run):
+        return json.loads((tmp_path / run / name).read_text(encoding="utf-8"))
+
+    assert read("output.json", "plain") == read("output.json", "timed")
+    timings = read("provenance.json", "timed")["provenance_meta"]["extraction_timings"]
+    assert sorted(timings) == sorted(
+        [
+            "parties",
+            "effective_date",
+            "term",
+            "obligations",
+            "defined_terms",
+            "governing_law",
+            "termination_conditions",
+        ]
+    )
+    assert "extraction_timings" not in read("provenance.json", "plain").get(
+        "provenance_meta", {}
+    )
+
+    extractor = LegalContractExtractors()
+    text = extractor.normalize_input(build_contract(1))
+    extracted, direct_timings = extractor.extract_timed(text, {})
+    assert extracted == extractor.extract(text, {})
+    assert sorted(direct_timings) == sorted(timings)
@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.determinism.finalize import finalize
+from core.determinism.ledger import write_run
+from core.determinism.merkle_manifest import (
+    build_merkle_document,
+    current_merkle_document,
+    diverged_subtrees,
+    dumps_merkle_document,
+    mismatched_subtrees,
+    parse_manifest,
+)
+from core.determinism.replay import verify_run
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _manifest(entries: dict[str, str]) -> bytes:
+    return "".join(f"{entries[path]}  {path}\n" for path in sorted(entries)).encode()
+
+
+def _entries() -> dict[str, str]:
+    return {
+        "README.md": "1" * 64,
+        "schemas/a.schema.json": "2" * 64,
+        "src/core/determinism/ledger.py": "3" * 64,
+        "src/core/reasoning/causal.py": "4" * 64,
+        "src/main.py": "5" * 64,
+    }
+
+
+def test_subtree_roots_only_change_along_the_changed_path():
+    before = build_merkle_document(_manifest(_entries()))
+    changed = {**_entries(), "src/core/reasoning/causal.py": "6" * 64}
+    after = build_merkle_document(_manifest(changed))
+
+    changed_trees = sorted(
+        tree
+        for tree, root in before["trees"].items()
+        if after["trees"][tree] != root
+    )
+    assert changed_trees == [".", "src", "src/core", "src/core/reasoning"]
+    assert diverged_subtrees(before, after) == ["src/core/reasoning"]
+    assert mismatched_subtrees(before, after, ["schemas", "src/core/determinism"]) == []
+    assert mismatched_subtrees(before, after, ["src/core"]) == ["src/core"]
+
+
+def test_diverged_subtrees_reports_direct_files_and_new_directories():
+    before = build_merkle_document(_manifest(_entries()))
+    changed = {**_entries(), "src/main.py": "6" * 64, "docs/new.md": "7" * 64}
+    after = build_merkle_document(_manifest(changed))
+
+    assert diverged_subtrees(before, after) == ["docs", "src"]
+    with pytest.raises(ValueError, match="unknown manifest subtree"):
+        mismatched_subtrees(before, after, ["docs"])
+
+
+def test_shipped_merkle_artifact_matches_manifest():
+    manifest_bytes = Path("MANIFEST.sha256").read_bytes()
+    document = build_merkle_document(manifest_bytes)
+
+    assert Path("MANIFEST.merkle.json").read_bytes() == dumps_merkle_document(document)
+    assert current_merkle_document() == document
+
+
+def _sealed_with_manifest(manifest_bytes: bytes) -> dict:
+    bundle = json.loads(
+        (FIXTURES / "evidence_bundle_example.json").read_text(encoding="utf-8")
+    )
+    return finalize(
+        bundle,
+        {"decision": "allow", "reasons": ["matched"]},
+        manifest_sha256=build_merkle_document(manifest_bytes)["manifest_sha256"],
+        core_version="0.3.0",
+        ruleset_id="ruleset.core.v1",
+        created_utc="2026-03-01T12:05:00Z",
+    )
+
+
+def test_replay_reports_and_scopes_diverged_subtrees(tmp_path: Path):
+    entries = parse_manifest(Path("MANIFEST.sha256").read_text(encoding="utf-8"))
+    schema_path = min(path for path in entries if path.startswith("schemas/"))
+    entries[schema_path] = "0" * 64
+    sealed_manifest = _manifest(entries)
+    baseline = build_merkle_document(sealed_manifest)
+    run_dir = write_run(
+        ledger_root=str(tmp_path), **_sealed_with_manifest(sealed_manifest)
+    )
+
+    result = verify_run(str(run_dir), merkle_baseline=baseline)
+    assert result["manifest_diverged_subtrees"] == ["schemas"]
+    assert result["warnings"] == ["manifest_sha256 mismatch in: schemas"]
+
+    scoped = verify_run(
+        str(run_dir),
+        strict_manifest=True,
+        merkle_baseline=baseline,
+        required_subtrees=["src/core"],
+    )
+    assert scoped["warnings"] == []
+
+    with pytest.raises(ValueError, match="manifest subtree mismatch: schemas"):
+        verify_run(
+            str(run_dir),
+            strict_manifest=True,
+            merkle_baseline=baseline,
+            required_subtrees=["schemas", "src/core"],
+        )
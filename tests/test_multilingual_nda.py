@@ -1,5 +1,10 @@
+import random
+import re
 from pathlib import Path
 
+from scripts.bench_nda_rules import FILLER, _legacy_extract, sample_text
+
+from iota_verbum_api.domains.nda.rules import RULE_SETS
 from iota_verbum_api.services.extraction import extract_symbolic
 
 
@@ -47,3 +52,13 @@ def test_spanish_nda_clause_coverage():
         "definicion_informacion_confidencial",
     }
 
+
+def test_rule_sweep_matches_per_rule_scan():
+    rng = random.Random(18)
+    for language, rule_set in RULE_SETS.items():
+        pieces = re.split(r"(?<=[.!?])\s+|\n\n+", sample_text(language))
+        pieces += [FILLER[language], "", "İstanbul.", "Ω.", "\n\n"]
+        for _ in range(50):
+            chosen = rng.sample(pieces, rng.randint(0, len(pieces)))
+            text = rng.choice([" ", "\n\n", "\n"]).join(chosen)
+            assert rule_set.extract(text) == _legacy_extract(rule_set, text)
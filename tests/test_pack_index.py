@@ -0,0 +1,174 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from proposal import cli_bundle, cli_pack
+from proposal.bundle_from_pack import select_chunks
+from proposal.evidence_pack import build_evidence_pack
+from proposal.pack_index import PackIndex, index_path_for, load_pack_index
+
+WORDS = [
+    "ledger",
+    "Ledger",
+    "attest",
+    "attestation",
+    "seal-check",
+    "Café",
+    "café",
+    "Ĥ̱at",
+    "İstanbul",
+    "STRASSE",
+    "straße",
+    "a",
+    "42",
+    "x_y",
+    "\n",
+    ".",
+    "\r\n",
+]
+QUERIES = [
+    "ledger",
+    "LEDGER attest",
+    "att",
+    "e",
+    "seal-check",
+    "check seal",
+    "café",
+    "ẖ̂",
+    "ĥ",
+    "i̇stanbul",
+    "strasse",
+    "ß",
+    "42 a",
+    "x_y",
+    "y",
+    ".",
+    "",
+    "   ",
+    "missing",
+]
+
+
+def _random_pack(tmp_path: Path, rng: random.Random) -> dict:
+    folder = tmp_path / f"docs{rng.random()}"
+    folder.mkdir()
+    for name in ("b.md", "a.txt", "sub/c.md"):
+        path = folder / name
+        path.parent.mkdir(exist_ok=True)
+        words = rng.choices(WORDS, k=rng.randint(0, 80))
+        path.write_text(" ".join(words), encoding="utf-8")
+    pack, _ = build_evidence_pack(str(folder), max_chars=40, overlap_chars=5)
+    return pack
+
+
+def test_indexed_selection_matches_scan(tmp_path: Path):
+    rng = random.Random(21)
+    for _ in range(25):
+        pack = _random_pack(tmp_path, rng)
+        index = PackIndex.build(pack)
+        reloaded = PackIndex.from_json(json.loads(index.dumps()))
+        for mode in ("all", "keyword", "topk", "bm25"):
+            for query in QUERIES:
+                max_chunks = rng.choice([0, 1, 3, 50])
+                expected = select_chunks(
+                    pack, mode=mode, query=query, max_chunks=max_chunks
+                )
+                for pack_index in (index, reloaded):
+                    assert (
+                        select_chunks(
+                            pack,
+                            mode=mode,
+                            query=query,
+                            max_chunks=max_chunks,
+                            index=pack_index,
+                        )
+                        == expected
+                    ), (mode, query, max_chunks)
+
+
+def test_bm25_prefers_rarer_and_denser_terms(tmp_path: Path):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "a.md").write_text("ledger ledger ledger seal", encoding="utf-8")
+    (folder / "b.md").write_text("ledger note note note", encoding="utf-8")
+    (folder / "c.md").write_text("ledger merkle note note", encoding="utf-8")
+    pack, _ = build_evidence_pack(str(folder))
+    relpaths = {doc["doc_id"]: doc["relpath"] for doc in pack["documents"]}
+
+    def ranked(query):
+        chunks = select_chunks(pack, mode="bm25", query=query, max_chunks=10)
+        return [relpaths[chunk["doc_id"]] for chunk in chunks]
+
+    assert ranked("Merkle ledger") == ["c.md", "a.md", "b.md"]
+    assert ranked("ledger") == ["a.md", "b.md", "c.md"]
+    assert ranked("absent words") == []
+
+
+def test_index_must_match_pack(tmp_path: Path):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "a.md").write_text("one two", encoding="utf-8")
+    pack, _ = build_evidence_pack(str(folder))
+    index = PackIndex.build(pack)
+    (folder / "a.md").write_text("three", encoding="utf-8")
+    other, _ = build_evidence_pack(str(folder))
+    with pytest.raises(ValueError):
+        select_chunks(other, mode="all", query="", max_chunks=5, index=index)
+
+
+def test_cli_writes_sidecar_and_selects_with_it(tmp_path: Path, capsys):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "a.md").write_text("# Ledger\nAttestation ledger seal\n", "utf-8")
+    (folder / "b.md").write_text("# Notes\nUnrelated notes\n", "utf-8")
+    pack_path = tmp_path / "evidence_pack.json"
+    assert cli_pack.main([str(folder), "--out", str(pack_path), "--index"]) == 0
+    sidecar = index_path_for(pack_path)
+    assert sidecar.name == "evidence_pack.index.json"
+    pack = json.loads(pack_path.read_text(encoding="utf-8"))
+    assert load_pack_index(sidecar, pack).pack_sha256 == pack["pack_sha256"]
+
+    common = [
+        "--pack",
+        str(pack_path),
+        "--prompt",
+        "p",
+        "--created-utc",
+        "2026-03-01T12:00:00Z",
+        "--core-version",
+        "0.3.0",
+        "--ruleset-id",
+        "ruleset.core.v1",
+        "--mode",
+        "bm25",
+        "--query",
+        "ledger",
+    ]
+    cli_bundle.main(common + ["--out", str(tmp_path / "plain.json")])
+    cli_bundle.main(
+        common + ["--index", str(sidecar), "--out", str(tmp_path / "indexed.json")]
+    )
+    plain = (tmp_path / "plain.json").read_bytes()
+    assert plain == (tmp_path / "indexed.json").read_bytes()
+    artifacts = json.loads(plain)["artifacts"]
+    assert [artifact["source_id"] for artifact in artifacts] == [
+        pack["documents"][0]["doc_id"]
+    ]
+
+
+def test_substring_candidates_cover_exact_and_longer_tokens(tmp_path: Path):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "a.md").write_text("ledger attest", encoding="utf-8")
+    (folder / "b.md").write_text("ledgers", encoding="utf-8")
+    (folder / "c.md").write_text("seal", encoding="utf-8")
+    pack, _ = build_evidence_pack(str(folder))
+    index = PackIndex.build(pack)
+
+    assert index.substring_candidates(["ledger"], match_all=True) == [0, 1]
+    assert index.substring_candidates(["ledger", "attest"], match_all=True) == [0]
+    assert index.substring_candidates(["ledger", "attest"], match_all=False) == [0, 1]
+    assert index.substring_candidates(["seal-check"], match_all=False) is None
+    assert sorted(index._containing) == ["attest", "ledger"]
@@ -0,0 +1,138 @@
+import io
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from proposal import cli_bundle, cli_pack, cli_pack_convert
+from proposal.bundle_from_pack import load_pack, select_chunks
+from proposal.evidence_pack import build_evidence_pack
+from proposal.pack_ndjson import NdjsonPack, convert_pack, dumps_ndjson_pack
+from proposal.world_propose import load_world_pack
+
+
+def _pack(tmp_path: Path) -> tuple[dict, bytes]:
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "b.md").write_text("# Ledger\r\nAttestation ledger seal\n" * 3, "utf-8")
+    (folder / "a.txt").write_text('Café "quoted" merkle\tnotes ' * 4, "utf-8")
+    (folder / "c.md").write_text("Attestation ledger seal\n" * 2, "utf-8")
+    (folder / "d.md").write_text("Attestation ledger seal\n" * 2, "utf-8")
+    return build_evidence_pack(
+        str(folder), root_hint="docs", max_chars=24, overlap_chars=4
+    )
+
+
+def test_ndjson_pack_round_trips_byte_identical(tmp_path: Path):
+    pack_obj, pack_bytes = _pack(tmp_path)
+    ndjson_path = tmp_path / "evidence_pack.ndjson"
+    ndjson_path.write_bytes(dumps_ndjson_pack(pack_obj))
+
+    with NdjsonPack(ndjson_path) as pack:
+        assert pack.compute_pack_sha256() == pack_obj["pack_sha256"]
+        pack.verify()
+        assert pack.documents == pack_obj["documents"]
+        assert pack.to_pack() == pack_obj
+        buffer = io.BytesIO()
+        pack.write_json(buffer)
+    assert buffer.getvalue() == pack_bytes
+
+    json_path = tmp_path / "back.json"
+    assert convert_pack(ndjson_path, json_path) == pack_obj["pack_sha256"]
+    assert json_path.read_bytes() == pack_bytes
+    again = tmp_path / "again.ndjson"
+    convert_pack(json_path, again)
+    assert again.read_bytes() == ndjson_path.read_bytes()
+
+
+def test_chunks_are_read_lazily_by_position_and_id(tmp_path: Path):
+    pack_obj, _ = _pack(tmp_path)
+    ndjson_path = tmp_path / "evidence_pack.ndjson"
+    ndjson_path.write_bytes(dumps_ndjson_pack(pack_obj))
+    with NdjsonPack(ndjson_path) as pack:
+        assert len(pack) == len(pack_obj["chunks"])
+        assert pack.chunk(3) == pack_obj["chunks"][3]
+        counts = Counter(chunk["chunk_id"] for chunk in pack_obj["chunks"])
+        repeated = counts.most_common(1)[0][0]
+        expected = [c for c in pack_obj["chunks"] if c["chunk_id"] == repeated]
+        assert len(expected) > 1
+        assert pack.chunks_by_id(repeated) == expected
+        assert pack.chunks_by_id("chunk:missing") == []
+
+
+def test_load_pack_selects_from_ndjson_like_json(tmp_path: Path):
+    pack_obj, _ = _pack(tmp_path)
+    ndjson_path = tmp_path / "evidence_pack.ndjson"
+    ndjson_path.write_bytes(dumps_ndjson_pack(pack_obj))
+    lazy = load_pack(str(ndjson_path))
+    for mode, query in (
+        ("all", ""),
+        ("keyword", "ledger"),
+        ("topk", "seal"),
+        ("bm25", "merkle"),
+    ):
+        assert select_chunks(
+            lazy, mode=mode, query=query, max_chunks=5
+        ) == select_chunks(pack_obj, mode=mode, query=query, max_chunks=5)
+    assert load_world_pack(str(ndjson_path)) == pack_obj
+
+
+def test_tampered_ndjson_pack_is_rejected(tmp_path: Path):
+    pack_obj, _ = _pack(tmp_path)
+    data = dumps_ndjson_pack(pack_obj)
+    path = tmp_path / "evidence_pack.ndjson"
+
+    path.write_bytes(data.replace(b"merkle", b"MERKLE", 1))
+    with NdjsonPack(path) as pack, pytest.raises(ValueError):
+        pack.verify()
+    with pytest.raises(ValueError):
+        convert_pack(path, tmp_path / "out.json")
+    assert not (tmp_path / "out.json").exists()
+
+    path.write_bytes(data.rstrip(b"\n").rsplit(b"\n", 1)[0] + b"\n")
+    with pytest.raises(ValueError):
+        NdjsonPack(path)
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        NdjsonPack(path)
+
+    bad = dict(pack_obj, pack_sha256="0" * 64)
+    with pytest.raises(ValueError):
+        dumps_ndjson_pack(bad)
+
+
+def test_cli_writes_ndjson_and_bundles_from_it(tmp_path: Path):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    (folder / "a.md").write_text("# Ledger\nAttestation ledger seal\n", "utf-8")
+    (folder / "b.md").write_text("# Notes\nUnrelated notes\n", "utf-8")
+    json_path = tmp_path / "evidence_pack.json"
+    ndjson_path = tmp_path / "evidence_pack.ndjson"
+    assert cli_pack.main([str(folder), "--out", str(json_path)]) == 0
+    assert cli_pack.main([str(folder), "--out", str(ndjson_path), "--index"]) == 0
+    assert cli_pack_convert.main([str(ndjson_path), str(tmp_path / "x.json")]) == 0
+    assert (tmp_path / "x.json").read_bytes() == json_path.read_bytes()
+
+    common = [
+        "--prompt",
+        "p",
+        "--created-utc",
+        "2026-03-01T12:00:00Z",
+        "--core-version",
+        "0.3.0",
+        "--ruleset-id",
+        "ruleset.core.v1",
+        "--mode",
+        "keyword",
+        "--query",
+        "ledger",
+    ]
+    cli_bundle.main(common + ["--pack", str(json_path), "--out", str(tmp_path / "j")])
+    cli_bundle.main(
+        common
+        + ["--pack", str(ndjson_path), "--out", str(tmp_path / "n")]
+        + ["--index", str(tmp_path / "evidence_pack.index.json")]
+    )
+    assert (tmp_path / "j").read_bytes() == (tmp_path / "n").read_bytes()
+    assert len(json.loads((tmp_path / "j").read_bytes())["artifacts"]) == 1
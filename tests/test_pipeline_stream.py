@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from tests.test_deterministic_ai import GOLDENS
+
+from core import attestation
+from core.pipeline import DeterministicPipeline
+from core.pipeline_stream import StreamingPipeline, normalize_by_paragraph
+from deterministic_ai import main
+from domains.biblical_text.extractors import BiblicalTextExtractors
+
+SEALED_FILES = ("output.json", "provenance.json", "attestation.sha256")
+
+
+def test_streaming_run_matches_in_memory_bytes(tmp_path: Path) -> None:
+    for _, base_args, golden_dir in GOLDENS:
+        name = Path(golden_dir).name
+        memory_dir = tmp_path / "memory" / name
+        stream_dir = tmp_path / "stream" / name
+        main(base_args + ["--out", str(memory_dir)])
+        main(base_args + ["--out", str(stream_dir), "--stream"])
+        for filename in SEALED_FILES:
+            assert (stream_dir / filename).read_bytes() == (
+                memory_dir / filename
+            ).read_bytes()
+        log_lines = (stream_dir / "log.txt").read_text(encoding="utf-8").splitlines()
+        assert log_lines[2] == "mode=streaming"
+        assert log_lines[3].startswith("peak_rss_bytes=")
+
+
+def test_streaming_pipeline_reuses_the_hashed_process() -> None:
+    # generator_sha256 hashes core/pipeline.py, so no mode may carry its own.
+    assert "process" not in vars(StreamingPipeline)
+    assert StreamingPipeline.process is DeterministicPipeline.process
+
+
+def test_iter_canonical_json_matches_canonicalize_json(monkeypatch) -> None:
+    data = {"b": [1, 2.5, None, "é"], "a": {"z": True, "y": []}, "c": "x" * 50}
+    expected = attestation.canonicalize_json(data)
+    monkeypatch.setattr(attestation, "_STREAM_CHUNK_SIZE", 7)
+    chunks = list(attestation.iter_canonical_json(data))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == expected
+    assert attestation.sha256_json_stream(data) == attestation.compute_sha256(expected)
+
+
+def test_paragraph_normalization_matches_whole_text() -> None:
+    extractor = BiblicalTextExtractors()
+    pieces = ["word", "Jesus", " ", "\t", "\n", "\r\n", "\r", "\n \n", "“", "\x0c"]
+    rng = random.Random(14)
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 25)))
+        assert normalize_by_paragraph(extractor, text) == extractor.normalize_input(
+            text
+        )
+    assert normalize_by_paragraph(extractor, None) == extractor.normalize_input(None)
@@ -6,7 +6,7 @@ import pytest
 from core.determinism.finalize import finalize
 from core.determinism.hashing import sha256_bytes
 from core.determinism.ledger import write_run
-from core.determinism.replay import verify_run
+from core.determinism.replay import main, verify_all, verify_run
 
 FIXTURES = Path("tests/fixtures")
 
@@ -58,3 +58,58 @@ def test_verify_run_raises_when_manifest_mismatch_if_strict(tmp_path: Path):
 
     with pytest.raises(ValueError, match="manifest_sha256 mismatch"):
         verify_run(str(run_dir), strict_manifest=True)
+
+
+def _ledger_with_runs(root: Path) -> list[Path]:
+    manifest_sha256 = sha256_bytes(Path("MANIFEST.sha256").read_bytes())
+    sealed = _sealed(manifest_sha256)
+    # Nested ledgers mirror outputs/<run_id>/ledger layouts under one root.
+    return [
+        write_run(ledger_root=str(root / run_id / "ledger"), **sealed)
+        for run_id in ("run-a", "run-b", "run-c")
+    ]
+
+
+def test_verify_all_reports_each_run_and_totals(tmp_path: Path):
+    run_dirs = _ledger_with_runs(tmp_path / "ledger")
+    with (run_dirs[1] / "output.json").open("ab") as handle:
+        handle.write(b"\n")
+
+    summary = verify_all(str(tmp_path / "ledger"), workers=2)
+
+    statuses = {Path(run["path"]): run["status"] for run in summary["runs"]}
+    assert statuses == {
+        run_dirs[0]: "ok",
+        run_dirs[1]: "mismatch",
+        run_dirs[2]: "ok",
+    }
+    assert summary["totals"] == {
+        "runs": 3,
+        "ok": 2,
+        "mismatch": 1,
+        "error": 0,
+        "warnings": 0,
+    }
+    assert summary["bytes_hashed"] > 0
+    assert [run["path"] for run in summary["runs"]] == sorted(
+        run["path"] for run in summary["runs"]
+    )
+
+
+def test_replay_all_cli_exit_codes(tmp_path: Path, capsys):
+    run_dirs = _ledger_with_runs(tmp_path / "ledger")
+    summary_path = tmp_path / "summary.json"
+
+    assert main(["--all", str(tmp_path / "ledger"), "--workers", "1"]) == 0
+    assert json.loads(capsys.readouterr().out)["totals"]["ok"] == 3
+
+    (run_dirs[0] / "bundle.json").write_bytes(b"{}")
+    exit_code = main(
+        ["--all", str(tmp_path / "ledger"), "--summary-out", str(summary_path)]
+    )
+    assert exit_code == 1
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["totals"]["mismatch"] == 1
+
+    (tmp_path / "empty").mkdir()
+    assert main(["--all", str(tmp_path / "empty")]) == 2
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.determinism.schema_validate import (
+    clear_validator_cache,
+    preload_schemas,
+    validate,
+    validator_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_validator_cache()
+    yield
+    clear_validator_cache()
+
+
+def _write_schema(path: Path, required: list[str]) -> None:
+    path.write_text(
+        json.dumps({"type": "object", "required": required}),
+        encoding="utf-8",
+    )
+
+
+def test_validate_compiles_each_schema_once():
+    evidence_ref = {
+        "source_id": "doc1",
+        "chunk_id": "doc1:0",
+        "offset_start": 0,
+        "offset_end": 4,
+        "text_sha256": "a" * 64,
+    }
+    for _ in range(5):
+        validate(evidence_ref, "schemas/evidence_ref.schema.json")
+
+    stats = validator_cache_stats()
+    assert stats["entries"] == 1
+    assert stats["misses"] == 1
+    assert stats["compiles"] == 1
+    assert stats["hits"] == 4
+
+
+def test_validate_recompiles_when_schema_content_changes(tmp_path: Path):
+    schema_file = tmp_path / "thing.schema.json"
+    _write_schema(schema_file, ["a"])
+    validate({"a": 1}, schema_file)
+
+    _write_schema(schema_file, ["a", "b"])
+    with pytest.raises(ValueError, match="b"):
+        validate({"a": 1}, schema_file)
+
+    stats = validator_cache_stats()
+    assert stats["invalidations"] == 1
+    assert stats["compiles"] == 2
+
+
+def test_preload_schemas_compiles_every_repo_schema():
+    expected = len(list(Path("schemas").glob("*.schema.json")))
+
+    assert preload_schemas() == expected
+    stats = validator_cache_stats()
+    assert stats["entries"] == expected
+    assert stats["hits"] == 0
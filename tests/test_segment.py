@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+
+from scripts.bench_segment import ABBREVIATIONS, _legacy_segment, build_text
+
+from core.extraction import normalize_input, segment
+
+PIECES = [
+    "Mr", "Dr", "etc", "word", "a", "'", "é", " ", "\t", "\n", "\n\n",
+    ".", "!", "?", ";", ":", "—", "–", " and ", " but ", " yet ",
+    " and and ", " and yet ", "and",
+]
+
+
+def test_segment_matches_legacy_on_random_text() -> None:
+    rng = random.Random(11)
+    for _ in range(3000):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 40)))
+        abbreviations = rng.choice([None, {"mr", "dr", "etc"}, {"a"}])
+        assert segment(text, abbreviations) == _legacy_segment(text, abbreviations)
+
+
+def test_segment_matches_legacy_on_generated_document() -> None:
+    text = normalize_input(build_text(20_000))
+    assert segment(text, ABBREVIATIONS) == _legacy_segment(text, ABBREVIATIONS)
+
+
+def test_segment_edge_cases() -> None:
+    # "$" in the legacy prefix search also matched before a trailing newline.
+    assert segment("Mr\n. Smith", {"mr"})[2] == [(0, 2), (3, 10)]
+    segments, boundaries, spans = segment("One and yet two; three: four.")
+    assert spans == [(0, 29)]
+    assert [item["text"] for item in segments] == [
+        "One",
+        "and",
+        "yet two;",
+        "three:",
+        "four.",
+    ]
+    assert boundaries == [
+        {"boundary": 15, "type": "punct"},
+        {"boundary": 22, "type": "punct"},
+    ]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from core.extraction import MatchIndex, SpanIndex, index_coref_links, segment
+
+TEXT = "Jesus came; he spoke. Then John answered and she listened.\n\nThey went."
+
+
+def _naive_segment_at(segments, position):
+    for seg in segments:
+        if seg["token_start"] <= position < seg["token_end"]:
+            return seg
+    return None
+
+
+def test_span_index_matches_linear_scan() -> None:
+    segments, _, _ = segment(TEXT)
+    index = SpanIndex(segments)
+    for position in range(-1, len(TEXT) + 2):
+        expected = _naive_segment_at(segments, position)
+        assert index.segment_at(position) is expected
+        assert index.sentence_at(position) == (
+            expected["sentence_id"] if expected else 0
+        )
+        assert index.clause_id_at(position) == (
+            expected["clause_id"] if expected else None
+        )
+    for seg in segments:
+        assert index.clause(seg["clause_id"]) is seg
+    assert index.clause("s99.c0") is None
+
+
+def test_match_index_bounds() -> None:
+    matches = MatchIndex([(10, 12, "b"), (3, 5, "a"), (10, 12, "a"), (20, 22, "c")])
+    assert matches.last_in(0, 10) == (3, 5, "a")
+    assert matches.last_in(0, 11) == (10, 12, "b")
+    assert matches.last_in(4, 10) is None
+    assert matches.first_in(4, 21) == (10, 12, "a")
+    assert matches.first_in(11, 20) is None
+    assert matches.first_in(11, 21) == (20, 22, "c")
+
+
+def test_index_coref_links_keeps_first_link_per_span() -> None:
+    links = [
+        {"from": {"token_span": [12, 14]}, "to": "Jesus"},
+        {"from": {"token_span": [12, 14]}, "to": "John"},
+        {"from": {"token_span": [44, 47]}, "to": "woman_of_Samaria"},
+    ]
+    assert index_coref_links(links) == {(12, 14): "Jesus", (44, 47): "woman_of_Samaria"}
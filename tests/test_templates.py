@@ -0,0 +1,171 @@
+import json
+import os
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from core import templates
+from core.templates import TemplateRegistry, resolve_placeholders
+
+TEMPLATE_ROOT = Path(__file__).resolve().parents[1] / "src" / "domains"
+
+
+def _legacy_resolve(value, context):
+    # resolve_placeholders before placeholders were precompiled.
+    if isinstance(value, str):
+        return re.sub(
+            r"\{([^{}]+)\}",
+            lambda match: _legacy_text(match.group(1), context),
+            value,
+        )
+    if isinstance(value, list):
+        return [_legacy_resolve(v, context) for v in value]
+    if isinstance(value, dict):
+        return {k: _legacy_resolve(v, context) for k, v in value.items()}
+    return value
+
+
+def _legacy_text(key, context):
+    if "." in key:
+        base, rest = key.split(".", 1)
+        base_val = _legacy_base(base, context)
+        resolved = base_val.get(rest) if isinstance(base_val, dict) else None
+    else:
+        resolved = _legacy_base(key, context)
+    return f"{{missing:{key}}}" if resolved is None else str(resolved)
+
+
+def _legacy_base(key, context):
+    if key in context:
+        return context[key]
+    match = re.match(r"([a-zA-Z_]+)_(\d+)", key)
+    if match:
+        base = match.group(1)
+        index = int(match.group(2))
+        for name in (
+            base,
+            f"{base}s",
+            f"{base}_list",
+            f"{base}s_detailed",
+            f"{base}_detailed",
+        ):
+            if name in context and isinstance(context[name], list):
+                idx = 0 if index == 0 else index - 1
+                if 0 <= idx < len(context[name]):
+                    return context[name][idx]
+    return None
+
+
+CONTEXT = {
+    "decision": "approved",
+    "rate": 0.049,
+    "action": "asks",
+    "actions": ["gives", "drinks"],
+    "frame_list": ["Jesus asks", "woman answers"],
+    "movement_detailed": [{"kind": "turn"}],
+    "evidence": {"bp": "150/95"},
+    "none": None,
+    "count": 0,
+}
+KEYS = (
+    "decision",
+    "rate",
+    "action_1",
+    "action_3",
+    "frame_2",
+    "frame_0",
+    "movement_1",
+    "movement_1.kind",
+    "evidence.bp",
+    "evidence.missing",
+    "decision.x",
+    "none",
+    "count",
+    "unknown",
+    "action_2x",
+    "a.b.c",
+)
+
+
+def _random_string(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 6)):
+        roll = rng.random()
+        if roll < 0.5:
+            parts.append("{" + rng.choice(KEYS) + "}")
+        elif roll < 0.6:
+            parts.append(rng.choice(["{", "}", "{{", "}}", "{}", "{ {x} }"]))
+        else:
+            parts.append(rng.choice(["Hello ", "and ", ", ", "\n", "é", ""]))
+    return "".join(parts)
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth < 3 and roll < 0.2:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if depth < 3 and roll < 0.4:
+        return {
+            f"k{i}": _random_value(rng, depth + 1) for i in range(rng.randint(0, 4))
+        }
+    if roll < 0.5:
+        return rng.choice([1, 2.5, True, None])
+    return _random_string(rng)
+
+
+def test_resolve_placeholders_matches_legacy():
+    rng = random.Random(16)
+    for _ in range(500):
+        value = _random_value(rng)
+        assert resolve_placeholders(value, CONTEXT) == _legacy_resolve(value, CONTEXT)
+
+
+@pytest.mark.parametrize(
+    "domain",
+    ["biblical_text", "clinical_records", "credit_scoring", "legal_contract"],
+)
+def test_compiled_render_matches_document(domain):
+    template_dir = TEMPLATE_ROOT / domain / "templates"
+    compiled = templates.template_registry().lookup("John 4:7-10", template_dir)
+    document = compiled.document()
+    assert compiled.render(CONTEXT) == _legacy_resolve(document, CONTEXT)
+    assert document == templates.load_template("John 4:7-10", template_dir)
+    assert document["_template_path"] == compiled.path
+    assert document["_template_sha256"] == compiled.sha256
+
+
+def test_registry_follows_directory_and_file_changes(tmp_path: Path):
+    registry = TemplateRegistry()
+    (tmp_path / "generic.json").write_text('{"t": "{a}"}', encoding="utf-8")
+    generic = registry.lookup("John 1:1", tmp_path)
+    assert registry.lookup("John 1:1", tmp_path) is generic
+    assert generic.render({"a": 1})["t"] == "1"
+
+    # A more specific template added later is picked up.
+    book = tmp_path / "john.json"
+    book.write_text('{"t": "book"}', encoding="utf-8")
+    stat = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert registry.lookup("John 1:1", tmp_path).document()["t"] == "book"
+
+    # Edits to the chosen file are picked up, and the hash follows them.
+    before = registry.lookup("John 1:1", tmp_path).sha256
+    book.write_text('{"t": "edited book"}', encoding="utf-8")
+    compiled = registry.lookup("John 1:1", tmp_path)
+    assert compiled.document()["t"] == "edited book"
+    assert compiled.sha256 != before
+
+    with pytest.raises(FileNotFoundError):
+        registry.lookup("John 1:1", tmp_path / "missing")
+
+
+def test_document_is_a_fresh_copy(tmp_path: Path):
+    (tmp_path / "generic.json").write_text(json.dumps({"t": ["{a}"]}), encoding="utf-8")
+    compiled = TemplateRegistry().lookup("x", tmp_path)
+    compiled.document()["t"].append("changed")
+    rendered = compiled.render({"a": "x"})
+    rendered["t"].append("changed")
+    assert compiled.document()["t"] == ["{a}"]
+    assert compiled.render({"a": "x"})["t"] == ["x"]
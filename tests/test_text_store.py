@@ -0,0 +1,115 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from core.determinism.bundle import build_evidence_bundle
+from core.determinism.hashing import sha256_text
+from core.determinism.text_store import TextStore
+from proposal import cli_pack
+from proposal.bundle_from_pack import build_evidence_bundle_from_pack
+from proposal.evidence_pack import build_evidence_pack
+
+LICENSE = "Licensed under the Apache License 2.0.\n" * 3
+BUNDLE_ARGS = {
+    "prompt": "p",
+    "params": {},
+    "created_utc": "2026-03-01T12:00:00Z",
+    "core_version": "0.3.0",
+    "ruleset_id": "ruleset.core.v1",
+}
+
+
+def _corpus(tmp_path: Path) -> Path:
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    for index in range(4):
+        (folder / f"doc{index}.md").write_text(
+            LICENSE + f"Runbook {index}: rotate the credential.\n", "utf-8"
+        )
+    return folder
+
+
+def test_text_store_hashes_and_keeps_each_text_once():
+    store = TextStore()
+    first = "".join(["boiler", "plate"])
+    second = "".join(["boiler", "plate"])
+    assert first is not second
+    assert store.add(first) is first
+    assert store.add(second) is first
+    assert store.add("a\r\nb") == "a\r\nb"
+    assert store.add("a\nb") == "a\nb"
+    assert store.sha256(second) == sha256_text("boilerplate")
+    assert store.get(sha256_text("boilerplate")) is first
+    assert store.report() == {
+        "occurrences": 4,
+        "unique_texts": 2,
+        "hashed_texts": 3,
+        "bytes": 30,
+        "unique_bytes": 15,
+        "dedup_ratio": 2.0,
+    }
+    with pytest.raises(ValueError):
+        store.add(second, sha256_text("other"))
+
+
+def test_text_store_checks_a_given_digest_the_first_time(tmp_path: Path):
+    with pytest.raises(ValueError):
+        TextStore().add("right", sha256_text("wrong"))
+
+    # A corrupted pack cache entry reaches the store with its recorded digest.
+    folder = _corpus(tmp_path)
+    cache_path = tmp_path / "pack_cache.sqlite3"
+    build_evidence_pack(str(folder), cache_path=cache_path)
+    with sqlite3.connect(cache_path) as connection:
+        connection.execute(
+            "UPDATE pack_entries SET chunks_json = replace(chunks_json, ?, ?)",
+            ("rotate", "delete"),
+        )
+    with pytest.raises(ValueError, match="text_sha256 does not match text"):
+        build_evidence_pack(str(folder), cache_path=cache_path)
+
+
+def test_pack_and_bundle_share_repeated_texts(tmp_path: Path):
+    folder = _corpus(tmp_path)
+    options = {"root_hint": "docs", "max_chars": 39, "overlap_chars": 0}
+    store = TextStore()
+    pack_obj, pack_bytes = build_evidence_pack(str(folder), text_store=store, **options)
+    assert pack_bytes == build_evidence_pack(str(folder), **options)[1]
+
+    license_chunks = [c for c in pack_obj["chunks"] if c["index"] == 0]
+    assert len(license_chunks) == 4
+    assert all(c["text"] is license_chunks[0]["text"] for c in license_chunks)
+    report = store.report()
+    assert report["occurrences"] == len(pack_obj["chunks"])
+    assert report["hashed_texts"] == report["unique_texts"] < report["occurrences"]
+    assert report["dedup_ratio"] > 1
+
+    hashed = store.hashed
+    _, shared_bytes, shared_sha256 = build_evidence_bundle_from_pack(
+        pack_obj, max_chunks=100, text_store=store, **BUNDLE_ARGS
+    )
+    assert store.hashed == hashed
+    _, fresh_bytes, fresh_sha256 = build_evidence_bundle_from_pack(
+        pack_obj, max_chunks=100, **BUNDLE_ARGS
+    )
+    assert (shared_bytes, shared_sha256) == (fresh_bytes, fresh_sha256)
+
+
+def test_bundle_text_store_still_rejects_mismatched_artifacts():
+    store = TextStore()
+    store.sha256("right")
+    bundle = {"artifacts": [{"text": "right", "text_sha256": sha256_text("wrong")}]}
+    with pytest.raises(ValueError):
+        build_evidence_bundle(bundle, text_store=store)
+
+
+def test_cli_pack_prints_dedup_report(tmp_path: Path, capsys):
+    folder = _corpus(tmp_path)
+    out = tmp_path / "evidence_pack.json"
+    args = [str(folder), "--out", str(out), "--max-chars", "39", "--overlap-chars", "0"]
+    assert cli_pack.main(args + ["--dedup-report"]) == 0
+    summary, report = capsys.readouterr().out.splitlines()
+    assert summary.startswith(json.loads(out.read_bytes())["pack_sha256"])
+    assert json.loads(report)["unique_texts"] < json.loads(report)["occurrences"]
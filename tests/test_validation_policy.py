@@ -0,0 +1,243 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.determinism.canonical_json import dumps_canonical
+from core.determinism.finalize import finalize
+from core.determinism.ledger import write_run
+from core.determinism.replay import verify_run
+from core.determinism.schema_validate import (
+    VALIDATION_POLICIES,
+    VALIDATION_POLICY_ENV,
+    current_validation_policy,
+    validate,
+    validation_policy,
+)
+from core.reasoning.causal import compute_causal_graph
+from core.reasoning.causal_narrative_v2 import render_causal_narrative_v2
+from core.reasoning.claim_graph import find_duplicates_and_contradictions
+from core.reasoning.constraint_narrative_v2 import render_constraint_narrative_v2
+from core.reasoning.constraints import compute_constraints
+from core.reasoning.critical_path import compute_critical_path
+from core.reasoning.critical_path_narrative_v2 import (
+    render_critical_path_narrative_v2,
+)
+from core.reasoning.repair_hints import compute_repair_hints
+from core.reasoning.repair_hints_narrative_v2 import (
+    render_repair_hints_narrative_v2,
+)
+from proposal.cli_demo import run_demo
+
+FIXTURES = Path("tests/fixtures")
+DEMO_CASES = json.loads(
+    Path("data/demo_cases/fixtures.json").read_text(encoding="utf-8")
+)["items"]
+
+
+def _load(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+def _causal_graph() -> bytes:
+    return dumps_canonical(compute_causal_graph(_load("causal_world_example.json")))
+
+
+def _causal_narrative() -> bytes:
+    causal_graph = compute_causal_graph(_load("causal_world_example.json"))
+    narrative = render_causal_narrative_v2(
+        causal_graph, max_lines=40, verbosity="brief"
+    )
+    return narrative["text"].encode("utf-8")
+
+
+def _constraints() -> bytes:
+    fixture = _load("constraint_world_example.json")
+    report = compute_constraints(fixture["world_model"], fixture["causal_graph"])
+    return dumps_canonical(report)
+
+
+def _constraint_narrative() -> bytes:
+    fixture = _load("constraint_world_example.json")
+    report = compute_constraints(fixture["world_model"], fixture["causal_graph"])
+    narrative = render_constraint_narrative_v2(report, mode="brief", max_lines=40)
+    return narrative["text"].encode("utf-8")
+
+
+def _critical_path() -> bytes:
+    return dumps_canonical(compute_critical_path(_load("causal_graph_expected.json")))
+
+
+def _critical_path_narrative() -> bytes:
+    narrative = render_critical_path_narrative_v2(
+        _load("critical_path_expected.json"), mode="brief", max_lines=40
+    )
+    return narrative["text"].encode("utf-8")
+
+
+def _repair_hints() -> bytes:
+    fixture = _load("repair_hints_world_example.json")
+    hints = compute_repair_hints(
+        fixture["constraint_report"],
+        fixture["causal_graph"],
+        fixture["world_model"],
+    )
+    return dumps_canonical(hints)
+
+
+def _repair_hints_narrative() -> bytes:
+    fixture = _load("repair_hints_world_example.json")
+    hints = compute_repair_hints(
+        fixture["constraint_report"],
+        fixture["causal_graph"],
+        fixture["world_model"],
+    )
+    narrative = render_repair_hints_narrative_v2(
+        hints, max_lines=40, verbosity="brief"
+    )
+    return narrative["text"].encode("utf-8")
+
+
+def _graph_findings() -> bytes:
+    findings = find_duplicates_and_contradictions(_load("claim_graph_example.json"))
+    return dumps_canonical(findings)
+
+
+def _expected_json(name: str) -> bytes:
+    return dumps_canonical(_load(name))
+
+
+def _expected_text(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+GOLDEN = {
+    "causal_graph": (
+        _causal_graph,
+        lambda: _expected_json("causal_graph_expected.json"),
+    ),
+    "causal_narrative_v2": (
+        _causal_narrative,
+        lambda: _expected_text("causal_narrative_v2_expected.txt"),
+    ),
+    "constraint_report": (
+        _constraints,
+        lambda: _expected_json("constraint_expected.json"),
+    ),
+    "constraint_narrative_v2": (
+        _constraint_narrative,
+        lambda: _expected_text("constraint_narrative_expected.txt"),
+    ),
+    "critical_path": (
+        _critical_path,
+        lambda: _expected_json("critical_path_expected.json"),
+    ),
+    "critical_path_narrative_v2": (
+        _critical_path_narrative,
+        lambda: _expected_text("critical_path_narrative_expected.txt"),
+    ),
+    "repair_hints": (
+        _repair_hints,
+        lambda: _expected_json("repair_hints_expected.json"),
+    ),
+    "repair_hints_narrative_v2": (
+        _repair_hints_narrative,
+        lambda: _expected_text("repair_hints_narrative_expected.txt"),
+    ),
+    "graph_findings": (
+        _graph_findings,
+        lambda: _expected_json("graph_findings_expected.json"),
+    ),
+}
+
+
+@pytest.mark.parametrize("policy", VALIDATION_POLICIES)
+@pytest.mark.parametrize("name", sorted(GOLDEN))
+def test_reasoning_outputs_match_golden_fixtures_under_every_policy(name, policy):
+    build, expected = GOLDEN[name]
+
+    with validation_policy(policy):
+        actual = build()
+
+    assert actual == expected()
+
+
+@pytest.mark.parametrize("case", DEMO_CASES, ids=[item["id"] for item in DEMO_CASES])
+def test_sealed_demo_bytes_are_identical_across_policies(case):
+    sealed = {}
+    for policy in VALIDATION_POLICIES:
+        with validation_policy(policy):
+            result = run_demo(
+                folder=case["folder"],
+                query=case["query"],
+                prompt=case["prompt"],
+                max_chunks=case["max_chunks"],
+                created_utc=case["created_utc"],
+                core_version=case["core_version"],
+                ruleset_id=case["ruleset_id"],
+                world=True,
+                max_events=case["max_events"],
+            )
+        sealed[policy] = {
+            "run_dir": result["run_dir"],
+            "report": result["report"],
+            "files": {
+                key: Path(result[key]).read_bytes()
+                for key in [
+                    "pack_path",
+                    "bundle_path",
+                    "output_path",
+                    "attestation_path",
+                ]
+            },
+        }
+
+    assert sealed["boundary"] == sealed["per_item"]
+    assert sealed["off-for-trusted-internal"] == sealed["per_item"]
+
+
+def test_boundary_policy_skips_item_checks_but_keeps_io_checks():
+    with validation_policy("boundary"):
+        validate({}, "schemas/causal_edge.schema.json", scope="item")
+        validate({}, "schemas/causal_graph.schema.json", scope="internal")
+        with pytest.raises(ValueError):
+            validate({}, "schemas/evidence_pack.schema.json", scope="io")
+
+
+def test_off_for_trusted_internal_still_checks_seal_scope():
+    with validation_policy("off-for-trusted-internal"):
+        validate({}, "schemas/evidence_pack.schema.json", scope="io")
+        with pytest.raises(ValueError):
+            validate({}, "schemas/attestation_record.schema.json")
+
+
+@pytest.mark.parametrize("policy", VALIDATION_POLICIES)
+def test_verify_run_rejects_invalid_attestation_under_every_policy(tmp_path, policy):
+    sealed = finalize(
+        _load("evidence_bundle_example.json"),
+        {"decision": "allow", "reasons": ["matched"]},
+        manifest_sha256="1" * 64,
+        core_version="0.3.0",
+        ruleset_id="ruleset.core.v1",
+        created_utc="2026-03-01T12:05:00Z",
+    )
+    run_dir = write_run(ledger_root=str(tmp_path), **sealed)
+    attestation = json.loads((run_dir / "attestation.json").read_bytes())
+    del attestation["attestation_version"]
+    attestation["bogus"] = True
+    (run_dir / "attestation.json").write_bytes(dumps_canonical(attestation))
+
+    with validation_policy(policy), pytest.raises(ValueError):
+        verify_run(str(run_dir))
+
+
+def test_validation_policy_reads_environment(monkeypatch):
+    monkeypatch.setenv(VALIDATION_POLICY_ENV, "boundary")
+    assert current_validation_policy() == "boundary"
+
+    with validation_policy("per_item"):
+        assert current_validation_policy() == "per_item"
+
+    monkeypatch.setenv(VALIDATION_POLICY_ENV, "sometimes")
+    with pytest.raises(ValueError, match="unknown validation policy"):
+        current_validation_policy()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from core.determinism.finalize import finalize
+from core.determinism.hashing import sha256_bytes
+from core.determinism.ledger import write_run
+from core.determinism.replay import verify_run
+from core.determinism.verify_cache import CACHE_FILENAME, verify_run_cached
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _sealed_run(ledger_root: Path) -> Path:
+    bundle = json.loads(
+        (FIXTURES / "evidence_bundle_example.json").read_text(encoding="utf-8")
+    )
+    sealed = finalize(
+        bundle,
+        {"decision": "allow", "reasons": ["matched"]},
+        manifest_sha256=sha256_bytes(Path("MANIFEST.sha256").read_bytes()),
+        core_version="0.3.0",
+        ruleset_id="ruleset.core.v1",
+        created_utc="2026-03-01T12:05:00Z",
+    )
+    return write_run(ledger_root=str(ledger_root), **sealed)
+
+
+class _CountingVerifier:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, dir_path: str, *, strict_manifest: bool) -> dict:
+        self.calls += 1
+        return verify_run(dir_path, strict_manifest=strict_manifest)
+
+
+def test_second_verification_is_served_from_cache(tmp_path: Path):
+    run_dir = _sealed_run(tmp_path / "ledger")
+    verifier = _CountingVerifier()
+
+    first = verify_run_cached(str(run_dir), strict_manifest=True, verifier=verifier)
+    second = verify_run_cached(str(run_dir), strict_manifest=True, verifier=verifier)
+
+    assert first == second == verify_run(str(run_dir), strict_manifest=True)
+    assert verifier.calls == 1
+    assert (tmp_path / "ledger" / CACHE_FILENAME).is_file()
+
+
+def test_cache_is_keyed_by_strict_manifest_and_manifest_digest(tmp_path: Path):
+    run_dir = _sealed_run(tmp_path / "ledger")
+    manifest_copy = tmp_path / "MANIFEST.sha256"
+    shutil.copyfile("MANIFEST.sha256", manifest_copy)
+    verifier = _CountingVerifier()
+
+    for strict_manifest in (True, False, True, False):
+        verify_run_cached(
+            str(run_dir),
+            strict_manifest=strict_manifest,
+            manifest_path=str(manifest_copy),
+            verifier=verifier,
+        )
+    assert verifier.calls == 2
+
+    manifest_copy.write_bytes(manifest_copy.read_bytes() + b"\n")
+    verify_run_cached(
+        str(run_dir),
+        strict_manifest=True,
+        manifest_path=str(manifest_copy),
+        verifier=verifier,
+    )
+    assert verifier.calls == 3
+
+
+def test_force_rehash_and_ttl_bypass_cache(tmp_path: Path):
+    run_dir = _sealed_run(tmp_path / "ledger")
+    verifier = _CountingVerifier()
+
+    verify_run_cached(str(run_dir), verifier=verifier)
+    verify_run_cached(str(run_dir), force_rehash=True, verifier=verifier)
+    verify_run_cached(str(run_dir), ttl_seconds=0, verifier=verifier)
+
+    assert verifier.calls == 3
+
+
+def test_tampered_ledger_is_never_served_from_cache(tmp_path: Path):
+    run_dir = _sealed_run(tmp_path / "ledger")
+    cache_path = tmp_path / "shared.sqlite3"
+    verify_run_cached(str(run_dir), strict_manifest=True, cache_path=cache_path)
+
+    with (run_dir / "output.json").open("ab") as handle:
+        handle.write(b"\n")
+
+    with pytest.raises(ValueError, match="output_sha256 mismatch"):
+        verify_run_cached(str(run_dir), strict_manifest=True, cache_path=cache_path)